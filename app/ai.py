@@ -8,12 +8,14 @@ from transformers import (
     BertTokenizer,
     BertForSequenceClassification,
     AutoTokenizer,
+    AutoModel,
     AutoModelForSequenceClassification,
 )
 from openai import AsyncOpenAI
 import os
 import asyncio
-from typing import List
+import numpy as np
+from typing import AsyncIterator, List, Optional
 from app.core.config import get_settings
 from app.services.prompt_service import prompt_service
 
@@ -85,27 +87,60 @@ def detect_toxicity(text):
     return {"is_toxic": prediction, "confidence": probabilities[0][1].item()}
 
 
+sentence_model_dir = "/app/huggingface_models/sentence-embedding"
+
+st_tokenizer = AutoTokenizer.from_pretrained(sentence_model_dir)
+st_model = AutoModel.from_pretrained(sentence_model_dir)
+st_model.eval()
+
+
+def embed_sentences(texts: List[str], max_length: int = 128) -> np.ndarray:
+    """문장 임베딩 일괄 계산 (토큰 평균, 단위 벡터 float32, (문장 수, 차원))"""
+    inputs = st_tokenizer(
+        texts, return_tensors="pt", padding=True, truncation=True, max_length=max_length
+    )
+    with torch.no_grad():
+        outputs = st_model(**inputs)
+    mask = inputs["attention_mask"].unsqueeze(-1).to(outputs.last_hidden_state.dtype)
+    embeddings = (outputs.last_hidden_state * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+    embeddings = torch.nn.functional.normalize(embeddings, dim=1)
+    return embeddings.numpy().astype(np.float32)
+
+
+def embed_sentence(text: str) -> np.ndarray:
+    """문장 임베딩 (단위 벡터 float32)"""
+    return embed_sentences([text])[0]
+
+
 # OpenAI 클라이언트
 client = AsyncOpenAI(base_url=settings.openai_base_url)
 
 
-async def findbot(user_content: str):
-    """영화 찾기"""
+async def findbot_stream(user_content: str, context: Optional[str] = None) -> AsyncIterator[str]:
+    """영화 찾기 (응답 조각을 도착하는 대로 반환, context는 로컬 검색 후보)"""
     system_prompt = prompt_service.get_findbot_prompt()
 
-    res_text = ""
+    messages = [{"role": "system", "content": system_prompt}]
+    if context:
+        messages.append({"role": "system", "content": context})
+    messages.append({"role": "user", "content": user_content})
+
     stream = await client.chat.completions.create(
         model=settings.openai_model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_content},
-        ],
+        messages=messages,
         max_tokens=1024,
         stream=True,
     )
     async for chunk in stream:
-        if chunk.choices[0].delta.content is not None:
-            res_text += chunk.choices[0].delta.content
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+async def findbot(user_content: str):
+    """영화 찾기"""
+    res_text = ""
+    async for content in findbot_stream(user_content):
+        res_text += content
     return res_text
 
 
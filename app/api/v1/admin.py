@@ -1,8 +1,17 @@
-from fastapi import APIRouter, HTTPException, Depends, status, BackgroundTasks
+from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query, status, BackgroundTasks
+from sqlalchemy.orm import Session
 from app.services.scheduler_service import SchedulerService
 from app.services.user_service import UserService
 from app.services.movie_service import MovieService
 from app.services.comment_service import CommentService
+from app.services.findbot_cache import findbot_cache
+from app.services.experiment_service import RECOMMENDATION_WEIGHTS_EXPERIMENT, experiment_service
+from app.services.job_service import job_service
+from app.schemas.ai import FindBotCacheStats
+from app.schemas.recommendation import ExperimentStats
+from app.schemas.job import ScheduledJob
+from app.database import get_db
 from app.core.dependencies import get_current_user, get_optional_current_user
 from app.models import UserModel as User
 
@@ -84,17 +93,247 @@ async def test_full_ai_analysis(
         )
 
 
+@router.post(
+    "/counters/reconcile",
+    summary="카운터 정합성 점검",
+    description="팔로워/댓글/좋아요 등 저장된 카운터를 실제 집계와 비교해 즉시 보정합니다.",
+)
+async def reconcile_counters(
+    background_tasks: BackgroundTasks, current_user: User = Depends(get_optional_current_user)
+):
+    """카운터 정합성 점검"""
+    try:
+        scheduler_service = SchedulerService()
+
+        # 백그라운드 작업으로 실행
+        background_tasks.add_task(scheduler_service.reconcile_counters)
+
+        return {
+            "message": "카운터 정합성 점검이 백그라운드에서 시작되었습니다",
+            "status": "started",
+        }
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"카운터 정합성 점검 실행 실패: {str(e)}",
+        )
+
+
+@router.post(
+    "/genre-stats/rebuild",
+    summary="장르 집계 재구성",
+    description="장르별 영화 수, 평점 상위 영화, 평점 순위를 movie_genres에서 다시 구성합니다.",
+)
+async def rebuild_genre_stats(
+    background_tasks: BackgroundTasks, current_user: User = Depends(get_optional_current_user)
+):
+    """장르 집계 재구성"""
+    try:
+        scheduler_service = SchedulerService()
+
+        # 백그라운드 작업으로 실행
+        background_tasks.add_task(scheduler_service.rebuild_genre_stats)
+
+        return {"message": "장르 집계 재구성이 백그라운드에서 시작되었습니다", "status": "started"}
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"장르 집계 재구성 실행 실패: {str(e)}",
+        )
+
+
+@router.post(
+    "/movie-embeddings/rebuild",
+    summary="영화 임베딩 색인 재빌드",
+    description="비슷한 영화/추천에 쓰는 영화 임베딩 색인을 다시 빌드합니다. 내용이 바뀐 영화만 다시 계산합니다.",
+)
+async def rebuild_movie_embeddings(
+    background_tasks: BackgroundTasks, current_user: User = Depends(get_optional_current_user)
+):
+    """영화 임베딩 색인 재빌드"""
+    try:
+        scheduler_service = SchedulerService()
+
+        # 백그라운드 작업으로 실행
+        background_tasks.add_task(scheduler_service.rebuild_movie_embeddings)
+
+        return {
+            "message": "영화 임베딩 색인 재빌드가 백그라운드에서 시작되었습니다",
+            "status": "started",
+        }
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"영화 임베딩 색인 재빌드 실행 실패: {str(e)}",
+        )
+
+
+@router.post(
+    "/cf-model/train",
+    summary="협업 필터링 모델 학습",
+    description="좋아요, 왓치리스트, 평점으로 추천용 협업 필터링 모델을 다시 학습합니다.",
+)
+async def train_cf_model(
+    background_tasks: BackgroundTasks, current_user: User = Depends(get_optional_current_user)
+):
+    """협업 필터링 모델 학습"""
+    try:
+        scheduler_service = SchedulerService()
+
+        # 백그라운드 작업으로 실행
+        background_tasks.add_task(scheduler_service.train_cf_model)
+
+        return {
+            "message": "협업 필터링 모델 학습이 백그라운드에서 시작되었습니다",
+            "status": "started",
+        }
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"협업 필터링 모델 학습 실행 실패: {str(e)}",
+        )
+
+
+@router.post(
+    "/follow-suggestions/rebuild",
+    summary="팔로우 추천 재계산",
+    description="전체 사용자의 팔로우 추천을 즉시 다시 계산합니다.",
+)
+async def rebuild_follow_suggestions(
+    background_tasks: BackgroundTasks, current_user: User = Depends(get_optional_current_user)
+):
+    """팔로우 추천 재계산"""
+    try:
+        scheduler_service = SchedulerService()
+
+        # 백그라운드 작업으로 실행
+        background_tasks.add_task(scheduler_service.daily_follow_suggestions)
+
+        return {"message": "팔로우 추천 계산이 백그라운드에서 시작되었습니다", "status": "started"}
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"팔로우 추천 계산 실행 실패: {str(e)}",
+        )
+
+
+@router.get(
+    "/jobs",
+    response_model=List[ScheduledJob],
+    summary="정기 작업 목록",
+    description="정기 작업의 일정, 실행 상태, 실행 중인 워커, 마지막 실행 결과와 체크포인트를 조회합니다.",
+)
+async def list_jobs(current_user: User = Depends(get_optional_current_user)):
+    """정기 작업 목록"""
+    try:
+        return job_service.list_jobs(SchedulerService.JOBS)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"정기 작업 조회 실패: {str(e)}",
+        )
+
+
+@router.post(
+    "/jobs/{job_name}/run",
+    summary="정기 작업 즉시 실행",
+    description="정기 작업을 즉시 실행하도록 예약합니다. 스케줄러를 실행 중인 워커 중 한 곳에서만 실행됩니다.",
+)
+async def run_job(job_name: str, current_user: User = Depends(get_optional_current_user)):
+    """정기 작업 즉시 실행"""
+    try:
+        job_service.request_run(job_name)
+        return {"message": f"{job_name} 작업 실행이 예약되었습니다", "status": "queued"}
+
+    except Exception as e:
+        msg = str(e)
+        if "찾을 수 없습니다" in msg:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=f"정기 작업 실행 예약 실패: {msg}"
+        )
+
+
+@router.post(
+    "/jobs/{job_name}/cancel",
+    summary="정기 작업 취소",
+    description="실행 중인 정기 작업의 취소를 요청합니다. 실행 중인 워커가 다음 임대 연장 때 작업을 중단합니다.",
+)
+async def cancel_job(job_name: str, current_user: User = Depends(get_optional_current_user)):
+    """정기 작업 취소"""
+    try:
+        job_service.request_cancel(job_name)
+        return {"message": f"{job_name} 작업 취소가 요청되었습니다", "status": "cancelling"}
+
+    except Exception as e:
+        msg = str(e)
+        if "찾을 수 없습니다" in msg:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=f"정기 작업 취소 실패: {msg}"
+        )
+
+
+@router.get(
+    "/findbot-cache/stats",
+    response_model=FindBotCacheStats,
+    summary="findbot 캐시 통계",
+    description="findbot 의미 캐시의 적중률, 절약한 응답 시간과 추정 토큰 수를 조회합니다 (워커 프로세스 단위).",
+)
+async def get_findbot_cache_stats(current_user: User = Depends(get_optional_current_user)):
+    """findbot 캐시 통계"""
+    return findbot_cache.stats()
+
+
+@router.delete(
+    "/findbot-cache",
+    summary="findbot 캐시 초기화",
+    description="findbot 의미 캐시에 저장된 응답과 통계를 모두 삭제합니다.",
+)
+async def clear_findbot_cache(current_user: User = Depends(get_optional_current_user)):
+    """findbot 캐시 초기화"""
+    findbot_cache.clear()
+    return {"message": "findbot 캐시가 초기화되었습니다", "status": "cleared"}
+
+
+@router.get(
+    "/experiments/recommendation-weights",
+    response_model=ExperimentStats,
+    summary="추천 가중치 실험 집계",
+    description="최근 N일 추천 가중치 실험의 변형별 노출 수, 클릭 수, 클릭률을 조회합니다.",
+)
+async def get_recommendation_experiment_stats(
+    days: int = Query(default=7, ge=1, le=90, description="집계 기간(일)"),
+    current_user: User = Depends(get_optional_current_user),
+):
+    """추천 가중치 실험 집계"""
+    try:
+        return experiment_service.variant_stats(RECOMMENDATION_WEIGHTS_EXPERIMENT, days)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"추천 실험 집계 실패: {str(e)}",
+        )
+
+
 @router.get(
     "/test/users-with-comments",
     summary="테스트: 댓글 있는 사용자 조회",
     description="댓글이 5개 이상인 사용자 목록을 조회합니다.",
 )
 async def test_users_with_comments(
-    min_comments: int = 5, current_user: User = Depends(get_optional_current_user)
+    min_comments: int = 5,
+    current_user: User = Depends(get_optional_current_user),
+    db: Session = Depends(get_db),
 ):
     """댓글 있는 사용자 목록 조회"""
     try:
-        user_service = UserService()
+        user_service = UserService(db)
         users = await user_service.get_users_with_comments(min_comments=min_comments)
 
         return {"total_users": len(users), "users": users}
@@ -111,11 +350,13 @@ async def test_users_with_comments(
     description="댓글이 5개 이상인 영화 목록을 조회합니다.",
 )
 async def test_movies_with_comments(
-    min_comments: int = 5, current_user: User = Depends(get_optional_current_user)
+    min_comments: int = 5,
+    current_user: User = Depends(get_optional_current_user),
+    db: Session = Depends(get_db),
 ):
     """댓글 있는 영화 목록 조회"""
     try:
-        movie_service = MovieService()
+        movie_service = MovieService(db)
         movies = await movie_service.get_movies_with_comments(min_comments=min_comments)
 
         return {"total_movies": len(movies), "movies": movies}
@@ -131,10 +372,14 @@ async def test_movies_with_comments(
     summary="테스트: 특정 사용자 댓글 조회",
     description="특정 사용자의 댓글 텍스트를 조회합니다.",
 )
-async def test_user_comments(user_id: int, current_user: User = Depends(get_optional_current_user)):
+async def test_user_comments(
+    user_id: int,
+    current_user: User = Depends(get_optional_current_user),
+    db: Session = Depends(get_db),
+):
     """특정 사용자 댓글 조회"""
     try:
-        comment_service = CommentService()
+        comment_service = CommentService(db)
         comments = await comment_service.get_user_all_comments_text(user_id)
 
         return {"user_id": user_id, "total_comments": len(comments), "comments": comments}
@@ -151,11 +396,13 @@ async def test_user_comments(user_id: int, current_user: User = Depends(get_opti
     description="특정 영화의 댓글 텍스트를 조회합니다.",
 )
 async def test_movie_comments(
-    movie_id: int, current_user: User = Depends(get_optional_current_user)
+    movie_id: int,
+    current_user: User = Depends(get_optional_current_user),
+    db: Session = Depends(get_db),
 ):
     """특정 영화 댓글 조회"""
     try:
-        comment_service = CommentService()
+        comment_service = CommentService(db)
         comments = await comment_service.get_movie_all_comments_text(movie_id)
 
         return {"movie_id": movie_id, "total_comments": len(comments), "comments": comments}
@@ -1,6 +1,7 @@
 # app/api/v1/auth.py
 
 from fastapi import APIRouter, HTTPException, Depends, Body
+from sqlalchemy.orm import Session
 from fastapi.responses import RedirectResponse
 from app.schemas.user import (
     User,
@@ -13,12 +14,13 @@ from app.schemas.user import (
 from app.services.user_service import UserService
 from app.core.auth import create_access_token
 from app.services.google_oauth_service import GoogleOAuthService
+from app.database import get_db
 
 router = APIRouter()
 
 
-def get_user_service() -> UserService:
-    return UserService()
+def get_user_service(db: Session = Depends(get_db)) -> UserService:
+    return UserService(db)
 
 
 # 이메일 회원가입
@@ -1,15 +1,17 @@
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends, Path, Query
+from sqlalchemy.orm import Session
 from app.schemas.comment import Comment, CommentCreate, CommentUpdate
 from app.schemas.user import User
 from app.services.comment_service import CommentService
+from app.database import get_db
 from app.core.dependencies import get_current_user, get_optional_current_user
 
 router = APIRouter()
 
 
-def get_comment_service() -> CommentService:
-    return CommentService()
+def get_comment_service(db: Session = Depends(get_db)) -> CommentService:
+    return CommentService(db)
 
 
 @router.get(
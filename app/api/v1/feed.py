@@ -2,18 +2,20 @@
 
 from typing import Optional, List
 from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy.orm import Session
 from app.schemas.feed import FeedResponse, FeedFilter
 from app.schemas.user import User
 from app.schemas.person import PersonFeedResponse
 from app.services.feed_service import FeedService
 from app.services.person_service import PersonService
+from app.database import get_db
 from app.core.dependencies import get_current_user
 
 router = APIRouter()
 
 
-def get_feed_service() -> FeedService:
-    return FeedService()
+def get_feed_service(db: Session = Depends(get_db)) -> FeedService:
+    return FeedService(db)
 
 
 @router.get(
@@ -92,8 +94,8 @@ async def get_movie_feed(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def get_person_service() -> PersonService:
-    return PersonService()
+def get_person_service(db: Session = Depends(get_db)) -> PersonService:
+    return PersonService(db)
 
 
 @router.get(
@@ -1,7 +1,8 @@
 # app/api/v1/genres.py
 
-from typing import List
+from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends, Path, Query
+from sqlalchemy.orm import Session
 from app.schemas.genre import (
     Genre,
     GenreListResponse,
@@ -11,12 +12,13 @@ from app.schemas.genre import (
 )
 from app.services.genre_service import GenreService
 from app.services.tmdb_service import TMDBService
+from app.database import get_db
 
 router = APIRouter()
 
 
-def get_genre_service() -> GenreService:
-    return GenreService()
+def get_genre_service(db: Session = Depends(get_db)) -> GenreService:
+    return GenreService(db)
 
 
 def get_tmdb_service() -> TMDBService:
@@ -108,17 +110,20 @@ async def get_genre_by_id(
     "/{genre_id}/movies",
     response_model=GenreMovieListResponse,
     summary="장르별 영화 목록",
-    description="특정 장르에 속한 영화 목록을 조회합니다.",
+    description="특정 장르에 속한 영화 목록을 평점순으로 조회합니다. 응답의 next_cursor를 cursor로 넘기면 다음 페이지를 조회합니다.",
 )
 async def get_movies_by_genre(
     genre_id: int = Path(description="장르 ID"),
-    skip: int = Query(default=0, ge=0, description="건너뛸 영화 수"),
+    skip: int = Query(default=0, ge=0, description="건너뛸 영화 수 (cursor가 없을 때만 사용)"),
     limit: int = Query(default=20, ge=1, le=100, description="가져올 영화 수"),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_cursor"),
     genre_service: GenreService = Depends(get_genre_service),
 ):
     try:
-        movies = await genre_service.get_movies_by_genre(genre_id, skip, limit)
+        movies = await genre_service.get_movies_by_genre(genre_id, skip, limit, cursor)
         return movies
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1,26 +1,37 @@
 # app/api/v1/movies.py
 
+import asyncio
 from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, HTTPException, Query, Path, Depends, status
+from sqlalchemy.orm import Session
 from app.schemas import Movie
 from app.services.tmdb_service import TMDBService
 from app.services.movie_service import MovieService
-from app.schemas.movie import Movie, MovieLike, Watchlist
+from app.schemas.movie import (
+    Movie,
+    MovieLike,
+    Watchlist,
+    MovieBatchRequest,
+    MovieBatchResponse,
+    SimilarMovie,
+)
 from app.core.dependencies import get_current_user, get_optional_current_user
 from app.models import UserModel as User
 from app.services.comment_service import CommentService
+from app.services.movie_embedding_service import movie_embedding_service
+from app.database import get_db
 from app.schemas.comment import Comment, CommentCreate
 
 router = APIRouter()
 tmdb_service = TMDBService()
 
 
-def get_movie_service() -> MovieService:
-    return MovieService()
+def get_movie_service(db: Session = Depends(get_db)) -> MovieService:
+    return MovieService(db)
 
 
-def get_comment_service() -> CommentService:
-    return CommentService()
+def get_comment_service(db: Session = Depends(get_db)) -> CommentService:
+    return CommentService(db)
 
 
 @router.get(
@@ -46,6 +57,28 @@ async def get_popular_movies(
         )
 
 
+@router.post(
+    "/batch",
+    response_model=MovieBatchResponse,
+    summary="영화 상세 정보 일괄 조회",
+    description="여러 영화의 상세 정보를 한 번에 조회합니다. DB에 없는 영화는 TMDB에서 동시에 가져오며, ID별 상태(ok/not_found/error)와 함께 부분 결과를 반환합니다.",
+)
+async def get_movie_details_batch(
+    request: MovieBatchRequest,
+    current_user: Optional[User] = Depends(get_optional_current_user),
+    movie_service: MovieService = Depends(get_movie_service),
+):
+    try:
+        user_id = current_user.user_id if current_user else None
+        results = await movie_service.get_movie_details_batch(request.movie_ids, user_id)
+        return MovieBatchResponse(results=results)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"영화 정보를 일괄 조회하는데 실패했습니다: {str(e)}",
+        )
+
+
 @router.get(
     "/{movie_id}",
     response_model=Dict[str, Any],
@@ -114,6 +147,38 @@ async def get_movie_cast(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get(
+    "/{movie_id}/similar",
+    response_model=List[SimilarMovie],
+    summary="비슷한 영화",
+    description="줄거리, 장르, 주요 출연진/감독, AI 리뷰 요약의 임베딩이 비슷한 영화를 유사도 순으로 조회합니다.",
+)
+async def get_similar_movies(
+    movie_id: int = Path(description="영화 ID"),
+    limit: int = Query(default=10, ge=1, le=50, description="조회할 영화 수"),
+    db: Session = Depends(get_db),
+):
+    try:
+        # 전체 벡터 행렬곱이므로 이벤트 루프 밖에서 실행
+        similar_movies = await asyncio.to_thread(
+            movie_embedding_service.get_similar_movies_with_db, movie_id, limit, db
+        )
+        if similar_movies is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"유사 영화 색인에 없는 영화입니다 (ID: {movie_id})",
+            )
+        return similar_movies
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"비슷한 영화를 불러오는데 실패했습니다: {str(e)}",
+        )
+
+
 @router.post(
     "/{movie_id}/like",
     response_model=MovieLike,
@@ -18,8 +18,8 @@ from sqlalchemy.orm import Session
 router = APIRouter()
 
 
-def get_person_service() -> PersonService:
-    return PersonService()
+def get_person_service(db: Session = Depends(get_db)) -> PersonService:
+    return PersonService(db)
 
 
 @router.get(
@@ -120,7 +120,7 @@ async def search_persons(
 )
 async def get_all_persons(db: Session = Depends(get_db)):
     """DB 전체 인물 조회"""
-    person_service = PersonService()
+    person_service = PersonService(db)
 
     try:
         persons = await person_service.get_all_persons()
@@ -1,15 +1,18 @@
 # app/api/v1/recommendations.py
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+from sqlalchemy.orm import Session
+from app.services.experiment_service import RECOMMENDATION_WEIGHTS_EXPERIMENT, experiment_service
 from app.services.recommendation_service import RecommendationService
+from app.database import get_db
 from app.core.dependencies import get_current_user
 from app.models import UserModel as User
 
 router = APIRouter()
 
 
-def get_recommendation_service() -> RecommendationService:
-    return RecommendationService()
+def get_recommendation_service(db: Session = Depends(get_db)) -> RecommendationService:
+    return RecommendationService(db)
 
 
 @router.get(
@@ -27,9 +30,32 @@ async def get_movie_recommendations(
             user_id=current_user.user_id
         )
 
-        return {"user_id": current_user.user_id, "recommendations": recommendations}
+        _, variant = RECOMMENDATION_WEIGHTS_EXPERIMENT.assign(current_user.user_id)
+
+        return {
+            "user_id": current_user.user_id,
+            "variant": variant.name,
+            "recommendations": recommendations,
+        }
 
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"영화 추천 실패: {str(e)}"
         )
+
+
+@router.post(
+    "/movies/{movie_id}/click",
+    summary="추천 영화 클릭 기록",
+    description="추천 목록에서 영화를 눌렀을 때 호출합니다. 추천 실험 변형별 클릭률 집계에 쓰입니다.",
+)
+async def log_recommendation_click(
+    movie_id: int,
+    position: int = Query(default=0, ge=0, le=255, description="추천 목록 위치 (1부터, 모르면 0)"),
+    current_user: User = Depends(get_current_user),
+):
+    """추천 영화 클릭 기록"""
+    experiment_service.log_click(
+        RECOMMENDATION_WEIGHTS_EXPERIMENT, current_user.user_id, movie_id, position
+    )
+    return {"message": "클릭이 기록되었습니다", "status": "logged"}
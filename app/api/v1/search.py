@@ -1,14 +1,18 @@
 # app/api/v1/search.py
 
 import re
-from fastapi import APIRouter, HTTPException, Query
-from app.schemas import SearchResponse
-from app.services.tmdb_service import TMDBService
-from app.services.user_service import UserService
+from fastapi import APIRouter, HTTPException, Query, Depends
+from sqlalchemy.orm import Session
+from app.schemas import SearchResponse, SuggestItem, SuggestResponse
+from app.services.search_service import SearchService
+from app.services.suggest_service import suggest_service
+from app.database import get_db
 
 router = APIRouter()
-tmdb_service = TMDBService()
-user_service = UserService()
+
+
+def get_search_service(db: Session = Depends(get_db)) -> SearchService:
+    return SearchService(db)
 
 
 def filter_korean_incomplete_chars(text: str) -> str:
@@ -31,7 +35,10 @@ def is_valid_search_query(query: str) -> bool:
 
 
 @router.get(
-    "", response_model=SearchResponse, summary="검색", description="영화와 인물을 검색합니다."
+    "",
+    response_model=SearchResponse,
+    summary="검색",
+    description="영화, 인물, 사용자를 검색합니다. DB에 저장된 결과를 우선하고 부족하면 TMDB 결과로 보완합니다.",
 )
 async def search_all(
     query: str = Query(description="검색할 키워드", min_length=1),
@@ -40,6 +47,7 @@ async def search_all(
         description="언어 코드 (ko-KR: 한국어, en-US: 영어)",
         regex="^[a-z]{2}-[A-Z]{2}$",
     ),
+    search_service: SearchService = Depends(get_search_service),
 ):
     """검색"""
     try:
@@ -54,10 +62,37 @@ async def search_all(
                 detail="검색할 수 있는 완성된 문자가 없습니다. 완성된 한글이나 영문을 입력해주세요.",
             )
 
-        search_results = await tmdb_service.multi_search(query=filtered_query, language=language)
-        # 사용자 이름(예: 부분 일치 검색)도 함께 검색
-        user_results = await user_service.search_users_by_name(name=filtered_query)
-        search_results += user_results
+        # DB 우선 검색, 부족한 유형만 TMDB 보완 (사용자 이름 포함)
+        search_results = await search_service.search(query=filtered_query, language=language)
         return SearchResponse(results=search_results)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"검색에 실패했습니다: {str(e)}")
+
+
+@router.get(
+    "/suggest",
+    response_model=SuggestResponse,
+    summary="검색어 자동완성",
+    description="입력 중인 검색어로 시작하는 영화 제목/원제와 인물 이름을 추천합니다. 미완성 한글과 초성(예: ㄷㅋㄴㅇㅌ)도 지원하며 TMDB를 호출하지 않습니다.",
+)
+async def suggest(
+    query: str = Query(description="입력 중인 검색어", min_length=1),
+    limit: int = Query(default=10, ge=1, le=20, description="추천 항목 수"),
+):
+    """검색어 자동완성"""
+    try:
+        suggestions = suggest_service.suggest(query, limit)
+        return SuggestResponse(
+            query=query,
+            suggestions=[
+                SuggestItem(
+                    id=suggestion.entity_id,
+                    media_type=suggestion.media_type,
+                    text=suggestion.text,
+                    image_url=suggestion.image_url,
+                )
+                for suggestion in suggestions
+            ],
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"자동완성에 실패했습니다: {str(e)}")
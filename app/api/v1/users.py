@@ -1,17 +1,20 @@
 # app/api/v1/users.py
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Response
 from sqlalchemy.orm import Session
 from app.schemas.user import User, UserDetail
 from app.services.user_service import UserService
 from app.database import get_db
 from app.core.dependencies import get_current_user, get_optional_current_user
-from app.schemas.movie import WatchlistMovie
+from app.schemas.movie import WatchlistMovie, WatchlistMovieCompact
+from app.core.streaming import ndjson_response
+from app.services.export_service import ExportService
 from app.services.movie_service import MovieService
 from app.schemas.comment import CommentWithMovie
 from app.services.user_follow_service import UserFollowService
-from app.schemas.user_follow import UserFollow, FollowListResponse
+from app.schemas.user_follow import UserFollow, FollowListResponse, FollowSuggestionResponse
+from app.services.follow_suggestion_service import FollowSuggestionService
 from fastapi import Form, UploadFile, File
 from app.schemas.user import UserProfileUpdateResponse
 
@@ -31,7 +34,7 @@ async def get_user_detail(
     db: Session = Depends(get_db),
 ):
     """사용자 상세 정보 조회"""
-    user_service = UserService()
+    user_service = UserService(db)
 
     try:
         user_detail = await user_service.get_user_detail(user_id, current_user)
@@ -57,7 +60,7 @@ async def get_my_profile(
     current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ):
     """내 프로필 조회"""
-    user_service = UserService()
+    user_service = UserService(db)
 
     try:
         user_detail = await user_service.get_user_detail(current_user.user_id, current_user)
@@ -67,34 +70,78 @@ async def get_my_profile(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@router.get(
+    "/me/export",
+    summary="내 활동 내보내기",
+    description="내 댓글(비공개 포함), 좋아요, 왓치리스트, 팔로우/팔로워, 인물 팔로우 전체를 NDJSON(한 줄에 한 건)으로 스트리밍합니다. 각 줄의 type 필드로 종류를 구분합니다.",
+)
+async def export_my_activity(current_user: User = Depends(get_current_user)):
+    """내 활동 내보내기"""
+    export_service = ExportService()
+    filename = f"user-{current_user.user_id}-activity.ndjson"
+    return ndjson_response(
+        export_service.iter_user_activity(current_user.user_id), filename=filename
+    )
+
+
+@router.get(
+    "/me/follow-suggestions",
+    response_model=FollowSuggestionResponse,
+    summary="팔로우 추천",
+    description="친구의 친구와 좋아요/댓글 영화가 겹치는 사용자를 추천합니다. 이미 팔로우 중인 사용자는 제외됩니다.",
+)
+async def get_follow_suggestions(
+    limit: int = Query(default=20, ge=1, le=50, description="가져올 사용자 수"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """팔로우 추천 조회"""
+    suggestion_service = FollowSuggestionService(db)
+
+    try:
+        return await suggestion_service.get_follow_suggestions(current_user.user_id, limit)
+
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
 @router.get(
     "/{user_id}/watchlist",
-    response_model=List[WatchlistMovie],
+    response_model=List[Union[WatchlistMovie, WatchlistMovieCompact]],
     summary="사용자 왓치리스트 조회",
-    description="특정 사용자의 왓치리스트에 추가된 영화 목록을 조회합니다.",
+    description="특정 사용자의 왓치리스트에 추가된 영화 목록을 최신순으로 조회합니다. 다음 페이지가 있으면 X-Next-Cursor 헤더를 cursor로 넘깁니다. stream=true이면 전체 목록을 NDJSON으로 스트리밍합니다.",
 )
 async def get_user_watchlist(
+    response: Response,
     user_id: int = Path(description="조회할 사용자 ID"),
-    limit: int = Query(default=None, ge=1, description="가져올 영화 수"),
-    offset: int = Query(default=0, ge=0, description="건너뛸 영화 수"),
+    limit: int = Query(default=20, ge=1, le=100, description="가져올 영화 수"),
+    offset: int = Query(default=0, ge=0, description="건너뛸 영화 수 (cursor가 없을 때만 사용)"),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    compact: bool = Query(default=False, description="영화 ID, 포스터, 추가일만 반환"),
+    stream: bool = Query(default=False, description="전체 목록을 NDJSON으로 스트리밍"),
     current_user: Optional[User] = Depends(get_optional_current_user),
     db: Session = Depends(get_db),
 ):
     """사용자 왓치리스트 조회"""
-    movie_service = MovieService()
+    movie_service = MovieService(db)
 
     try:
         # 사용자 존재 확인
-        user_service = UserService()
+        user_service = UserService(db)
         target_user = await user_service.get_user_by_id(user_id)
         if not target_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다"
             )
 
-        actual_limit = limit if limit is not None else 10000
+        if stream:
+            return ndjson_response(movie_service.iter_user_watchlist(user_id, compact))
 
-        watchlist = await movie_service.get_user_watchlist(user_id, actual_limit, offset)
+        watchlist, next_cursor = await movie_service.get_user_watchlist(
+            user_id, limit, offset, cursor, compact
+        )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         return watchlist
 
     except HTTPException:
@@ -105,32 +152,41 @@ async def get_user_watchlist(
 
 @router.get(
     "/{user_id}/liked-movies",
-    response_model=List[WatchlistMovie],
+    response_model=List[Union[WatchlistMovie, WatchlistMovieCompact]],
     summary="사용자가 좋아요한 영화",
-    description="특정 사용자가 좋아요한 영화 목록을 조회합니다.",
+    description="특정 사용자가 좋아요한 영화 목록을 최신순으로 조회합니다. 다음 페이지가 있으면 X-Next-Cursor 헤더를 cursor로 넘깁니다. stream=true이면 전체 목록을 NDJSON으로 스트리밍합니다.",
 )
 async def get_user_liked_movies(
+    response: Response,
     user_id: int = Path(description="조회할 사용자 ID"),
-    limit: int = Query(default=None, ge=1, description="가져올 영화 수"),
-    offset: int = Query(default=0, ge=0, description="건너뛸 영화 수"),
+    limit: int = Query(default=20, ge=1, le=100, description="가져올 영화 수"),
+    offset: int = Query(default=0, ge=0, description="건너뛸 영화 수 (cursor가 없을 때만 사용)"),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    compact: bool = Query(default=False, description="영화 ID, 포스터, 추가일만 반환"),
+    stream: bool = Query(default=False, description="전체 목록을 NDJSON으로 스트리밍"),
     current_user: Optional[User] = Depends(get_optional_current_user),
     db: Session = Depends(get_db),
 ):
     """사용자가 좋아요한 영화 목록"""
-    movie_service = MovieService()
+    movie_service = MovieService(db)
 
     try:
         # 사용자 존재 확인
-        user_service = UserService()
+        user_service = UserService(db)
         target_user = await user_service.get_user_by_id(user_id)
         if not target_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다"
             )
 
-        actual_limit = limit if limit is not None else 10000
+        if stream:
+            return ndjson_response(movie_service.iter_user_liked_movies(user_id, compact))
 
-        liked_movies = await movie_service.get_user_liked_movies(user_id, actual_limit, offset)
+        liked_movies, next_cursor = await movie_service.get_user_liked_movies(
+            user_id, limit, offset, cursor, compact
+        )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         return liked_movies
 
     except HTTPException:
@@ -156,7 +212,7 @@ async def get_user_comments(
 
     try:
         # 사용자 존재 확인
-        user_service = UserService()
+        user_service = UserService(db)
         target_user = await user_service.get_user_by_id(user_id)
         if not target_user:
             raise HTTPException(
@@ -187,7 +243,7 @@ async def get_user_comments(
 )
 async def get_all_users(db: Session = Depends(get_db)):
     """DB 전체 사용자 조회"""
-    user_service = UserService()
+    user_service = UserService(db)
 
     try:
         users = await user_service.get_all_users()
@@ -209,7 +265,7 @@ async def follow_user(
     db: Session = Depends(get_db),
 ):
     """사용자 팔로우"""
-    follow_service = UserFollowService()
+    follow_service = UserFollowService(db)
 
     try:
         follow = await follow_service.follow_user(current_user.user_id, user_id)
@@ -230,7 +286,7 @@ async def unfollow_user(
     db: Session = Depends(get_db),
 ):
     """사용자 언팔로우"""
-    follow_service = UserFollowService()
+    follow_service = UserFollowService(db)
 
     try:
         success = await follow_service.unfollow_user(current_user.user_id, user_id)
@@ -254,8 +310,8 @@ async def get_user_followers(
     db: Session = Depends(get_db),
 ):
     """사용자 팔로워 목록 조회"""
-    follow_service = UserFollowService()
-    user_service = UserService()
+    follow_service = UserFollowService(db)
+    user_service = UserService(db)
 
     try:
         # 사용자 존재 확인
@@ -294,8 +350,8 @@ async def get_user_following(
     db: Session = Depends(get_db),
 ):
     """사용자 팔로잉 목록 조회"""
-    follow_service = UserFollowService()
-    user_service = UserService()
+    follow_service = UserFollowService(db)
+    user_service = UserService(db)
 
     try:
         # 사용자 존재 확인
@@ -331,7 +387,7 @@ async def check_follow_relationship(
     db: Session = Depends(get_db),
 ):
     """팔로우 관계 확인"""
-    follow_service = UserFollowService()
+    follow_service = UserFollowService(db)
 
     try:
         is_following = await follow_service.is_following(current_user.user_id, user_id)
@@ -354,7 +410,7 @@ async def get_user_following_persons(
     db: Session = Depends(get_db),
 ):
     """사용자가 팔로우하는 인물 목록 조회"""
-    user_service = UserService()
+    user_service = UserService(db)
 
     try:
         # 사용자 존재 확인
@@ -408,7 +464,7 @@ async def update_my_profile(
     db: Session = Depends(get_db),
 ):
     """내 프로필 수정"""
-    user_service = UserService()
+    user_service = UserService(db)
 
     try:
         # 비밀번호 변경 시 현재 비밀번호 확인
@@ -0,0 +1,148 @@
+# app/core/bm25.py
+
+import re
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+import numpy as np
+from app.core.hangul import normalize
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_HANGUL_PATTERN = re.compile(r"[가-힣]")
+
+
+def tokenize(text: str) -> List[str]:
+    """BM25 토큰 (한글 단어는 음절 bigram, 그 외 단어는 그대로)
+
+    형태소 분석기 없이 조사/어미가 붙은 한글 단어를 일치시키기 위해
+    한글이 포함된 단어는 음절 bigram으로 나눈다. 예: '가족이' -> '가족', '족이'
+    """
+    tokens = []
+    for word in _TOKEN_PATTERN.findall(normalize(text)):
+        if _HANGUL_PATTERN.search(word) and len(word) > 1:
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        elif len(word) > 1 or word.isdigit():
+            tokens.append(word)
+    return tokens
+
+
+class BM25Index:
+    """BM25 역색인 (CSR posting + numpy 점수 누적)
+
+    빌드 시 posting마다 BM25 가중치(idf 포함)를 미리 계산해 두므로
+    검색은 질의 토큰의 posting 구간을 점수 배열에 더하고 상위 k개를 고르는 것으로 끝난다.
+    문서 추가/삭제는 지원하지 않으며 주기적으로 다시 빌드한다.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._terms: Dict[str, int] = {}
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._docs = np.zeros(0, dtype=np.uint32)
+        self._weights = np.zeros(0, dtype=np.float32)
+        self._idf = np.zeros(0, dtype=np.float32)
+
+    @classmethod
+    def build(cls, documents: Iterable[Tuple[int, str]]) -> "BM25Index":
+        """(문서 ID, 본문) 목록으로 색인 생성"""
+        index = cls()
+        ids = array("q")
+        lengths = array("I")
+        term_ids = array("I")
+        doc_positions = array("I")
+        frequencies = array("H")
+
+        for doc_id, text in documents:
+            tokens = tokenize(text)
+            position = len(ids)
+            ids.append(doc_id)
+            lengths.append(len(tokens))
+            for term, frequency in Counter(tokens).items():
+                term_id = index._terms.setdefault(term, len(index._terms))
+                term_ids.append(term_id)
+                doc_positions.append(position)
+                frequencies.append(min(frequency, 0xFFFF))
+
+        index._ids = np.frombuffer(ids, dtype=np.int64).copy()
+        if not term_ids:
+            return index
+
+        term_ids = np.frombuffer(term_ids, dtype=np.uint32)
+        order = np.argsort(term_ids, kind="stable")
+        index._docs = np.frombuffer(doc_positions, dtype=np.uint32)[order]
+        tf = np.frombuffer(frequencies, dtype=np.uint16)[order].astype(np.float32)
+
+        document_frequency = np.bincount(term_ids, minlength=len(index._terms))
+        index._offsets = np.concatenate(([0], np.cumsum(document_frequency)))
+
+        doc_count = len(ids)
+        index._idf = np.log(
+            1 + (doc_count - document_frequency + 0.5) / (document_frequency + 0.5)
+        ).astype(np.float32)
+
+        doc_lengths = np.frombuffer(lengths, dtype=np.uint32).astype(np.float32)
+        norm = cls.K1 * (1 - cls.B + cls.B * doc_lengths / max(doc_lengths.mean(), 1.0))
+        term_idf = np.repeat(index._idf, document_frequency)
+        index._weights = term_idf * tf * (cls.K1 + 1) / (tf + norm[index._docs])
+        return index
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _query_terms(self, query: str) -> List[int]:
+        return [self._terms[term] for term in set(tokenize(query)) if term in self._terms]
+
+    def reference_score(self, query: str) -> float:
+        """질의 토큰이 평균 길이 문서에 한 번씩 모두 나타날 때의 점수
+
+        색인에 없는 토큰도 어느 문서에도 없는 토큰의 idf로 포함하므로, 대부분의 토큰을
+        모르는 질의는 기준 점수가 커져 흔한 토큰 하나의 일치로는 기준을 넘지 못한다.
+        """
+        unknown_idf = np.log(1 + (len(self._ids) + 0.5) / 0.5)
+        return float(
+            sum(
+                self._idf[self._terms[term]] if term in self._terms else unknown_idf
+                for term in set(tokenize(query))
+            )
+        )
+
+    def coverage(self, query: str, doc_id: int) -> float:
+        """질의 토큰(중복 제외) 중 문서에 나타나는 토큰 비율"""
+        query_terms = set(tokenize(query))
+        positions = np.flatnonzero(self._ids == doc_id)
+        if not query_terms or not len(positions):
+            return 0.0
+
+        position = positions[0]
+        matched = 0
+        for term in self._query_terms(query):
+            # 토큰별 posting은 문서 순서로 정렬되어 있음
+            docs = self._docs[self._offsets[term] : self._offsets[term + 1]]
+            found = np.searchsorted(docs, position)
+            matched += int(found < len(docs) and docs[found] == position)
+        return matched / len(query_terms)
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[int, float]]:
+        """BM25 점수 상위 (문서 ID, 점수) 목록"""
+        terms = self._query_terms(query)
+        if not terms or limit <= 0:
+            return []
+
+        scores = np.zeros(len(self._ids), dtype=np.float32)
+        for term in terms:
+            start, end = self._offsets[term], self._offsets[term + 1]
+            scores[self._docs[start:end]] += self._weights[start:end]
+
+        if len(scores) > limit:
+            top = np.argpartition(-scores, limit)[:limit]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            (int(self._ids[position]), float(scores[position]))
+            for position in top
+            if scores[position] > 0
+        ]
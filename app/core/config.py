@@ -33,6 +33,10 @@ class Settings(BaseSettings):
         default="https://gms.ssafy.io/gmsapi/api.openai.com/v1", description="OpenAI API Base URL"
     )
     openai_model: str = Field(default="gpt-4.1", description="사용할 OpenAI 모델")
+    findbot_local_answer: bool = Field(
+        default=False,
+        description="로컬 검색이 확실한 일치면 모델 호출 없이 결과 반환 (실제 단서로 기준 검증 후 활성화)",
+    )
 
     # TMDB API 설정
     tmdb_api_key: str = Field(description="TMDB API Key")
@@ -0,0 +1,76 @@
+# app/core/cron.py
+
+from datetime import date, datetime, time, timedelta
+from typing import List
+
+# 필드별 (최소, 최대): 분, 시, 일, 월, 요일 (요일은 0과 7이 일요일)
+FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+SEARCH_DAYS = 366 * 5  # 다음 실행 시각을 찾을 최대 기간 (2월 29일 같은 일정 포함)
+
+
+def _parse_field(field: str, minimum: int, maximum: int) -> List[int]:
+    """cron 필드 하나(*, a, a-b, */n, a-b/n, 쉼표 목록)를 값 목록으로 변환"""
+    values = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"cron 간격은 1 이상이어야 합니다: {field}")
+
+        if part == "*":
+            start, end = minimum, maximum
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(part)
+            end = maximum if step > 1 else start
+
+        if start < minimum or end > maximum or start > end:
+            raise ValueError(f"cron 값 범위를 벗어났습니다: {field}")
+        values.update(range(start, end + 1, step))
+    return sorted(values)
+
+
+class CronSchedule:
+    """5필드 cron 일정 (분 시 일 월 요일, 서버 로컬 시각 기준)
+
+    일과 요일이 모두 지정되면 표준 cron처럼 둘 중 하나만 맞아도 실행한다.
+    """
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 식은 5개 필드여야 합니다: {expression}")
+
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = [
+            _parse_field(field, minimum, maximum)
+            for field, (minimum, maximum) in zip(fields, FIELD_RANGES)
+        ]
+        self.weekdays = sorted({weekday % 7 for weekday in weekdays})
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def _day_matches(self, day: date) -> bool:
+        in_days = day.day in self.days
+        in_weekdays = (day.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return in_days and in_weekdays
+        return in_days or in_weekdays
+
+    def next_after(self, after: datetime) -> datetime:
+        """after 이후(같은 분 제외) 첫 실행 시각"""
+        start = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.date()
+        for _ in range(SEARCH_DAYS):
+            if day.month in self.months and self._day_matches(day):
+                for hour in self.hours:
+                    for minute in self.minutes:
+                        candidate = datetime.combine(day, time(hour, minute))
+                        if candidate >= start:
+                            return candidate
+            day += timedelta(days=1)
+        raise ValueError(f"실행 시각을 찾을 수 없는 cron 식입니다: {self.expression}")
@@ -3,15 +3,17 @@
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
 from app.schemas.user import User
 from app.services.user_service import UserService
+from app.database import get_db, set_request_user
 from app.core.auth import verify_token
 
 security = HTTPBearer(auto_error=False)
 
 
-def get_user_service() -> UserService:
-    return UserService()
+def get_user_service(db: Session = Depends(get_db)) -> UserService:
+    return UserService(db)
 
 
 async def get_current_user(
@@ -36,6 +38,7 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="사용자를 찾을 수 없습니다"
         )
 
+    set_request_user(user.user_id)
     return user
 
 
@@ -55,6 +58,8 @@ async def get_optional_current_user(
             return None
 
         user = await user_service.get_user_by_email(email)
+        if user:
+            set_request_user(user.user_id)
         return user
     except Exception:
         return None
@@ -0,0 +1,70 @@
+# app/core/event_log.py
+
+import os
+import struct
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterable, Tuple
+import numpy as np
+
+# 시각(초), 영화 ID, 사용자 ID, 실험 ID, 변형 번호, 이벤트 종류, 노출 위치 (24바이트 고정)
+RECORD = struct.Struct("<IiqHBBB3x")
+RECORD_DTYPE = np.dtype(
+    {
+        "names": ["timestamp", "movie_id", "user_id", "experiment", "variant", "event", "position"],
+        "formats": ["<u4", "<i4", "<i8", "<u2", "u1", "u1", "u1"],
+        "offsets": [0, 4, 8, 16, 18, 19, 20],
+        "itemsize": RECORD.size,
+    }
+)
+
+EVENT_IMPRESSION = 1
+EVENT_CLICK = 2
+
+
+class EventLog:
+    """추천 노출/클릭 이벤트 추가 전용 로그 (날짜별 고정 길이 바이너리 파일)
+
+    레코드 묶음은 O_APPEND로 연 파일에 write 한 번으로 기록하므로 여러 워커 프로세스가
+    같은 파일에 써도 레코드가 섞이지 않는다. 읽을 때는 numpy 구조체 배열로 한 번에 읽는다.
+    """
+
+    def __init__(self, directory: Path, prefix: str):
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self._day = None
+        self._fd = None
+        self._lock = threading.Lock()
+
+    def path(self, day: date) -> Path:
+        return self.directory / f"{self.prefix}-{day.strftime('%Y%m%d')}.bin"
+
+    def append(self, records: Iterable[Tuple[int, int, int, int, int, int]]):
+        """(영화 ID, 사용자 ID, 실험 ID, 변형 번호, 이벤트 종류, 노출 위치) 레코드 기록"""
+        now = time.time()
+        payload = b"".join(
+            RECORD.pack(int(now), *record[:5], min(record[5], 255)) for record in records
+        )
+        if not payload:
+            return
+
+        day = datetime.fromtimestamp(now).date()
+        with self._lock:
+            if self._day != day:
+                if self._fd is not None:
+                    os.close(self._fd)
+                self.directory.mkdir(parents=True, exist_ok=True)
+                self._fd = os.open(self.path(day), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                self._day = day
+            os.write(self._fd, payload)
+
+    def read(self, day: date) -> np.ndarray:
+        """하루치 레코드 (파일이 없으면 빈 배열, 기록 중 잘린 마지막 레코드는 제외)"""
+        path = self.path(day)
+        if not path.exists():
+            return np.zeros(0, dtype=RECORD_DTYPE)
+        data = path.read_bytes()
+        usable = len(data) - len(data) % RECORD.size
+        return np.frombuffer(data[:usable], dtype=RECORD_DTYPE)
@@ -0,0 +1,48 @@
+# app/core/experiments.py
+
+import hashlib
+import random
+from datetime import date
+from typing import Dict, List, NamedTuple, Tuple
+
+
+def stable_hash(*parts) -> int:
+    """프로세스/재시작과 무관한 64비트 해시 (Python hash()는 실행마다 달라짐)"""
+    key = ":".join(str(part) for part in parts).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big")
+
+
+class Variant(NamedTuple):
+    name: str
+    traffic: float  # 배정 비율 (실험 안에서 합이 1)
+    weight_ranges: Dict[str, Tuple[float, float]]  # 가중치 이름별 (최소, 최대)
+
+
+class Experiment:
+    """사용자 단위 A/B 실험
+
+    사용자는 (실험 이름, 사용자 ID) 해시로 변형(variant)에 고정 배정되고,
+    변형 안의 무작위 요소는 (실험, 사용자, 날짜)로 시드한 난수를 쓴다.
+    같은 사용자는 같은 날 항상 같은 결과를 받으므로 응답을 캐시하고 재현할 수 있다.
+    """
+
+    def __init__(self, experiment_id: int, name: str, variants: List[Variant]):
+        if abs(sum(variant.traffic for variant in variants) - 1.0) > 1e-6:
+            raise ValueError("변형 배정 비율의 합은 1이어야 합니다")
+        self.experiment_id = experiment_id
+        self.name = name
+        self.variants = variants
+
+    def assign(self, user_id: int) -> Tuple[int, Variant]:
+        """사용자의 (변형 번호, 변형)"""
+        bucket = stable_hash(self.name, user_id) / 2**64
+        cumulative = 0.0
+        for index, variant in enumerate(self.variants):
+            cumulative += variant.traffic
+            if bucket < cumulative:
+                return index, variant
+        return len(self.variants) - 1, self.variants[-1]
+
+    def rng(self, user_id: int, day: date) -> random.Random:
+        """사용자/날짜별 시드 난수 생성기"""
+        return random.Random(stable_hash(self.name, user_id, day.isoformat()))
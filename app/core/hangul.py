@@ -0,0 +1,60 @@
+# app/core/hangul.py
+
+import unicodedata
+
+# 한글 음절 범위 (가 ~ 힣)
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+# 호환용 자모 (초성 19, 중성 21, 종성 27 + 없음)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+CHOSEONG_SET = frozenset(CHOSEONG)
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화 (NFC, 소문자, 연속 공백 정리)"""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFC", text).lower()
+    return " ".join(text.split())
+
+
+def decompose(text: str) -> str:
+    """한글 음절을 자모 단위로 분해 (예: '봉준호' -> 'ㅂㅗㅇㅈㅜㄴㅎㅗ')
+
+    입력 중인 글자(받침이 아직 없는 음절 등)도 부분 문자열로 일치시키기 위해 사용
+    """
+    chars = []
+    for char in normalize(text):
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            chars.append(CHOSEONG[offset // 588])
+            chars.append(JUNGSEONG[(offset % 588) // 28])
+            jong = JONGSEONG[offset % 28]
+            if jong:
+                chars.append(jong)
+        else:
+            chars.append(char)
+    return "".join(chars)
+
+
+def choseong(text: str) -> str:
+    """초성만 추출 (예: '봉준호' -> 'ㅂㅈㅎ'), 한글 외 문자는 공백을 제외하고 유지"""
+    chars = []
+    for char in normalize(text):
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            chars.append(CHOSEONG[(code - HANGUL_BASE) // 588])
+        elif char != " ":
+            chars.append(char)
+    return "".join(chars)
+
+
+def is_choseong_query(text: str) -> bool:
+    """초성으로만 이루어진 검색어인지 확인 (예: 'ㅂㅈㅎ')"""
+    stripped = normalize(text).replace(" ", "")
+    return bool(stripped) and all(char in CHOSEONG_SET for char in stripped)
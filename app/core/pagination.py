@@ -0,0 +1,29 @@
+# app/core/pagination.py
+
+import base64
+import json
+from typing import Any, Callable, List, Optional
+from fastapi import HTTPException, status
+
+
+def encode_cursor(*values: Any) -> str:
+    """keyset 페이지네이션 위치(마지막 행의 정렬 키)를 불투명한 문자열로 인코딩"""
+    payload = json.dumps([str(value) if value is not None else None for value in values])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], *types: Callable[[str], Any]) -> Optional[List[Any]]:
+    """커서 디코딩 후 위치별 타입으로 변환 (없으면 None, 형식이 잘못되면 HTTPException 400)
+
+    서비스의 예외 처리(500으로 변환)에 섞이지 않도록 try 블록 밖에서 호출한다.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError(cursor)
+        return [convert(value) for convert, value in zip(types, values)]
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다")
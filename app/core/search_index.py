@@ -0,0 +1,237 @@
+# app/core/search_index.py
+
+import heapq
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Sequence, Tuple
+import numpy as np
+from app.core.hangul import choseong, decompose, is_choseong_query
+
+# 자모 단위 n-gram 길이
+NGRAM = 2
+
+# 한 문서의 여러 필드 키를 하나의 문자열로 저장할 때 사용하는 구분자
+FIELD_SEPARATOR = "\x00"
+
+
+def _ngrams(key: str) -> set:
+    return {key[i : i + NGRAM] for i in range(len(key) - NGRAM + 1)}
+
+
+class SortedKeys:
+    """접두어 검색용 정렬 키 목록 (키 문자열, 문서 위치)"""
+
+    def __init__(self, keys: List[str] = None, positions: array = None):
+        self.keys = keys if keys is not None else []
+        self.positions = positions if positions is not None else array("I")
+
+    @classmethod
+    def build(cls, entries: List[Tuple[str, int]]) -> "SortedKeys":
+        entries.sort()
+        return cls([key for key, _ in entries], array("I", (pos for _, pos in entries)))
+
+    def add(self, key: str, position: int):
+        index = bisect_left(self.keys, key)
+        self.keys.insert(index, key)
+        self.positions.insert(index, position)
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + "\U0010ffff", start)
+        return start, end
+
+
+class NgramIndex:
+    """한글 자모 n-gram 역색인
+
+    이름을 자모 단위로 분해해 n-gram posting을 만들고, 검색 결과를
+    완전 일치 > 접두어 일치 > 부분 일치 순으로 정렬한다 (같은 단계는 인기도 순).
+    초성으로만 이루어진 검색어(예: 'ㅂㅈㅎ')는 초성 키로 검색한다.
+
+    문서 위치는 빌드 시 인기도 내림차순으로 부여되므로 posting을 앞에서부터
+    읽으면 인기 있는 문서부터 확인하게 되어 부분 일치 단계에서 조기 종료할 수 있다.
+    """
+
+    # 부분 일치 후보를 확인하는 최소 구간 크기 (구간마다 두 배로 증가)
+    MIN_SCAN_CHUNK = 256
+
+    def __init__(self):
+        self._ids = array("q")
+        self._popularity = array("d")
+        self._alive = bytearray()
+        self._keys: List[str] = []
+        self._positions: Dict[int, int] = {}
+        self._postings: Dict[str, array] = {}
+        self._prefix = SortedKeys()
+        self._choseong_prefix = SortedKeys()
+        self._built_size = 0
+        self._changes = 0
+
+    @classmethod
+    def build(cls, rows: Iterable[Tuple[int, Sequence[str], float]]) -> "NgramIndex":
+        """(ID, 검색 필드 목록, 인기도) 목록으로 색인 생성"""
+        index = cls()
+        ordered = sorted(rows, key=lambda row: -(row[2] or 0))
+
+        prefix_entries = []
+        choseong_entries = []
+        for entity_id, fields, popularity in ordered:
+            position = index._append(entity_id, fields, popularity)
+            for key in index._field_keys(fields):
+                prefix_entries.append((key, position))
+            if fields and fields[0]:
+                choseong_entries.append((choseong(fields[0]), position))
+
+        index._prefix = SortedKeys.build(prefix_entries)
+        index._choseong_prefix = SortedKeys.build(choseong_entries)
+        index._built_size = len(index._ids)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @property
+    def fragmentation(self) -> float:
+        """빌드 이후 추가/변경된 문서 비율 (재빌드 판단용)"""
+        if not self._ids:
+            return 0.0
+        return self._changes / len(self._ids)
+
+    @staticmethod
+    def _field_keys(fields: Sequence[str]) -> Tuple[str, ...]:
+        keys = (decompose(field) for field in fields if field)
+        return tuple(dict.fromkeys(key for key in keys if key))
+
+    def _append(self, entity_id: int, fields: Sequence[str], popularity: float) -> int:
+        position = len(self._ids)
+        keys = self._field_keys(fields)
+
+        self._ids.append(entity_id)
+        self._popularity.append(float(popularity or 0))
+        self._alive.append(1)
+        self._keys.append(FIELD_SEPARATOR.join(keys))
+        self._positions[entity_id] = position
+
+        grams = set()
+        for key in keys:
+            grams |= _ngrams(key)
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                posting = self._postings[gram] = array("I")
+            posting.append(position)
+        return position
+
+    def upsert(self, entity_id: int, fields: Sequence[str], popularity: float):
+        """문서 추가 또는 갱신 (기존 문서는 비활성화 후 새 위치에 추가)"""
+        old_position = self._positions.get(entity_id)
+        if old_position is not None:
+            if self._keys[old_position] == FIELD_SEPARATOR.join(self._field_keys(fields)):
+                self._popularity[old_position] = float(popularity or 0)
+                return
+            self._alive[old_position] = 0
+
+        position = self._append(entity_id, fields, popularity)
+        for key in self._field_keys(fields):
+            self._prefix.add(key, position)
+        if fields and fields[0]:
+            self._choseong_prefix.add(choseong(fields[0]), position)
+        self._changes += 1
+
+    def remove(self, entity_id: int):
+        """문서 삭제"""
+        position = self._positions.pop(entity_id, None)
+        if position is not None:
+            self._alive[position] = 0
+            self._changes += 1
+
+    def search(self, query: str, offset: int = 0, limit: int = 20) -> List[int]:
+        """검색어와 일치하는 ID 목록 (순위순)"""
+        needed = offset + limit
+        if needed <= 0:
+            return []
+
+        if is_choseong_query(query):
+            key = query.replace(" ", "")
+            ranked = self._prefix_matches(self._choseong_prefix, key, needed)
+        else:
+            key = decompose(query)
+            if not key:
+                return []
+            ranked = self._prefix_matches(self._prefix, key, needed)
+            if len(ranked) < needed and len(key) >= NGRAM:
+                seen = set(ranked)
+                ranked.extend(self._substring_matches(key, needed - len(ranked), seen))
+
+        return [self._ids[position] for position in ranked[offset:needed]]
+
+    def _prefix_matches(self, sorted_keys: SortedKeys, key: str, needed: int) -> List[int]:
+        """완전 일치 > 접두어 일치, 각 단계는 인기도 순"""
+        start, end = sorted_keys.prefix_range(key)
+        if start == end:
+            return []
+
+        alive = self._alive
+        exact = []
+        prefix = set()
+        for index in range(start, end):
+            position = sorted_keys.positions[index]
+            if not alive[position]:
+                continue
+            if sorted_keys.keys[index] == key:
+                exact.append(position)
+            else:
+                prefix.add(position)
+
+        popularity = self._popularity
+        ranked = sorted(exact, key=lambda position: -popularity[position])
+        prefix.difference_update(ranked)
+        ranked.extend(
+            heapq.nsmallest(needed, prefix, key=lambda position: (-popularity[position], position))
+        )
+        return ranked[:needed]
+
+    def _substring_matches(self, key: str, needed: int, seen: set) -> List[int]:
+        """부분 일치 (n-gram posting 교집합 후 후보 검증)"""
+        postings = []
+        for gram in _ngrams(key):
+            posting = self._postings.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        shortest = np.frombuffer(postings[0], dtype=np.uint32)
+        others = [np.frombuffer(posting, dtype=np.uint32) for posting in postings[1:]]
+
+        def verified(chunk: np.ndarray) -> List[int]:
+            # posting은 위치 오름차순이므로 searchsorted로 교집합 후 원문 검증
+            for other in others:
+                if not len(chunk):
+                    return []
+                found = np.searchsorted(other, chunk)
+                found[found == len(other)] = 0
+                chunk = chunk[other[found] == chunk]
+            return [
+                position
+                for position in chunk.tolist()
+                if alive[position] and position not in seen and key in keys[position]
+            ]
+
+        alive = self._alive
+        keys = self._keys
+        built_end = int(np.searchsorted(shortest, self._built_size))
+
+        # 빌드 구간은 인기도 순이므로 앞에서부터 필요한 만큼만 확인
+        matches = []
+        start, chunk_size = 0, max(self.MIN_SCAN_CHUNK, needed * 4)
+        while start < built_end and len(matches) < needed:
+            end = min(start + chunk_size, built_end)
+            matches.extend(verified(shortest[start:end]))
+            start, chunk_size = end, chunk_size * 2
+
+        # 빌드 이후 추가된 문서는 인기도 순서가 아니므로 모두 확인
+        matches.extend(verified(shortest[built_end:]))
+
+        popularity = self._popularity
+        matches.sort(key=lambda position: (-popularity[position], position))
+        return matches[:needed]
@@ -0,0 +1,63 @@
+# app/core/streaming.py
+
+import json
+from typing import Any, AsyncIterable, Iterable, Iterator, Optional
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+def _json_default(value: Any) -> Any:
+    """datetime/date는 ISO 8601, 그 외(Decimal 등)는 문자열로 직렬화"""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _ndjson_lines(items: Iterable[Any], batch_size: int) -> Iterator[str]:
+    """항목을 한 줄에 하나씩 JSON으로 직렬화 (batch_size줄씩 묶어 전송)"""
+    buffer = []
+    for item in items:
+        if isinstance(item, BaseModel):
+            buffer.append(item.model_dump_json())
+        else:
+            buffer.append(json.dumps(item, ensure_ascii=False, default=_json_default))
+        if len(buffer) >= batch_size:
+            yield "\n".join(buffer) + "\n"
+            buffer = []
+    if buffer:
+        yield "\n".join(buffer) + "\n"
+
+
+def ndjson_response(
+    items: Iterable[Any], batch_size: int = 100, filename: Optional[str] = None
+) -> StreamingResponse:
+    """NDJSON 스트리밍 응답 (filename을 주면 첨부 파일로 다운로드)
+
+    items는 응답을 보내는 동안 순회되므로, DB에서 읽는 경우 요청 세션이 아닌
+    자체 세션을 열고 닫는 제너레이터를 넘긴다 (동기 제너레이터는 스레드풀에서 순회).
+    """
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'} if filename else None
+    return StreamingResponse(
+        _ndjson_lines(items, batch_size), media_type=NDJSON_MEDIA_TYPE, headers=headers
+    )
+
+
+def sse_event(event: str, data: Any) -> str:
+    """SSE 이벤트 한 건 (data는 한 줄 JSON)"""
+    if isinstance(data, BaseModel):
+        payload = data.model_dump_json(exclude_none=True)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, default=_json_default)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def sse_response(events: AsyncIterable[str]) -> StreamingResponse:
+    """SSE 스트리밍 응답 (프록시 버퍼링 없이 이벤트마다 바로 전송)"""
+    return StreamingResponse(
+        events,
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
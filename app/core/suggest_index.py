@@ -0,0 +1,190 @@
+# app/core/suggest_index.py
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+from cachetools import LRUCache
+from app.core.hangul import choseong, decompose, is_choseong_query, normalize
+from app.core.search_index import SortedKeys
+
+# 단어 시작 위치 키를 만들 최대 단어 수 (긴 제목의 키 수 제한)
+MAX_WORDS = 6
+
+
+class Suggestion(NamedTuple):
+    media_type: str
+    entity_id: int
+    text: str
+    image_url: Optional[str]
+    score: float
+
+
+def _prefix_keys(fields: Sequence[str]) -> Iterator[Tuple[str, str, int]]:
+    """(키 종류, 키, 단어 시작 여부) 생성
+
+    각 필드의 전체 문자열과 두 번째 단어부터의 시작 위치를 자모 키와
+    초성 키(한글이 있는 경우)로 만든다. 예: '다크 나이트' -> '다크 나이트', '나이트'
+    """
+    for field in fields:
+        words = normalize(field).split(" ")
+        for start in range(min(len(words), MAX_WORDS)):
+            rest = " ".join(words[start:])
+            word_start = 1 if start else 0
+
+            jamo_key = decompose(rest)
+            if jamo_key:
+                yield "jamo", jamo_key, word_start
+
+            choseong_key = choseong(rest)
+            if choseong_key and choseong_key != rest.replace(" ", ""):
+                yield "choseong", choseong_key, word_start
+
+
+class SuggestIndex:
+    """자동완성용 접두어 색인 (정렬 배열 + bisect)
+
+    순위는 전체 접두어 일치 > 단어 접두어 일치 순이며, 같은 단계는 점수 순이다.
+    빌드 시 항목 번호를 점수 내림차순으로 부여하므로 후보가 많은 구간은 위치 값만으로
+    numpy에서 상위 후보를 고르고, 빌드 이후 추가된 항목만 점수로 다시 비교한다.
+    짧은 접두어(예: 'ㄱ', 'th')의 상위 결과는 LRU 캐시에 두고, 항목이 추가되면
+    해당 키의 접두어 캐시를 함께 갱신한다.
+    """
+
+    SCAN_LIMIT = 256  # 후보가 이 이하면 캐시 없이 바로 정렬
+    CACHED_TOP = 40  # 접두어별로 캐시할 순위 수 (중복 항목 제거 여유 포함)
+    CACHE_SIZE = 20000
+
+    def __init__(self):
+        self._entries: List[Suggestion] = []
+        self._alive = bytearray()
+        self._by_entity: Dict[Tuple[str, int], int] = {}
+        self._keys = {"jamo": SortedKeys(), "choseong": SortedKeys()}
+        self._top = {kind: LRUCache(maxsize=self.CACHE_SIZE) for kind in self._keys}
+        self._built_size = 0
+
+    @classmethod
+    def build(
+        cls, items: Iterable[Tuple[str, int, Sequence[str], Optional[str], float]]
+    ) -> "SuggestIndex":
+        """(유형, ID, 검색 필드 목록, 이미지 URL, 점수) 목록으로 색인 생성"""
+        index = cls()
+        key_entries = {kind: [] for kind in index._keys}
+        ordered = sorted(items, key=lambda item: -(item[4] or 0))
+        for media_type, entity_id, fields, image_url, score in ordered:
+            entry = index._append(media_type, entity_id, fields, image_url, score)
+            for kind, key, word_start in _prefix_keys(fields):
+                key_entries[kind].append((key, entry * 2 + word_start))
+
+        index._keys = {kind: SortedKeys.build(entries) for kind, entries in key_entries.items()}
+        index._built_size = len(index._entries)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._by_entity)
+
+    def _append(self, media_type, entity_id, fields, image_url, score) -> int:
+        entry = len(self._entries)
+        text = next((field for field in fields if field), "")
+        self._entries.append(Suggestion(media_type, entity_id, text, image_url, float(score or 0)))
+        self._alive.append(1)
+
+        old_entry = self._by_entity.get((media_type, entity_id))
+        if old_entry is not None:
+            self._alive[old_entry] = 0
+        self._by_entity[(media_type, entity_id)] = entry
+        return entry
+
+    def add(
+        self,
+        media_type: str,
+        entity_id: int,
+        fields: Sequence[str],
+        image_url: Optional[str],
+        score: float,
+    ):
+        """항목 추가 또는 교체 (정렬 배열에 삽입하고 접두어 캐시 갱신)"""
+        fields = [field for field in fields if field]
+        if not fields:
+            return
+
+        entry = self._append(media_type, entity_id, fields, image_url, score)
+        for kind, key, word_start in _prefix_keys(fields):
+            position = entry * 2 + word_start
+            self._keys[kind].add(key, position)
+
+            cache = self._top[kind]
+            for length in range(1, len(key) + 1):
+                cached = cache.get(key[:length])
+                if cached is not None:
+                    cached.append(position)
+                    cached.sort(key=self._rank_key)
+                    del cached[self.CACHED_TOP :]
+
+    def _rank_key(self, position: int) -> Tuple[int, float, int]:
+        entry = position >> 1
+        return position & 1, -self._entries[entry].score, entry
+
+    def _top_positions(self, positions: array, start: int, end: int, count: int) -> List[int]:
+        """구간에서 순위 상위 count개 위치"""
+        window = np.frombuffer(positions[start:end], dtype=np.uint32).astype(np.int64)
+        entries = window >> 1
+
+        # 빌드된 항목은 (단어 시작 여부, 항목 번호)가 곧 순위
+        ranks = ((window & 1) << 32) | entries
+        if len(ranks) > count:
+            window_top = window[np.argpartition(ranks, count)[:count]]
+        else:
+            window_top = window
+
+        # 빌드 이후 추가된 항목은 번호가 점수 순이 아니므로 모두 후보에 포함
+        added = window[entries >= self._built_size]
+        candidates = set(window_top.tolist()) | set(added.tolist())
+        return sorted(candidates, key=self._rank_key)[:count]
+
+    def suggest(self, query: str, limit: int = 10) -> List[Suggestion]:
+        """검색어로 시작하는 제목/이름 추천"""
+        if is_choseong_query(query):
+            kind, key = "choseong", normalize(query).replace(" ", "")
+        else:
+            kind, key = "jamo", decompose(query)
+        if not key:
+            return []
+
+        sorted_keys = self._keys[kind]
+        start, end = sorted_keys.prefix_range(key)
+        if start == end:
+            return []
+
+        if end - start <= self.SCAN_LIMIT:
+            ranked = sorted(sorted_keys.positions[start:end], key=self._rank_key)
+            return self._collect(ranked, limit)
+
+        cache = self._top[kind]
+        ranked = cache.get(key)
+        if ranked is None:
+            ranked = cache[key] = self._top_positions(
+                sorted_keys.positions, start, end, self.CACHED_TOP
+            )
+
+        suggestions = self._collect(ranked, limit)
+        if len(suggestions) < limit and len(ranked) >= self.CACHED_TOP:
+            # 교체된 항목이 캐시를 차지한 경우 다시 계산
+            ranked = cache[key] = self._top_positions(
+                sorted_keys.positions, start, end, self.CACHED_TOP * 2
+            )
+            suggestions = self._collect(ranked, limit)
+        return suggestions
+
+    def _collect(self, positions: List[int], limit: int) -> List[Suggestion]:
+        """살아있는 항목만 중복 없이 limit개 수집"""
+        suggestions = []
+        seen = set()
+        for position in positions:
+            entry = position >> 1
+            if not self._alive[entry] or entry in seen:
+                continue
+            seen.add(entry)
+            suggestions.append(self._entries[entry])
+            if len(suggestions) >= limit:
+                break
+        return suggestions
@@ -0,0 +1,168 @@
+# app/core/vector_index.py
+
+import json
+import os
+import shutil
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+VECTORS_FILE = "vectors.f32"
+IDS_FILE = "ids.npy"
+HASHES_FILE = "hashes.npy"
+CURRENT_FILE = "current.json"  # 현재 빌드 디렉터리와 메타 정보
+
+
+class VectorIndex:
+    """단위 벡터 top-K 색인 (ID 오름차순 float32 행렬, 메모리 매핑)
+
+    vectors.f32는 (count, dim) float32 행렬을 그대로 저장한 파일로 np.memmap으로 열어
+    워커 프로세스들이 같은 페이지 캐시를 공유한다. 벡터가 정규화되어 있으므로 내적이
+    코사인 유사도이며, 10만 건 규모에서는 전체 행렬곱 후 argpartition으로 상위 K개를 고른다.
+    """
+
+    def __init__(self, ids: np.ndarray, vectors: np.ndarray, hashes: np.ndarray, meta: dict):
+        self.ids = ids
+        self.vectors = vectors
+        self.hashes = hashes
+        self.meta = meta
+
+    @classmethod
+    def open(cls, directory: Path) -> Optional["VectorIndex"]:
+        """현재 빌드 열기 (없으면 None)"""
+        current_path = Path(directory) / CURRENT_FILE
+        if not current_path.exists():
+            return None
+
+        meta = json.loads(current_path.read_text(encoding="utf-8"))
+        build_dir = Path(directory) / meta["build"]
+        ids = np.load(build_dir / IDS_FILE)
+        hashes = np.load(build_dir / HASHES_FILE)
+        if len(ids) == 0:
+            vectors = np.zeros((0, meta["dim"]), dtype=np.float32)
+        else:
+            vectors = np.memmap(
+                build_dir / VECTORS_FILE,
+                dtype=np.float32,
+                mode="r",
+                shape=(len(ids), meta["dim"]),
+            )
+        return cls(ids, vectors, hashes, meta)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dim(self) -> int:
+        return self.vectors.shape[1]
+
+    def rows(self, ids: Iterable[int]) -> np.ndarray:
+        """ID별 행 번호 (색인에 없으면 -1)"""
+        ids = np.asarray(list(ids), dtype=np.int64)
+        if len(self.ids) == 0 or len(ids) == 0:
+            return np.full(len(ids), -1, dtype=np.int64)
+        positions = np.searchsorted(self.ids, ids)
+        positions = np.minimum(positions, len(self.ids) - 1)
+        return np.where(self.ids[positions] == ids, positions, -1)
+
+    def vector(self, entity_id: int) -> Optional[np.ndarray]:
+        row = self.rows([entity_id])[0]
+        return None if row < 0 else np.asarray(self.vectors[row])
+
+    def mean_vector(self, ids: Iterable[int]) -> Optional[np.ndarray]:
+        """여러 벡터의 평균 방향 (정규화, 색인에 하나도 없으면 None)"""
+        rows = self.rows(ids)
+        rows = rows[rows >= 0]
+        if len(rows) == 0:
+            return None
+        mean = np.asarray(self.vectors[np.sort(rows)]).mean(axis=0)
+        norm = np.linalg.norm(mean)
+        return mean / norm if norm > 0 else None
+
+    def top_k(
+        self, query: np.ndarray, k: int, exclude_ids: Iterable[int] = ()
+    ) -> List[Tuple[int, float]]:
+        """코사인 유사도 상위 (ID, 유사도) 목록"""
+        if len(self.ids) == 0 or k <= 0:
+            return []
+
+        scores = np.asarray(self.vectors @ query.astype(np.float32))
+        excluded = self.rows(exclude_ids)
+        scores[excluded[excluded >= 0]] = -np.inf
+
+        count = min(k, len(scores))
+        top = np.argpartition(-scores, count - 1)[:count]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(self.ids[row]), float(scores[row])) for row in top if scores[row] > -np.inf]
+
+    def scores(self, query: np.ndarray, ids: Iterable[int]) -> Dict[int, float]:
+        """지정한 ID들의 코사인 유사도 (색인에 없는 ID는 제외)"""
+        ids = list(ids)
+        rows = self.rows(ids)
+        found = rows >= 0
+        if not found.any():
+            return {}
+        order = np.argsort(rows[found])
+        selected = rows[found][order]
+        values = np.asarray(self.vectors[selected]) @ query.astype(np.float32)
+        found_ids = np.asarray(ids, dtype=np.int64)[found][order]
+        return dict(zip(found_ids.tolist(), values.tolist()))
+
+
+class VectorIndexWriter:
+    """새 빌드 디렉터리에 색인 순차 기록 (ID 오름차순으로 append)
+
+    벡터는 파일에 바로 기록하므로 빌드 중 메모리는 배치 크기만큼만 사용한다.
+    commit 시 current.json을 원자적으로 교체해 새 빌드를 가리키고 이전 빌드를 삭제한다.
+    이미 열린 memmap은 삭제된 이전 파일을 닫을 때까지 계속 읽을 수 있다.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        # 빌드 이름은 시작 시각 순으로 정렬되며 이전 빌드와 겹치지 않음
+        self.build = f"build-{time.time_ns()}-{os.getpid()}"
+        self.build_dir = self.directory / self.build
+        self.build_dir.mkdir(parents=True)
+        self._vectors_file = open(self.build_dir / VECTORS_FILE, "wb")
+        self._ids = array("q")
+        self._hashes = array("Q")
+        self.dim: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def append(self, ids: List[int], hashes: List[int], vectors: np.ndarray):
+        if not ids:
+            return
+        if self._ids and ids[0] <= self._ids[-1]:
+            raise ValueError("ID는 오름차순으로 추가해야 합니다")
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+        elif vectors.shape[1] != self.dim:
+            raise ValueError("벡터 차원이 일치하지 않습니다")
+
+        self._vectors_file.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+        self._ids.extend(ids)
+        self._hashes.extend(hashes)
+
+    def commit(self, **meta):
+        """새 빌드를 현재 색인으로 교체하고 이전 빌드 삭제"""
+        self._vectors_file.close()
+        np.save(self.build_dir / IDS_FILE, np.frombuffer(self._ids, dtype=np.int64))
+        np.save(self.build_dir / HASHES_FILE, np.frombuffer(self._hashes, dtype=np.uint64))
+
+        meta = dict(meta, build=self.build, count=len(self._ids), dim=self.dim or 0)
+        temp_path = self.directory / f"{CURRENT_FILE}.{self.build}"
+        temp_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        os.replace(temp_path, self.directory / CURRENT_FILE)
+
+        # 나중에 시작한 빌드(이름이 더 큼)는 진행 중일 수 있으므로 남겨 둠
+        for path in self.directory.glob("build-*"):
+            if path.is_dir() and path.name < self.build:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def abort(self):
+        self._vectors_file.close()
+        shutil.rmtree(self.build_dir, ignore_errors=True)
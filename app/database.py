@@ -1,9 +1,16 @@
 # app/database.py
 
 import os
-from sqlalchemy import create_engine
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from cachetools import TTLCache
+from fastapi import Request
+from sqlalchemy import DDL, create_engine, event, make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.dml import UpdateBase
 from dotenv import load_dotenv
 
 # .env 파일 로드
@@ -12,25 +19,238 @@ load_dotenv()
 # 환경 변수에서 DATABASE_URL 가져오기
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-# 엔진 생성
-engine = create_engine(
-    DATABASE_URL,
+# 읽기 전용 복제본 (미설정 시 주 DB로 모든 쿼리 처리)
+REPLICA_DATABASE_URL = os.getenv("REPLICA_DATABASE_URL")
+
+# 쓰기 직후 해당 사용자의 읽기를 주 DB로 고정하는 시간 (복제 지연 대비)
+REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", "10"))
+PRIMARY_STICKY_COOKIE = "mm_db_primary"
+
+# 커넥션 풀 설정
+# 요청당 세션(커넥션) 1개를 사용하므로 pool_size는 워커당 동시 요청 수에 맞춘다.
+# 워커 수 x (DB_POOL_SIZE + DB_MAX_OVERFLOW)가 DB max_connections를 넘지 않도록 조정
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "10"))
+
+ENGINE_OPTIONS = dict(
     echo=True,  # SQL 로그 출력
     pool_pre_ping=True,  # 연결 상태 확인
     pool_recycle=300,  # 5분마다 연결 재사용
 )
+POOL_OPTIONS = dict(
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+)
+
+
+def _create_engine(url: str):
+    """엔진 생성 (풀 크기 설정은 QueuePool을 쓰는 DB에만 적용, SQLite는 기본 풀 사용)"""
+    options = dict(ENGINE_OPTIONS)
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(POOL_OPTIONS)
+    return create_engine(url, **options)
+
+
+# 엔진 생성 (주 DB / 읽기 복제본)
+engine = _create_engine(DATABASE_URL)
+replica_engine = _create_engine(REPLICA_DATABASE_URL) if REPLICA_DATABASE_URL else engine
+
+# 요청 단위 라우팅 상태 (사용자 ID, 주 DB 고정 여부, 쓰기 커밋 여부)
+_routing_state: ContextVar[Optional[dict]] = ContextVar("routing_state", default=None)
+
+# 최근 쓰기를 커밋한 사용자 (워커 프로세스 단위, 다른 워커는 쿠키로 보완)
+_sticky_users = TTLCache(maxsize=100_000, ttl=max(REPLICA_STICKY_SECONDS, 1))
+_sticky_lock = threading.Lock()
+
+
+def _read_from_primary() -> bool:
+    """현재 요청의 읽기를 주 DB로 보내야 하는지 확인"""
+    state = _routing_state.get()
+    if state is None:
+        return False
+    if state["primary"]:
+        return True
+
+    user_id = state["user_id"]
+    if user_id is None:
+        return False
+    with _sticky_lock:
+        return user_id in _sticky_users
+
+
+class RoutingSession(Session):
+    """읽기/쓰기 라우팅 세션
+
+    flush와 INSERT/UPDATE/DELETE는 주 DB, 나머지 조회는 복제본으로 보낸다.
+    한 번 쓰기가 발생한 세션과 최근 쓰기를 커밋한 사용자의 요청은 주 DB에서 읽는다.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if replica_engine is engine:
+            return engine
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["primary"] = True
+            return engine
+        if self.info.get("primary") or _read_from_primary():
+            return engine
+        return replica_engine
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _mark_recent_write(session):
+    """쓰기가 커밋되면 현재 사용자를 일정 시간 주 DB로 고정"""
+    if not session.info.get("primary"):
+        return
+
+    state = _routing_state.get()
+    if state is None:
+        return
+
+    state["primary"] = True
+    state["wrote"] = True
+    if state["user_id"] is not None:
+        with _sticky_lock:
+            _sticky_users[state["user_id"]] = True
+
+
+@contextmanager
+def route_request(force_primary: bool = False):
+    """요청 단위 읽기/쓰기 라우팅 상태 설정"""
+    state = {"user_id": None, "primary": force_primary, "wrote": False}
+    token = _routing_state.set(state)
+    try:
+        yield state
+    finally:
+        _routing_state.reset(token)
+
+
+def set_request_user(user_id: int):
+    """현재 요청의 사용자 지정 (read-your-writes 판단용)"""
+    state = _routing_state.get()
+    if state is not None:
+        state["user_id"] = user_id
+
+
+class RequestSession(RoutingSession):
+    """요청 단위 세션
+
+    서비스 메서드의 finally 블록에서 호출하는 close()는 무시하고,
+    요청이 끝날 때 release()로 한 번만 커넥션을 반환한다.
+    서비스의 except 블록에서 호출하는 rollback()도 같은 요청의 다른 서비스가 만든 변경을
+    되돌리지 않도록 무시하고, 요청이 실패하면 get_db가 abort()로 한 번에 롤백한다.
+    단 flush 실패로 트랜잭션을 더 쓸 수 없으면 (이미 변경이 무효) 바로 롤백한다.
+    """
+
+    def close(self):
+        pass
+
+    def rollback(self):
+        transaction = self.get_transaction()
+        if transaction is not None and not transaction.is_active:
+            super().rollback()
+
+    def abort(self):
+        super().rollback()
+
+    def release(self):
+        super().close()
+
 
 # 세션 팩토리 생성
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
+RequestSessionLocal = sessionmaker(
+    class_=RequestSession, autocommit=False, autoflush=False, bind=engine
+)
 
 # Base 클래스 생성
 Base = declarative_base()
 
+# 트라이그램 인덱스용 확장 (PostgreSQL 전용)
+PG_TRGM_DDL = DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+event.listen(Base.metadata, "before_create", PG_TRGM_DDL)
+
+
+# 요청별 커넥션 풀 체크아웃 카운터
+_pool_checkouts: ContextVar[Optional[dict]] = ContextVar("pool_checkouts", default=None)
+
+
+def _count_pool_checkout(dbapi_connection, connection_record, connection_proxy):
+    counter = _pool_checkouts.get()
+    if counter is not None:
+        counter["checkouts"] += 1
+
+
+event.listen(engine, "checkout", _count_pool_checkout)
+if replica_engine is not engine:
+    event.listen(replica_engine, "checkout", _count_pool_checkout)
 
-# 의존성 주입용 함수
+
+@contextmanager
+def track_pool_checkouts():
+    """블록 안에서 발생한 커넥션 풀 체크아웃 횟수 집계"""
+    counter = {"checkouts": 0}
+    token = _pool_checkouts.set(counter)
+    try:
+        yield counter
+    finally:
+        _pool_checkouts.reset(token)
+
+
+async def route_db_requests(request: Request, call_next):
+    """요청별 DB 읽기/쓰기 라우팅 및 커넥션 체크아웃 계측 (HTTP 미들웨어)"""
+    force_primary = PRIMARY_STICKY_COOKIE in request.cookies
+    with track_pool_checkouts() as counter, route_request(force_primary) as routing:
+        response = await call_next(request)
+
+    # 쓰기 직후 다른 워커로 가는 요청도 주 DB에서 읽도록 쿠키로 고정
+    if routing["wrote"]:
+        response.set_cookie(
+            PRIMARY_STICKY_COOKIE, "1", max_age=REPLICA_STICKY_SECONDS, httponly=True
+        )
+
+    response.headers["X-DB-Checkouts"] = str(counter["checkouts"])
+    return response
+
+
+# 의존성 주입용 함수 (요청 단위 세션)
 def get_db():
-    db = SessionLocal()
+    db = RequestSessionLocal()
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.abort()
+        raise
     finally:
-        db.close()
+        db.release()
+
+
+def ensure_indexes(bind=None):
+    """모델에 선언된 인덱스 중 기존 테이블에 없는 인덱스 생성
+
+    create_all은 이미 존재하는 테이블의 인덱스를 추가하지 않으므로
+    기동 시 한 번 실행해 운영 DB에 인덱스를 반영한다.
+    """
+    bind = bind if bind is not None else engine
+    with bind.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.execute(PG_TRGM_DDL)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+
+def dialect_insert(bind, table):
+    """ON CONFLICT 절을 지원하는 방언별 INSERT 구문 (일괄 upsert용, 세션/커넥션/엔진)"""
+    if isinstance(bind, Session):
+        bind = bind.get_bind()
+    dialect = bind.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"일괄 upsert를 지원하지 않는 DB입니다: {dialect}")
+    return insert(table)
@@ -5,17 +5,26 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from app.core.config import get_settings
 from app.api.v1 import api_router
-from app.database import engine, Base
+from app.database import (
+    engine,
+    Base,
+    ensure_indexes,
+    route_db_requests,
+)
 import asyncio
 from contextlib import asynccontextmanager
 from app.services.scheduler_service import SchedulerService
+from app.services.suggest_service import suggest_service
+from app.services.movie_retrieval_service import movie_retrieval_service
+from app.services.genre_stats_service import GenreStatsService
 from fastapi.staticfiles import StaticFiles
 
 # 설정 로드
 settings = get_settings()
 
-# 데이터베이스 테이블 생성
+# 데이터베이스 테이블 및 인덱스 생성
 Base.metadata.create_all(bind=engine)
+ensure_indexes(engine)
 
 # 스케줄러 전역 변수
 scheduler_task = None
@@ -29,6 +38,13 @@ async def lifespan(app: FastAPI):
     scheduler_task = asyncio.create_task(scheduler_service.run_scheduler())
     print("스케줄러 시작됨")
 
+    # 자동완성 색인, findbot 후보 색인 미리 빌드 (첫 요청부터 응답하도록)
+    suggest_service.start_build()
+    movie_retrieval_service.start_build()
+
+    # 장르 집계 최초 적재 (비어 있을 때만)
+    asyncio.create_task(asyncio.to_thread(GenreStatsService().ensure_built))
+
     yield
 
     # 종료 시
@@ -84,8 +100,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+
+# 요청별 DB 읽기/쓰기 라우팅 및 커넥션 체크아웃 계측
+app.middleware("http")(route_db_requests)
+
+
 # API v1 라우터 등록
 app.include_router(api_router, prefix="/v1")
 
@@ -13,6 +13,13 @@ from .movie_cast import MovieCastModel
 from .person_follow import PersonFollowModel
 from .movie_like import MovieLikeModel
 from .watchlist import WatchlistModel
+from .person_credits import PersonCreditsModel
+from .entity_counter import EntityCounterModel
+from .follow_suggestion import FollowSuggestionModel
+from .genre_movie_rank import GenreMovieRankModel
+from .genre_stats import GenreStatsModel
+from .summary_state import SummaryStateModel
+from .scheduled_job import ScheduledJobModel
 
 
 __all__ = [
@@ -29,4 +36,11 @@ __all__ = [
     "PersonFollowModel",
     "MovieLikeModel",
     "WatchlistModel",
+    "PersonCreditsModel",
+    "EntityCounterModel",
+    "FollowSuggestionModel",
+    "GenreMovieRankModel",
+    "GenreStatsModel",
+    "SummaryStateModel",
+    "ScheduledJobModel",
 ]
@@ -10,6 +10,7 @@ from sqlalchemy import (
     DateTime,
     Date,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.sql import func
 from app.database import Base
@@ -38,6 +39,13 @@ class CommentModel(Base):
         DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp()
     )
 
+    # 영화별 공개 댓글 목록, 사용자별 댓글 목록, 트렌딩(최근 댓글) 조회용 인덱스
+    __table_args__ = (
+        Index("ix_comments_movie_public_created", "movie_id", "is_public", "created_at"),
+        Index("ix_comments_user_created", "user_id", "created_at"),
+        Index("ix_comments_created_at", "created_at"),
+    )
+
     def __repr__(self):
         return (
             f"<CommentModel(id={self.comment_id}, movie_id={self.movie_id}, rating={self.rating})>"
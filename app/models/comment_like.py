@@ -1,6 +1,6 @@
 # app/models/comment_like.py
 
-from sqlalchemy import Column, BigInteger, DateTime, ForeignKey
+from sqlalchemy import Column, BigInteger, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -12,5 +12,8 @@ class CommentLikeModel(Base):
     comment_id = Column(BigInteger, ForeignKey("comments.comment_id"), primary_key=True)
     created_at = Column(DateTime, default=func.current_timestamp())
 
+    # 댓글별 좋아요 수 조회용 인덱스
+    __table_args__ = (Index("ix_comment_likes_comment_id", "comment_id"),)
+
     def __repr__(self):
         return f"<CommentLikeModel(user_id={self.user_id}, comment_id={self.comment_id})>"
@@ -0,0 +1,26 @@
+# app/models/entity_counter.py
+
+from sqlalchemy import Column, String, BigInteger, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class EntityCounterModel(Base):
+    """엔티티별 집계 카운터 (팔로워 수, 댓글 수 등)
+
+    팔로우/좋아요/왓치리스트/댓글 변경과 같은 트랜잭션에서 증감하며,
+    정합성 점검 작업이 실제 COUNT와 비교해 보정한다.
+    """
+
+    __tablename__ = "entity_counters"
+
+    entity_type = Column(String(20), primary_key=True, comment="user / person")
+    entity_id = Column(BigInteger, primary_key=True)
+    name = Column(String(50), primary_key=True, comment="카운터 이름 (예: followers_count)")
+    value = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(
+        DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp()
+    )
+
+    def __repr__(self):
+        return f"<EntityCounterModel({self.entity_type}:{self.entity_id} {self.name}={self.value})>"
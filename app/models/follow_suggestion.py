@@ -0,0 +1,33 @@
+# app/models/follow_suggestion.py
+
+from sqlalchemy import Column, BigInteger, Integer, Float, String, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class FollowSuggestionModel(Base):
+    """사용자별 팔로우 추천 상위 K명 (일괄 작업에서 전체 교체)"""
+
+    __tablename__ = "follow_suggestions"
+
+    user_id = Column(BigInteger, ForeignKey("users.user_id"), primary_key=True)
+    suggested_user_id = Column(BigInteger, ForeignKey("users.user_id"), primary_key=True)
+    rank = Column(Integer, nullable=False, comment="추천 순위 (0부터)")
+    score = Column(Float, nullable=False)
+    mutual_follows = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="내가 팔로우하는 사람 중 추천 대상을 팔로우하는 수",
+    )
+    common_movies = Column(
+        Integer, nullable=False, default=0, comment="함께 좋아요/댓글을 남긴 영화 수"
+    )
+    reason = Column(String(20), nullable=False, comment="mutual_follows / taste")
+    created_at = Column(DateTime, default=func.current_timestamp())
+
+    def __repr__(self):
+        return (
+            f"<FollowSuggestionModel(user_id={self.user_id}, "
+            f"suggested_user_id={self.suggested_user_id}, rank={self.rank})>"
+        )
@@ -0,0 +1,29 @@
+# app/models/genre_movie_rank.py
+
+from sqlalchemy import Column, BigInteger, Integer, DECIMAL, ForeignKey, Index
+from app.database import Base
+
+
+class GenreMovieRankModel(Base):
+    """장르별 영화 평점 순위 (movie_genres + movies.average_rating 비정규화)
+
+    장르 영화 목록을 (장르, 평점, 영화 ID) 인덱스 범위로 읽어 keyset 페이지네이션한다.
+    영화-장르 연결이나 영화 평점이 바뀌면 같은 트랜잭션에서 갱신된다.
+    """
+
+    __tablename__ = "genre_movie_ranks"
+
+    genre_id = Column(Integer, ForeignKey("genres.genre_id"), primary_key=True)
+    movie_id = Column(BigInteger, ForeignKey("movies.movie_id"), primary_key=True)
+    average_rating = Column(DECIMAL(3, 2), nullable=False, default=0.00)
+
+    __table_args__ = (
+        Index("ix_genre_movie_ranks_genre_rating", "genre_id", "average_rating", "movie_id"),
+        Index("ix_genre_movie_ranks_movie_id", "movie_id"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<GenreMovieRankModel(genre_id={self.genre_id}, movie_id={self.movie_id}, "
+            f"average_rating={self.average_rating})>"
+        )
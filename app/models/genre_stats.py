@@ -0,0 +1,26 @@
+# app/models/genre_stats.py
+
+from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class GenreStatsModel(Base):
+    """장르별 집계 (영화 수, 평점 상위 영화)
+
+    영화 수는 영화-장르 연결 변경과 같은 트랜잭션에서 증감하고,
+    상위 영화 목록은 stale로 표시했다가 다음 조회 시 다시 구성한다.
+    """
+
+    __tablename__ = "genre_stats"
+
+    genre_id = Column(Integer, ForeignKey("genres.genre_id"), primary_key=True)
+    movie_count = Column(Integer, nullable=False, default=0)
+    top_movies = Column(JSON, nullable=False, default=list, comment="평점 상위 영화 요약")
+    is_stale = Column(Boolean, nullable=False, default=False, comment="상위 영화 재구성 필요")
+    updated_at = Column(
+        DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp()
+    )
+
+    def __repr__(self):
+        return f"<GenreStatsModel(genre_id={self.genre_id}, movie_count={self.movie_count})>"
@@ -1,6 +1,6 @@
 # app/models/movie.py
 
-from sqlalchemy import Column, Integer, String, Text, Date, DECIMAL, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Date, DECIMAL, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -26,5 +26,8 @@ class MovieModel(Base):
     concise_review = Column(Text, nullable=True, comment="AI 분석 리뷰 요약")
     concise_review_date = Column(DateTime, nullable=True, comment="리뷰 분석 일시")
 
+    # updated_at: 메모리 검색 색인 변경분 반영용
+    __table_args__ = (Index("ix_movies_updated_at", "updated_at"),)
+
     def __repr__(self):
         return f"<MovieModel(movie_id={self.movie_id}, title='{self.title}')>"
@@ -1,6 +1,6 @@
 # app/models/movie_cast.py
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -16,5 +16,8 @@ class MovieCastModel(Base):
     cast_order = Column(Integer, nullable=True)
     is_main_cast = Column(Boolean, default=False)
 
+    # 인물별 출연작 조회용 인덱스
+    __table_args__ = (Index("ix_movie_casts_person_id", "person_id"),)
+
     def __repr__(self):
         return f"<MovieCastModel(movie_id={self.movie_id}, person_id={self.person_id}, job='{self.job}')>"
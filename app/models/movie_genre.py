@@ -1,6 +1,6 @@
 # app/models/movie_genre.py
 
-from sqlalchemy import Column, BigInteger, Integer, ForeignKey
+from sqlalchemy import Column, BigInteger, Integer, ForeignKey, Index
 from app.database import Base
 
 
@@ -10,5 +10,8 @@ class MovieGenreModel(Base):
     movie_id = Column(BigInteger, ForeignKey("movies.movie_id"), primary_key=True)
     genre_id = Column(Integer, ForeignKey("genres.genre_id"), primary_key=True)
 
+    # 장르별 영화 목록 조회용 인덱스
+    __table_args__ = (Index("ix_movie_genres_genre_movie", "genre_id", "movie_id"),)
+
     def __repr__(self):
         return f"<MovieGenreModel(movie_id={self.movie_id}, genre_id={self.genre_id})>"
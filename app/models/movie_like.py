@@ -1,6 +1,14 @@
 # app/models/movie_like.py
 
-from sqlalchemy import Column, BigInteger, Integer, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Integer,
+    DateTime,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -12,7 +20,12 @@ class MovieLikeModel(Base):
     movie_id = Column(Integer, ForeignKey("movies.movie_id"), primary_key=True)
     created_at = Column(DateTime, default=func.current_timestamp())
 
-    __table_args__ = (UniqueConstraint("user_id", "movie_id", name="unique_movie_like"),)
+    # 영화별 좋아요 수 조회, 사용자별 최신순 keyset 페이지네이션용 인덱스
+    __table_args__ = (
+        UniqueConstraint("user_id", "movie_id", name="unique_movie_like"),
+        Index("ix_movie_likes_movie_id", "movie_id"),
+        Index("ix_movie_likes_user_created", "user_id", "created_at", "movie_id"),
+    )
 
     def __repr__(self):
         return f"<MovieLikeModel(user_id={self.user_id}, movie_id={self.movie_id})>"
@@ -1,6 +1,6 @@
 # app/models/person.py
 
-from sqlalchemy import Column, Integer, String, Text, Date, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Date, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -25,5 +25,23 @@ class PersonModel(Base):
         DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp()
     )
 
+    # 이름 부분 일치(ILIKE) 검색용 트라이그램 인덱스 (PostgreSQL pg_trgm)
+    # updated_at: 메모리 검색 색인 변경분 반영용
+    __table_args__ = (
+        Index("ix_persons_updated_at", "updated_at"),
+        Index(
+            "ix_persons_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_persons_original_name_trgm",
+            "original_name",
+            postgresql_using="gin",
+            postgresql_ops={"original_name": "gin_trgm_ops"},
+        ),
+    )
+
     def __repr__(self):
         return f"<PersonModel(id={self.person_id}, name='{self.name}')>"
@@ -0,0 +1,28 @@
+# app/models/person_credits.py
+
+from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class PersonCreditsModel(Base):
+    """인물별 출연/참여 작품 문서 (movie_casts + movies에서 미리 구성)"""
+
+    __tablename__ = "person_credits"
+
+    person_id = Column(Integer, ForeignKey("persons.person_id"), primary_key=True)
+    acting_credits = Column(JSON, nullable=False, default=list, comment="출연 작품 (개봉일 역순)")
+    crew_credits = Column(
+        JSON, nullable=False, default=list, comment="스태프 참여 작품 (개봉일 역순)"
+    )
+    total_movies = Column(Integer, nullable=False, default=0)
+    is_stale = Column(
+        Boolean, nullable=False, default=False, comment="출연진/영화 변경으로 재구성 필요"
+    )
+    synced_at = Column(DateTime, nullable=True, comment="TMDB 출연작 동기화 일시")
+    updated_at = Column(
+        DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp()
+    )
+
+    def __repr__(self):
+        return f"<PersonCreditsModel(person_id={self.person_id}, total_movies={self.total_movies})>"
@@ -1,6 +1,14 @@
 # app/models/person_follow.py
 
-from sqlalchemy import Column, BigInteger, Integer, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Integer,
+    DateTime,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -12,7 +20,11 @@ class PersonFollowModel(Base):
     person_id = Column(Integer, ForeignKey("persons.person_id"), primary_key=True)
     created_at = Column(DateTime, default=func.current_timestamp())
 
-    __table_args__ = (UniqueConstraint("user_id", "person_id", name="unique_person_follow"),)
+    # 인물 팔로워 수 조회용 인덱스
+    __table_args__ = (
+        UniqueConstraint("user_id", "person_id", name="unique_person_follow"),
+        Index("ix_person_follows_person_id", "person_id"),
+    )
 
     def __repr__(self):
         return f"<PersonFollowModel(user_id={self.user_id}, person_id={self.person_id})>"
@@ -0,0 +1,43 @@
+# app/models/scheduled_job.py
+
+from sqlalchemy import Column, String, Text, Boolean, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ScheduledJobModel(Base):
+    """정기 작업 상태 (일정, 실행 임대(lease), 재개용 체크포인트)
+
+    여러 워커 프로세스가 같은 행을 조건부 UPDATE로 선점하므로 작업은 한 곳에서만 실행된다.
+    실행 중인 워커는 임대를 주기적으로 연장하고, 임대가 만료된 작업은 다른 워커가
+    체크포인트부터 이어서 실행한다.
+    """
+
+    __tablename__ = "scheduled_jobs"
+
+    job_name = Column(String(50), primary_key=True)
+    schedule = Column(
+        String(100),
+        nullable=True,
+        comment="cron 식 (분 시 일 월 요일, 선행 작업에 이어 실행하면 NULL)",
+    )
+    status = Column(String(20), nullable=False, default="idle", comment="idle / running")
+    next_run_at = Column(
+        DateTime, nullable=True, comment="다음 실행 예정 일시 (선행 작업 대기 중이면 NULL)"
+    )
+    lease_owner = Column(String(100), nullable=True, comment="실행 중인 워커 식별자")
+    lease_expires_at = Column(DateTime, nullable=True, comment="실행 임대 만료 일시")
+    checkpoint = Column(Text, nullable=True, comment="재개용 체크포인트 (JSON)")
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    last_started_at = Column(DateTime, nullable=True)
+    last_finished_at = Column(DateTime, nullable=True)
+    last_status = Column(
+        String(20), nullable=True, comment="succeeded / failed / cancelled (마지막 실행 결과)"
+    )
+    last_error = Column(Text, nullable=True)
+    updated_at = Column(
+        DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp()
+    )
+
+    def __repr__(self):
+        return f"<ScheduledJobModel({self.job_name} status={self.status})>"
@@ -0,0 +1,31 @@
+# app/models/summary_state.py
+
+from sqlalchemy import Column, String, BigInteger, Integer, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class SummaryStateModel(Base):
+    """AI 요약(프로필 리뷰/영화 리뷰 요약)을 만들 때의 공개 댓글 상태
+
+    야간 요약 작업이 댓글 수, 마지막 작성/수정 시각, 요약 입력 해시를 비교해
+    댓글이 바뀐 엔티티만 다시 요약한다.
+    """
+
+    __tablename__ = "summary_states"
+
+    entity_type = Column(String(20), primary_key=True, comment="profile / movie")
+    entity_id = Column(BigInteger, primary_key=True)
+    comment_count = Column(Integer, nullable=False, comment="요약 시점 공개 댓글 수")
+    comment_watermark = Column(
+        DateTime, nullable=True, comment="요약 시점 공개 댓글의 마지막 작성/수정 일시"
+    )
+    input_hash = Column(String(32), nullable=True, comment="요약에 넣은 댓글 텍스트 해시")
+    updated_at = Column(
+        DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp()
+    )
+
+    def __repr__(self):
+        return (
+            f"<SummaryStateModel({self.entity_type}:{self.entity_id} count={self.comment_count})>"
+        )
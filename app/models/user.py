@@ -1,6 +1,6 @@
 # app/models/user.py
 
-from sqlalchemy import Column, BigInteger, String, Text, DateTime, Boolean
+from sqlalchemy import Column, BigInteger, String, Text, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -23,5 +23,17 @@ class UserModel(Base):
     profile_review = Column(Text, nullable=True, comment="AI 분석 프로필 리뷰")
     profile_review_date = Column(DateTime, nullable=True, comment="프로필 분석 일시")
 
+    # 이름 부분 일치(ILIKE) 검색용 트라이그램 인덱스 (PostgreSQL pg_trgm)
+    # updated_at: 메모리 검색 색인 변경분 반영용
+    __table_args__ = (
+        Index("ix_users_updated_at", "updated_at"),
+        Index(
+            "ix_users_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
     def __repr__(self):
         return f"<UserModel(id={self.user_id}, email='{self.email}')>"
@@ -1,6 +1,6 @@
 # app/models/user_follow.py
 
-from sqlalchemy import Column, BigInteger, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, BigInteger, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -16,8 +16,11 @@ class UserFollowModel(Base):
     )  # 팔로우 당하는 사람
     created_at = Column(DateTime, default=func.current_timestamp())
 
-    # 복합 기본키로 중복 팔로우 방지
-    __table_args__ = (UniqueConstraint("follower_id", "following_id", name="unique_follow"),)
+    # 복합 기본키로 중복 팔로우 방지, 팔로워 목록 조회용 인덱스
+    __table_args__ = (
+        UniqueConstraint("follower_id", "following_id", name="unique_follow"),
+        Index("ix_user_follows_following_id", "following_id"),
+    )
 
     def __repr__(self):
         return (
@@ -1,6 +1,6 @@
 # app/models/watchlist.py
 
-from sqlalchemy import Column, BigInteger, Integer, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, BigInteger, Integer, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -12,7 +12,11 @@ class WatchlistModel(Base):
     movie_id = Column(Integer, ForeignKey("movies.movie_id"), primary_key=True)
     created_at = Column(DateTime, default=func.current_timestamp())
 
-    __table_args__ = (UniqueConstraint("user_id", "movie_id", name="unique_watchlist"),)
+    # 사용자별 왓치리스트 최신순 keyset 페이지네이션용 인덱스
+    __table_args__ = (
+        UniqueConstraint("user_id", "movie_id", name="unique_watchlist"),
+        Index("ix_watchlists_user_created", "user_id", "created_at", "movie_id"),
+    )
 
     def __repr__(self):
         return f"<WatchlistModel(user_id={self.user_id}, movie_id={self.movie_id})>"
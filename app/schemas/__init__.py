@@ -20,7 +20,14 @@ from .person import (
 from .user_movie import UserMovie, WatchStatus
 from .comment import Comment, CommentCreate, CommentUpdate
 from .movie_cast import MovieCast, CastRole
-from .search import MovieSearchResult, PersonSearchResult, SearchResult, SearchResponse
+from .search import (
+    MovieSearchResult,
+    PersonSearchResult,
+    SearchResult,
+    SearchResponse,
+    SuggestItem,
+    SuggestResponse,
+)
 from .genre import Genre, GenreListResponse
 
 __all__ = [
@@ -41,6 +48,8 @@ __all__ = [
     "PersonSearchResult",
     "SearchResult",
     "SearchResponse",
+    "SuggestItem",
+    "SuggestResponse",
     "Genre",
     "GenreListResponse",
     "CommentCreate",
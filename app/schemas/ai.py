@@ -16,3 +16,13 @@ class FindBotResponse(BaseModel):
 
     class Config:
         exclude_none = True
+
+
+class FindBotCacheStats(BaseModel):
+    entries: int = Field(description="저장된 응답 수")
+    lookups: int = Field(description="조회 수")
+    exact_hits: int = Field(description="정규화한 질의 일치 수")
+    semantic_hits: int = Field(description="임베딩 유사도 일치 수")
+    hit_rate: float = Field(description="적중률")
+    saved_seconds: float = Field(description="절약한 응답 시간 합계(초)")
+    saved_tokens: int = Field(description="절약한 추정 토큰 수")
@@ -15,10 +15,20 @@ class Genre(BaseModel):
         from_attributes = True
 
 
+class GenreTopMovie(BaseModel):
+    movie_id: int = Field(description="영화 ID")
+    title: str = Field(description="영화 제목")
+    poster_url: Optional[str] = Field(default=None, description="포스터 URL")
+    average_rating: float = Field(description="평균 평점")
+
+
 class GenreWithMovieCount(BaseModel):
     genre_id: int = Field(description="장르 ID")
     name: str = Field(description="장르 이름")
     movie_count: int = Field(description="해당 장르의 영화 수")
+    top_movies: List[GenreTopMovie] = Field(
+        default_factory=list, description="평점 상위 영화 (최대 10편)"
+    )
 
     class Config:
         from_attributes = True
@@ -32,6 +42,9 @@ class GenreMovieListResponse(BaseModel):
     genre: Genre = Field(description="장르 정보")
     movies: List = Field(description="영화 목록")
     total: int = Field(description="총 영화 수")
+    next_cursor: Optional[str] = Field(
+        default=None, description="다음 페이지 커서 (마지막 페이지면 없음)"
+    )
 
 
 class GenreStatsResponse(BaseModel):
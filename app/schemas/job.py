@@ -0,0 +1,28 @@
+# app/schemas/job.py
+
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class ScheduledJob(BaseModel):
+    job_name: str = Field(description="작업 이름")
+    description: str = Field(description="작업 설명")
+    schedule: Optional[str] = Field(
+        default=None, description="cron 식 (분 시 일 월 요일, 서버 로컬 시각)"
+    )
+    after: Optional[str] = Field(default=None, description="끝나면 이어서 실행하는 선행 작업")
+    status: str = Field(description="작업 상태 (idle / running)")
+    next_run_at: Optional[datetime] = Field(
+        default=None, description="다음 실행 예정 일시 (선행 작업 대기 중이면 없음)"
+    )
+    last_started_at: Optional[datetime] = Field(default=None, description="마지막 시작 일시")
+    last_finished_at: Optional[datetime] = Field(default=None, description="마지막 종료 일시")
+    last_status: Optional[str] = Field(
+        default=None, description="마지막 실행 결과 (succeeded / failed / cancelled)"
+    )
+    last_error: Optional[str] = Field(default=None, description="마지막 실패 메시지")
+    lease_owner: Optional[str] = Field(default=None, description="실행 중인 워커 식별자")
+    lease_expires_at: Optional[datetime] = Field(default=None, description="실행 임대 만료 일시")
+    cancel_requested: bool = Field(description="취소 요청 여부")
+    checkpoint: Optional[dict] = Field(default=None, description="재개용 체크포인트 (완료된 단계)")
@@ -1,6 +1,6 @@
 # app/schemas/movie.py
 
-from typing import Optional
+from typing import Any, Dict, List, Literal, Optional
 from pydantic import BaseModel, Field
 from datetime import date, datetime
 from decimal import Decimal
@@ -27,6 +27,16 @@ class Movie(BaseModel):
         from_attributes = True
 
 
+class SimilarMovie(BaseModel):
+    """콘텐츠 임베딩 기준 비슷한 영화"""
+
+    movie_id: int = Field(description="영화 ID")
+    title: str = Field(description="영화 제목")
+    poster_url: Optional[str] = Field(default=None, description="포스터 URL")
+    release_date: Optional[date] = Field(default=None, description="개봉일")
+    similarity: float = Field(description="코사인 유사도")
+
+
 class MovieLike(BaseModel):
     user_id: int = Field(description="사용자 ID")
     movie_id: int = Field(description="영화 ID")
@@ -57,3 +67,34 @@ class WatchlistMovie(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class WatchlistMovieCompact(BaseModel):
+    """왓치리스트/좋아요 목록 간략 응답 (ID + 포스터)"""
+
+    movie_id: int = Field(description="영화 ID")
+    poster_url: Optional[str] = Field(default=None, description="포스터 URL")
+    added_at: datetime = Field(description="추가일")
+
+
+class MovieBatchRequest(BaseModel):
+    """영화 일괄 조회 요청"""
+
+    movie_ids: List[int] = Field(
+        min_length=1, max_length=50, description="조회할 TMDB 영화 ID 목록 (최대 50개)"
+    )
+
+
+class MovieBatchItem(BaseModel):
+    """영화 일괄 조회 결과 항목"""
+
+    movie_id: int = Field(description="TMDB 영화 ID")
+    status: Literal["ok", "not_found", "error"] = Field(description="조회 결과 상태")
+    movie: Optional[Dict[str, Any]] = Field(default=None, description="영화 상세 정보")
+    detail: Optional[str] = Field(default=None, description="오류 내용")
+
+
+class MovieBatchResponse(BaseModel):
+    """영화 일괄 조회 응답"""
+
+    results: List[MovieBatchItem] = Field(description="요청 순서대로 정렬된 ID별 결과")
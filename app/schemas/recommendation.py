@@ -0,0 +1,19 @@
+# app/schemas/recommendation.py
+
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class ExperimentVariantStats(BaseModel):
+    variant: str = Field(description="변형 이름")
+    traffic: float = Field(description="배정 비율")
+    users: int = Field(description="노출된 사용자 수")
+    impressions: int = Field(description="노출 수")
+    clicks: int = Field(description="클릭 수")
+    ctr: float = Field(description="클릭률")
+
+
+class ExperimentStats(BaseModel):
+    experiment: str = Field(description="실험 이름")
+    days: int = Field(description="집계 기간(일)")
+    variants: List[ExperimentVariantStats] = Field(description="변형별 집계")
@@ -46,3 +46,19 @@ class SearchResponse(BaseModel):
     """통합 검색 응답"""
 
     results: List[SearchResult] = Field(description="검색 결과")
+
+
+class SuggestItem(BaseModel):
+    """자동완성 항목"""
+
+    id: int = Field(description="TMDB 영화/인물 ID")
+    media_type: Literal["movie", "person"] = Field(description="항목 유형")
+    text: str = Field(description="영화 제목 또는 인물 이름")
+    image_url: Optional[str] = Field(default=None, description="포스터/프로필 이미지 URL")
+
+
+class SuggestResponse(BaseModel):
+    """자동완성 응답"""
+
+    query: str = Field(description="입력한 검색어")
+    suggestions: List[SuggestItem] = Field(description="추천 항목")
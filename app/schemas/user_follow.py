@@ -37,3 +37,18 @@ class FollowUser(BaseModel):
 class FollowListResponse(BaseModel):
     users: list[FollowUser] = Field(description="사용자 목록")
     total: int = Field(description="총 사용자 수")
+
+
+class FollowSuggestion(BaseModel):
+    user_id: int = Field(description="추천 사용자 ID")
+    name: str = Field(description="사용자 이름")
+    profile_image_url: Optional[str] = Field(default=None, description="프로필 이미지 URL")
+    score: float = Field(description="추천 점수")
+    mutual_follows: int = Field(description="내가 팔로우하는 사람 중 이 사용자를 팔로우하는 수")
+    common_movies: int = Field(description="함께 좋아요/댓글을 남긴 영화 수")
+    reason: str = Field(description="추천 사유 (mutual_follows: 친구의 친구, taste: 취향 유사)")
+
+
+class FollowSuggestionResponse(BaseModel):
+    users: list[FollowSuggestion] = Field(description="추천 사용자 목록")
+    total: int = Field(description="추천 사용자 수")
@@ -0,0 +1,149 @@
+# app/services/cf_service.py
+
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.als import FactorModel, train_implicit_als
+from app.database import SessionLocal
+from app.models.comment import CommentModel
+from app.models.movie_like import MovieLikeModel
+from app.models.watchlist import WatchlistModel
+
+
+class CollaborativeFilteringService:
+    """협업 필터링 추천 서비스 (implicit ALS)
+
+    좋아요, 왓치리스트, 댓글 평점을 (사용자, 영화) 선호 강도로 합쳐 매일 행렬 분해를 학습하고
+    factor를 MODEL_PATH에 float16으로 저장한다. 워커 프로세스는 RELOAD_INTERVAL마다 파일
+    수정 시각을 확인해 새 모델을 읽으며, 조회는 사용자 factor와 영화 factor 행렬의 곱 한 번이다.
+    """
+
+    MODEL_PATH = Path("data/cf_model/model.npz")
+    RELOAD_INTERVAL = 60  # 새 모델 확인 주기 (초)
+    LIKE_WEIGHT = 1.0
+    WATCHLIST_WEIGHT = 0.5
+    RATING_BASELINE = 5.0  # 이 평점을 넘는 만큼만 선호로 반영 (10점이면 1.0)
+    FACTORS = 64
+    REGULARIZATION = 0.1
+    ALPHA = 10.0
+    ITERATIONS = 10
+
+    def __init__(self):
+        self._model: Optional[FactorModel] = None
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_model(self) -> Optional[FactorModel]:
+        """현재 모델 (다른 프로세스가 새로 학습했으면 다시 읽기, 학습 전이면 None)"""
+        now = time.monotonic()
+        if now - self._checked_at < self.RELOAD_INTERVAL:
+            return self._model
+
+        with self._lock:
+            self._checked_at = now
+            try:
+                if not self.MODEL_PATH.exists():
+                    return self._model
+                mtime = self.MODEL_PATH.stat().st_mtime
+                if self._model is None or mtime != self._mtime:
+                    self._model = FactorModel.load(self.MODEL_PATH)
+                    self._mtime = mtime
+            except Exception as e:
+                print(f"협업 필터링 모델 읽기 실패: {str(e)}")
+            return self._model
+
+    def recommend(
+        self, user_id: int, count: int, exclude_ids: Iterable[int] = ()
+    ) -> List[Tuple[int, float]]:
+        """사용자 상위 count개 (영화 ID, 예측 선호도), 모델이 없거나 학습에 없던 사용자면 빈 목록"""
+        model = self.get_model()
+        if model is None:
+            return []
+        return model.recommend(user_id, count, exclude_ids)
+
+    def train(self) -> dict:
+        """전체 상호작용으로 모델 학습 후 교체"""
+        started = time.perf_counter()
+        db = SessionLocal()
+        try:
+            users, movies, preference = self._load_interactions_with_db(db)
+        except Exception as e:
+            raise Exception(f"협업 필터링 모델 학습 실패: {str(e)}")
+        finally:
+            db.close()
+
+        try:
+            user_ids, user_index = np.unique(users, return_inverse=True)
+            movie_ids, movie_index = np.unique(movies, return_inverse=True)
+            user_factors, movie_factors = train_implicit_als(
+                user_index,
+                movie_index,
+                preference,
+                len(user_ids),
+                len(movie_ids),
+                factors=self.FACTORS,
+                regularization=self.REGULARIZATION,
+                alpha=self.ALPHA,
+                iterations=self.ITERATIONS,
+            )
+            FactorModel(user_ids, movie_ids, user_factors, movie_factors).save(self.MODEL_PATH)
+
+            result = {
+                "users": len(user_ids),
+                "movies": len(movie_ids),
+                "interactions": len(preference),
+                "seconds": round(time.perf_counter() - started, 1),
+            }
+            print(f"협업 필터링 모델 학습 완료: {result}")
+            return result
+
+        except Exception as e:
+            raise Exception(f"협업 필터링 모델 학습 실패: {str(e)}")
+        finally:
+            with self._lock:
+                self._checked_at = 0.0
+
+    def _load_interactions_with_db(self, db: Session) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(사용자, 영화)별 선호 강도 합계"""
+        likes = self._load_pairs_with_db(
+            select(MovieLikeModel.user_id, MovieLikeModel.movie_id), db
+        )
+        watchlists = self._load_pairs_with_db(
+            select(WatchlistModel.user_id, WatchlistModel.movie_id), db
+        )
+        ratings = np.array(
+            db.execute(
+                select(CommentModel.user_id, CommentModel.movie_id, CommentModel.rating).where(
+                    CommentModel.rating > self.RATING_BASELINE, CommentModel.is_public.is_(True)
+                )
+            ).all(),
+            dtype=np.float64,
+        ).reshape(-1, 3)
+
+        pairs = np.concatenate((likes, watchlists, ratings[:, :2].astype(np.int64)))
+        weights = np.concatenate(
+            (
+                np.full(len(likes), self.LIKE_WEIGHT),
+                np.full(len(watchlists), self.WATCHLIST_WEIGHT),
+                (ratings[:, 2] - self.RATING_BASELINE) / (10.0 - self.RATING_BASELINE),
+            )
+        )
+
+        # 같은 (사용자, 영화)의 신호 합치기
+        keys, inverse = np.unique(pairs, axis=0, return_inverse=True)
+        preference = np.bincount(inverse.ravel(), weights=weights, minlength=len(keys))
+        return keys[:, 0], keys[:, 1], preference.astype(np.float32)
+
+    def _load_pairs_with_db(self, stmt, db: Session) -> np.ndarray:
+        """(ID, ID) 행을 (n, 2) 정수 배열로 조회"""
+        pairs = np.array(db.execute(stmt).all(), dtype=np.int64)
+        return pairs.reshape(-1, 2)
+
+
+# 전역 인스턴스
+cf_service = CollaborativeFilteringService()
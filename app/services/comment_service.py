@@ -14,11 +14,13 @@ from decimal import Decimal
 
 class CommentService:
 
-    def __init__(self):
-        pass
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
 
     def _get_db(self) -> Session:
-        """데이터베이스 세션 생성"""
+        """데이터베이스 세션 생성 (요청 단위 세션이 주입되면 재사용)"""
+        if self.db is not None:
+            return self.db
         return SessionLocal()
 
     async def get_comment(self, comment_id: int, current_user_id: Optional[int] = None) -> Comment:
@@ -0,0 +1,300 @@
+# app/services/counter_service.py
+
+import threading
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional
+from cachetools import TTLCache
+from sqlalchemy import select, func, and_, bindparam, event, literal
+from sqlalchemy.orm import Session
+from app.database import SessionLocal, dialect_insert, route_request
+from app.models.comment import CommentModel
+from app.models.entity_counter import EntityCounterModel
+from app.models.movie_like import MovieLikeModel
+from app.models.person_follow import PersonFollowModel
+from app.models.user_follow import UserFollowModel
+from app.models.watchlist import WatchlistModel
+
+
+class CounterDefinition(NamedTuple):
+    entity_type: str
+    name: str
+    model: type
+    column: object  # 원본 테이블에서 엔티티 ID를 가리키는 컬럼
+
+
+# 카운터 정의: 원본 테이블의 행 추가/삭제가 곧 카운터 증감
+COUNTERS = [
+    CounterDefinition("user", "followers_count", UserFollowModel, UserFollowModel.following_id),
+    CounterDefinition("user", "following_count", UserFollowModel, UserFollowModel.follower_id),
+    CounterDefinition(
+        "user", "following_persons_count", PersonFollowModel, PersonFollowModel.user_id
+    ),
+    CounterDefinition("user", "comments_count", CommentModel, CommentModel.user_id),
+    CounterDefinition("user", "liked_movies_count", MovieLikeModel, MovieLikeModel.user_id),
+    CounterDefinition("user", "watchlist_count", WatchlistModel, WatchlistModel.user_id),
+    CounterDefinition("person", "followers_count", PersonFollowModel, PersonFollowModel.person_id),
+]
+
+_counters_by_model: Dict[type, List[CounterDefinition]] = defaultdict(list)
+_counters_by_key: Dict[tuple, CounterDefinition] = {}
+for _definition in COUNTERS:
+    _counters_by_model[_definition.model].append(_definition)
+    _counters_by_key[(_definition.entity_type, _definition.name)] = _definition
+
+# 엔티티별 카운터 캐시 (워커 프로세스 단위, 커밋 시 무효화)
+_counter_cache = TTLCache(maxsize=50_000, ttl=60)
+_counter_cache_lock = threading.Lock()
+
+_counters = EntityCounterModel.__table__
+_increment_stmt = (
+    _counters.update()
+    .where(
+        and_(
+            _counters.c.entity_type == bindparam("b_entity_type"),
+            _counters.c.entity_id == bindparam("b_entity_id"),
+            _counters.c.name == bindparam("b_name"),
+        )
+    )
+    .values(value=_counters.c.value + bindparam("b_delta"))
+)
+
+
+def _seed_counter_stmt(bind, definition: CounterDefinition, entity_id: int):
+    """원본 테이블의 실제 COUNT로 카운터 행을 만드는 INSERT ... SELECT (ON CONFLICT는 호출부에서)"""
+    count = (
+        select(
+            literal(definition.entity_type),
+            literal(entity_id),
+            literal(definition.name),
+            func.count(),
+        )
+        .select_from(definition.model)
+        .where(definition.column == entity_id)
+    )
+    return dialect_insert(bind, _counters).from_select(
+        ["entity_type", "entity_id", "name", "value"], count
+    )
+
+
+def _seed_counters_stmt(bind, definition: CounterDefinition):
+    """원본 행이 있는 모든 엔티티의 카운터 행을 만드는 INSERT ... SELECT (ON CONFLICT는 호출부에서)"""
+    counts = (
+        select(
+            literal(definition.entity_type),
+            definition.column,
+            literal(definition.name),
+            func.count(),
+        )
+        .where(definition.column.isnot(None))  # SQLite는 ON CONFLICT 앞 SELECT에 WHERE 필요
+        .group_by(definition.column)
+    )
+    return dialect_insert(bind, _counters).from_select(
+        ["entity_type", "entity_id", "name", "value"], counts
+    )
+
+
+class CounterService:
+    """엔티티 카운터 서비스
+
+    팔로워 수, 댓글 수 같은 집계를 entity_counters 테이블에 저장한다.
+    원본 행이 추가/삭제되면 같은 트랜잭션에서 카운터를 증감하고(ORM 이벤트),
+    카운터 행이 아직 없으면 첫 증감 때 실제 COUNT로 만든다. 조회 경로는 쓰지 않으므로
+    행이 없는 카운터는 COUNT로 답하고, 정합성 점검(reconcile)이 행을 만들고 누락된 증감을 보정한다.
+    """
+
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
+
+    def _get_db(self) -> Session:
+        """데이터베이스 세션 생성 (요청 단위 세션이 주입되면 재사용)"""
+        if self.db is not None:
+            return self.db
+        return SessionLocal()
+
+    def get_counts_with_db(
+        self, entity_type: str, entity_ids: List[int], db: Session
+    ) -> Dict[int, Dict[str, int]]:
+        """엔티티별 전체 카운터 조회 (캐시 → DB 순)"""
+        counts = {}
+        missing = []
+        with _counter_cache_lock:
+            for entity_id in entity_ids:
+                cached = _counter_cache.get((entity_type, entity_id))
+                if cached is not None:
+                    counts[entity_id] = cached
+                else:
+                    missing.append(entity_id)
+
+        if missing:
+            loaded = self._load_counts_with_db(entity_type, missing, db)
+            with _counter_cache_lock:
+                for entity_id, entity_counts in loaded.items():
+                    _counter_cache[(entity_type, entity_id)] = entity_counts
+            counts.update(loaded)
+
+        return counts
+
+    def get_count_with_db(self, entity_type: str, entity_id: int, name: str, db: Session) -> int:
+        """단일 카운터 조회"""
+        return self.get_counts_with_db(entity_type, [entity_id], db)[entity_id][name]
+
+    def _load_counts_with_db(
+        self, entity_type: str, entity_ids: List[int], db: Session
+    ) -> Dict[int, Dict[str, int]]:
+        """저장된 카운터 조회, 행이 없는 카운터는 실제 COUNT"""
+        stmt = select(
+            EntityCounterModel.entity_id, EntityCounterModel.name, EntityCounterModel.value
+        ).where(
+            and_(
+                EntityCounterModel.entity_type == entity_type,
+                EntityCounterModel.entity_id.in_(entity_ids),
+            )
+        )
+        counts = {entity_id: {} for entity_id in entity_ids}
+        for row in db.execute(stmt):
+            counts[row.entity_id][row.name] = max(row.value, 0)
+
+        # 행이 없는 카운터는 같은 세션에서 COUNT로 답한다. 조회 요청에서 쓰기(별도 커넥션이나
+        # 요청 세션 커밋)를 하지 않도록 행 생성은 첫 증감과 정합성 점검(reconcile)에 맡긴다
+        for definition in COUNTERS:
+            if definition.entity_type != entity_type:
+                continue
+            ids = [
+                entity_id for entity_id in entity_ids if definition.name not in counts[entity_id]
+            ]
+            if not ids:
+                continue
+            actual = dict(
+                db.execute(
+                    select(definition.column, func.count())
+                    .where(definition.column.in_(ids))
+                    .group_by(definition.column)
+                ).all()
+            )
+            for entity_id in ids:
+                counts[entity_id][definition.name] = actual.get(entity_id, 0)
+
+        return counts
+
+    def reconcile(self) -> int:
+        """카운터 행이 없는 엔티티는 생성하고 저장된 카운터를 실제 COUNT와 비교해 보정,
+        생성/보정한 카운터 수 반환"""
+        db = self._get_db()
+        try:
+            fixed = 0
+            with route_request(force_primary=True):
+                for definition in COUNTERS:
+                    seeded = db.execute(
+                        _seed_counters_stmt(db, definition).on_conflict_do_nothing(
+                            index_elements=["entity_type", "entity_id", "name"]
+                        )
+                    ).rowcount
+                    if seeded:
+                        fixed += seeded
+                        print(f"카운터 생성: {definition.entity_type}.{definition.name} {seeded}건")
+
+                    stored = dict(
+                        db.execute(
+                            select(EntityCounterModel.entity_id, EntityCounterModel.value).where(
+                                and_(
+                                    EntityCounterModel.entity_type == definition.entity_type,
+                                    EntityCounterModel.name == definition.name,
+                                )
+                            )
+                        ).all()
+                    )
+                    if not stored:
+                        continue
+
+                    actual = dict(
+                        db.execute(
+                            select(definition.column, func.count()).group_by(definition.column)
+                        ).all()
+                    )
+                    corrections = [
+                        {
+                            "b_entity_type": definition.entity_type,
+                            "b_entity_id": entity_id,
+                            "b_name": definition.name,
+                            "b_delta": actual.get(entity_id, 0) - value,
+                        }
+                        for entity_id, value in stored.items()
+                        if actual.get(entity_id, 0) != value
+                    ]
+                    if corrections:
+                        db.execute(_increment_stmt, corrections)
+                        fixed += len(corrections)
+                        print(
+                            f"카운터 보정: {definition.entity_type}.{definition.name} "
+                            f"{len(corrections)}건"
+                        )
+
+                db.commit()
+
+            with _counter_cache_lock:
+                _counter_cache.clear()
+            return fixed
+
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"카운터 정합성 점검 실패: {str(e)}")
+        finally:
+            db.close()
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_counter_deltas(session, flush_context):
+    """추가/삭제된 원본 행만큼 같은 트랜잭션에서 카운터 증감"""
+    deltas: Dict[tuple, int] = defaultdict(int)
+    for instances, delta in ((session.new, 1), (session.deleted, -1)):
+        for instance in instances:
+            for definition in _counters_by_model.get(type(instance), ()):
+                entity_id = getattr(instance, definition.column.key)
+                deltas[(definition.entity_type, entity_id, definition.name)] += delta
+
+    changed = {key: delta for key, delta in deltas.items() if delta}
+    if not changed:
+        return
+
+    connection = session.connection()
+    for (entity_type, entity_id, name), delta in changed.items():
+        result = connection.execute(
+            _increment_stmt,
+            {
+                "b_entity_type": entity_type,
+                "b_entity_id": entity_id,
+                "b_name": name,
+                "b_delta": delta,
+            },
+        )
+        if result.rowcount:
+            continue
+
+        # 카운터 행이 아직 없으면 이 트랜잭션의 COUNT(방금 flush한 행 포함)로 생성,
+        # 그 사이 다른 트랜잭션이 만든 행이면 증감만 반영
+        stmt = _seed_counter_stmt(connection, _counters_by_key[(entity_type, name)], entity_id)
+        connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["entity_type", "entity_id", "name"],
+                set_={"value": _counters.c.value + delta, "updated_at": func.current_timestamp()},
+            )
+        )
+
+    session.info.setdefault("changed_counters", set()).update(
+        (entity_type, entity_id) for entity_type, entity_id, _ in changed
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_counter_cache(session):
+    changed = session.info.pop("changed_counters", None)
+    if not changed:
+        return
+    with _counter_cache_lock:
+        for key in changed:
+            _counter_cache.pop(key, None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_counter_changes(session):
+    session.info.pop("changed_counters", None)
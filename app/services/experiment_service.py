@@ -0,0 +1,113 @@
+# app/services/experiment_service.py
+
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List
+import numpy as np
+from app.core.event_log import EVENT_CLICK, EVENT_IMPRESSION, EventLog
+from app.core.experiments import Experiment, Variant
+
+# 추천 가중치 실험: 변형별 가중치 범위 안에서 사용자/날짜 시드로 가중치를 뽑는다
+RECOMMENDATION_WEIGHTS_EXPERIMENT = Experiment(
+    experiment_id=1,
+    name="recommendation_weights",
+    variants=[
+        Variant(
+            "control",
+            0.5,
+            {
+                "genre": (0.1, 0.6),
+                "people": (0.1, 0.6),
+                "content": (0.1, 0.6),
+                "rating": (0.1, 0.4),
+                "popularity": (0.05, 0.3),
+            },
+        ),
+        Variant(
+            "content_heavy",
+            0.5,
+            {
+                "genre": (0.1, 0.4),
+                "people": (0.1, 0.4),
+                "content": (0.4, 0.8),
+                "rating": (0.1, 0.3),
+                "popularity": (0.05, 0.2),
+            },
+        ),
+    ],
+)
+
+
+class ExperimentService:
+    """추천 실험 노출/클릭 기록 및 변형별 집계
+
+    이벤트는 EVENT_DIR의 날짜별 추가 전용 로그에 남기며, 집계는 최근 며칠 치 파일을
+    numpy로 읽어 변형별 노출 수, 클릭 수, 클릭률을 계산한다.
+    """
+
+    EVENT_DIR = Path("data/events")
+
+    def __init__(self):
+        self._log = EventLog(self.EVENT_DIR, "recommendations")
+
+    def log_impressions(
+        self, experiment: Experiment, user_id: int, variant_index: int, movie_ids: List[int]
+    ):
+        """추천 목록 노출 기록 (위치는 1부터)"""
+        try:
+            self._log.append(
+                (movie_id, user_id, experiment.experiment_id, variant_index, EVENT_IMPRESSION, rank)
+                for rank, movie_id in enumerate(movie_ids, start=1)
+            )
+        except Exception as e:
+            print(f"추천 노출 기록 실패: {str(e)}")
+
+    def log_click(self, experiment: Experiment, user_id: int, movie_id: int, position: int = 0):
+        """추천 영화 클릭 기록 (위치를 모르면 0)"""
+        try:
+            variant_index, _ = experiment.assign(user_id)
+            self._log.append(
+                [
+                    (
+                        movie_id,
+                        user_id,
+                        experiment.experiment_id,
+                        variant_index,
+                        EVENT_CLICK,
+                        position,
+                    )
+                ]
+            )
+        except Exception as e:
+            print(f"추천 클릭 기록 실패: {str(e)}")
+
+    def variant_stats(self, experiment: Experiment, days: int = 7) -> dict:
+        """최근 days일 변형별 노출/클릭 집계"""
+        today = date.today()
+        events = np.concatenate(
+            [self._log.read(today - timedelta(days=offset)) for offset in range(days)]
+        )
+        events = events[events["experiment"] == experiment.experiment_id]
+
+        variants = []
+        for index, variant in enumerate(experiment.variants):
+            selected = events[events["variant"] == index]
+            shown = selected[selected["event"] == EVENT_IMPRESSION]
+            impressions = len(shown)
+            clicks = int((selected["event"] == EVENT_CLICK).sum())
+            variants.append(
+                {
+                    "variant": variant.name,
+                    "traffic": variant.traffic,
+                    "users": len(np.unique(shown["user_id"])),
+                    "impressions": impressions,
+                    "clicks": clicks,
+                    "ctr": round(clicks / impressions, 4) if impressions else 0.0,
+                }
+            )
+
+        return {"experiment": experiment.name, "days": days, "variants": variants}
+
+
+# 전역 인스턴스
+experiment_service = ExperimentService()
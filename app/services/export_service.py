@@ -0,0 +1,147 @@
+# app/services/export_service.py
+
+from datetime import datetime
+from typing import Iterator
+from sqlalchemy import select
+from sqlalchemy.orm import Session, aliased
+from app.database import SessionLocal
+from app.models.comment import CommentModel
+from app.models.movie import MovieModel
+from app.models.movie_like import MovieLikeModel
+from app.models.person import PersonModel
+from app.models.person_follow import PersonFollowModel
+from app.models.user import UserModel
+from app.models.user_follow import UserFollowModel
+from app.models.watchlist import WatchlistModel
+
+
+class ExportService:
+    """사용자 활동 내보내기 서비스
+
+    댓글, 좋아요, 왓치리스트, 팔로우(사용자/인물), 팔로워를 한 줄에 한 건씩
+    순회한다. 각 구간은 서버 측 커서(yield_per)로 EXPORT_BATCH_SIZE행씩 읽으므로
+    활동 기록이 많아도 워커 메모리는 일정하다.
+    응답 전송 중에 순회되므로 요청 세션 대신 자체 세션을 사용한다.
+    """
+
+    EXPORT_BATCH_SIZE = 1000
+
+    def iter_user_activity(self, user_id: int) -> Iterator[dict]:
+        """사용자 활동 전체 순회 (첫 줄은 사용자 정보)"""
+        db = SessionLocal()
+        try:
+            user = db.execute(
+                select(UserModel.user_id, UserModel.name, UserModel.created_at).where(
+                    UserModel.user_id == user_id
+                )
+            ).first()
+            if not user:
+                return
+
+            yield {
+                "type": "user",
+                "user_id": user.user_id,
+                "name": user.name,
+                "joined_at": user.created_at,
+                "exported_at": datetime.now(),
+            }
+            yield from self._iter_comments_with_db(user_id, db)
+            yield from self._iter_movies_with_db("like", MovieLikeModel, user_id, db)
+            yield from self._iter_movies_with_db("watchlist", WatchlistModel, user_id, db)
+            yield from self._iter_follows_with_db(user_id, db)
+            yield from self._iter_person_follows_with_db(user_id, db)
+
+        finally:
+            db.close()
+
+    def _stream(self, stmt, db: Session):
+        return db.execute(stmt.execution_options(yield_per=self.EXPORT_BATCH_SIZE))
+
+    def _iter_comments_with_db(self, user_id: int, db: Session) -> Iterator[dict]:
+        """작성한 댓글 (비공개 포함)"""
+        stmt = (
+            select(
+                CommentModel.comment_id,
+                CommentModel.movie_id,
+                MovieModel.title,
+                CommentModel.content,
+                CommentModel.rating,
+                CommentModel.watched_date,
+                CommentModel.is_spoiler,
+                CommentModel.is_public,
+                CommentModel.created_at,
+                CommentModel.updated_at,
+            )
+            .outerjoin(MovieModel, MovieModel.movie_id == CommentModel.movie_id)
+            .where(CommentModel.user_id == user_id)
+            .order_by(CommentModel.comment_id)
+        )
+        for row in self._stream(stmt, db):
+            yield {
+                "type": "comment",
+                "comment_id": row.comment_id,
+                "movie_id": row.movie_id,
+                "movie_title": row.title,
+                "content": row.content,
+                "rating": float(row.rating) if row.rating is not None else None,
+                "watched_date": row.watched_date,
+                "is_spoiler": row.is_spoiler,
+                "is_public": row.is_public,
+                "created_at": row.created_at,
+                "updated_at": row.updated_at,
+            }
+
+    def _iter_movies_with_db(
+        self, record_type: str, model, user_id: int, db: Session
+    ) -> Iterator[dict]:
+        """좋아요/왓치리스트 영화"""
+        stmt = (
+            select(model.movie_id, MovieModel.title, model.created_at)
+            .outerjoin(MovieModel, MovieModel.movie_id == model.movie_id)
+            .where(model.user_id == user_id)
+            .order_by(model.created_at, model.movie_id)
+        )
+        for row in self._stream(stmt, db):
+            yield {
+                "type": record_type,
+                "movie_id": row.movie_id,
+                "movie_title": row.title,
+                "created_at": row.created_at,
+            }
+
+    def _iter_follows_with_db(self, user_id: int, db: Session) -> Iterator[dict]:
+        """팔로우한 사용자와 나를 팔로우한 사용자"""
+        other = aliased(UserModel)
+        for record_type, own_column, other_column in (
+            ("following", UserFollowModel.follower_id, UserFollowModel.following_id),
+            ("follower", UserFollowModel.following_id, UserFollowModel.follower_id),
+        ):
+            stmt = (
+                select(other_column.label("other_id"), other.name, UserFollowModel.created_at)
+                .outerjoin(other, other.user_id == other_column)
+                .where(own_column == user_id)
+                .order_by(UserFollowModel.created_at, other_column)
+            )
+            for row in self._stream(stmt, db):
+                yield {
+                    "type": record_type,
+                    "user_id": row.other_id,
+                    "name": row.name,
+                    "created_at": row.created_at,
+                }
+
+    def _iter_person_follows_with_db(self, user_id: int, db: Session) -> Iterator[dict]:
+        """팔로우한 인물"""
+        stmt = (
+            select(PersonFollowModel.person_id, PersonModel.name, PersonFollowModel.created_at)
+            .outerjoin(PersonModel, PersonModel.person_id == PersonFollowModel.person_id)
+            .where(PersonFollowModel.user_id == user_id)
+            .order_by(PersonFollowModel.created_at, PersonFollowModel.person_id)
+        )
+        for row in self._stream(stmt, db):
+            yield {
+                "type": "person_follow",
+                "person_id": row.person_id,
+                "name": row.name,
+                "created_at": row.created_at,
+            }
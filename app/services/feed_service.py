@@ -15,11 +15,13 @@ from app.database import SessionLocal
 
 class FeedService:
 
-    def __init__(self):
-        pass
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
 
     def _get_db(self) -> Session:
-        """데이터베이스 세션 생성"""
+        """데이터베이스 세션 생성 (요청 단위 세션이 주입되면 재사용)"""
+        if self.db is not None:
+            return self.db
         return SessionLocal()
 
     async def get_user_feed(
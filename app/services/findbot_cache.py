@@ -0,0 +1,157 @@
+# app/services/findbot_cache.py
+
+import re
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+import numpy as np
+from app.ai import embed_sentence
+from app.core.hangul import normalize
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 정규화 (검색용 정규화 + 문장부호 제거)"""
+    return normalize(_PUNCTUATION.sub(" ", query or ""))
+
+
+class CacheEntry(NamedTuple):
+    key: str
+    answer: dict
+    latency: float  # 원래 응답에 걸린 시간 (초)
+    tokens: int  # 원래 응답의 추정 토큰 수
+    created_at: float
+
+
+class CacheLookup(NamedTuple):
+    key: str
+    vector: Optional[np.ndarray]
+    answer: Optional[dict]
+
+
+class FindBotCache:
+    """findbot 의미 캐시 (정규화한 질의 + 문장 임베딩 유사도)
+
+    TMDB 검증까지 마친 성공 응답만 저장한다. 정규화한 질의가 같으면 그대로 재사용하고,
+    아니면 저장된 질의 임베딩과의 코사인 유사도가 SIMILARITY_THRESHOLD 이상인
+    가장 가까운 응답을 재사용한다. 임베딩은 고정 크기 numpy 행렬(링 버퍼)에 두고
+    가득 차면 가장 오래된 항목부터 덮어쓴다. 워커 프로세스마다 따로 유지된다.
+    """
+
+    MAX_ENTRIES = 10000
+    SIMILARITY_THRESHOLD = 0.92
+    TTL_SECONDS = 7 * 24 * 3600
+    BYTES_PER_TOKEN = 3  # 토큰 수 추정용 (UTF-8 바이트 기준 대략값)
+
+    def __init__(self):
+        self._vectors: Optional[np.ndarray] = None
+        self._entries: List[Optional[CacheEntry]] = [None] * self.MAX_ENTRIES
+        self._slots: Dict[str, int] = {}
+        self._next_slot = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self._lookups = 0
+        self._exact_hits = 0
+        self._semantic_hits = 0
+        self._saved_seconds = 0.0
+        self._saved_tokens = 0
+
+    def estimate_tokens(self, *texts: str) -> int:
+        return sum(len((text or "").encode("utf-8")) for text in texts) // self.BYTES_PER_TOKEN
+
+    def lookup(self, query: str) -> CacheLookup:
+        """캐시 조회 (임베딩 계산이 있으므로 이벤트 루프 밖에서 호출)"""
+        started = time.perf_counter()
+        key = normalize_query(query)
+
+        with self._lock:
+            self._lookups += 1
+            entry = self._live_entry(self._slots.get(key))
+            if entry is not None:
+                self._exact_hits += 1
+                self._record_saving(entry, started)
+                return CacheLookup(key, None, entry.answer)
+
+        try:
+            vector = embed_sentence(key)
+        except Exception as e:
+            print(f"findbot 캐시 임베딩 실패: {str(e)}")
+            return CacheLookup(key, None, None)
+
+        with self._lock:
+            if self._size == 0 or self._vectors is None or len(vector) != self._vectors.shape[1]:
+                return CacheLookup(key, vector, None)
+
+            scores = self._vectors[: self._size] @ vector
+            slot = int(np.argmax(scores))
+            entry = self._live_entry(slot)
+            if entry is None or scores[slot] < self.SIMILARITY_THRESHOLD:
+                return CacheLookup(key, vector, None)
+
+            self._semantic_hits += 1
+            self._record_saving(entry, started)
+            return CacheLookup(key, vector, entry.answer)
+
+    def _live_entry(self, slot: Optional[int]) -> Optional[CacheEntry]:
+        if slot is None:
+            return None
+        entry = self._entries[slot]
+        if entry is None or time.time() - entry.created_at > self.TTL_SECONDS:
+            return None
+        return entry
+
+    def _record_saving(self, entry: CacheEntry, started: float):
+        self._saved_seconds += max(entry.latency - (time.perf_counter() - started), 0.0)
+        self._saved_tokens += entry.tokens
+
+    def store(self, lookup: CacheLookup, answer: dict, latency: float, tokens: int):
+        """검증된 응답 저장 (같은 질의가 있으면 교체, 임베딩이 없으면 정확 일치만)"""
+        with self._lock:
+            vector = lookup.vector
+            if vector is not None and self._vectors is None:
+                self._vectors = np.zeros((self.MAX_ENTRIES, len(vector)), dtype=np.float32)
+
+            slot = self._slots.get(lookup.key)
+            if slot is None:
+                slot = self._next_slot
+                self._next_slot = (slot + 1) % self.MAX_ENTRIES
+                self._size = max(self._size, slot + 1)
+                old_entry = self._entries[slot]
+                if old_entry is not None:
+                    self._slots.pop(old_entry.key, None)
+
+            self._entries[slot] = CacheEntry(lookup.key, answer, latency, tokens, time.time())
+            self._slots[lookup.key] = slot
+            if self._vectors is not None:
+                usable = vector is not None and len(vector) == self._vectors.shape[1]
+                self._vectors[slot] = vector if usable else 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self._exact_hits + self._semantic_hits
+            return {
+                "entries": len(self._slots),
+                "lookups": self._lookups,
+                "exact_hits": self._exact_hits,
+                "semantic_hits": self._semantic_hits,
+                "hit_rate": round(hits / self._lookups, 4) if self._lookups else 0.0,
+                "saved_seconds": round(self._saved_seconds, 3),
+                "saved_tokens": self._saved_tokens,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._vectors = None
+            self._entries = [None] * self.MAX_ENTRIES
+            self._slots = {}
+            self._next_slot = 0
+            self._size = 0
+            self._reset_stats()
+
+
+# 전역 인스턴스
+findbot_cache = FindBotCache()
@@ -0,0 +1,218 @@
+# app/services/findbot_service.py
+
+import asyncio
+import json
+import re
+import time
+from typing import Any, AsyncIterator, Optional, Tuple
+from app.ai import findbot_stream
+from app.core.config import get_settings
+from app.core.hangul import normalize
+from app.schemas.ai import FindBotResponse
+from app.services.findbot_cache import findbot_cache
+from app.services.movie_retrieval_service import movie_retrieval_service
+from app.services.movie_service import MovieService
+from app.services.prompt_service import prompt_service
+from app.services.tmdb_service import TMDBService
+
+# 스트리밍 중인 JSON 응답에서 값이 끝까지 도착한 필드만 추출
+_TITLE_PATTERN = re.compile(r'"title"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_MOVIE_ID_PATTERN = re.compile(r'"movie_id"\s*:\s*(\d+)\s*[,}]')
+
+
+def _extract_title(text: str) -> Optional[str]:
+    match = _TITLE_PATTERN.search(text)
+    if not match:
+        return None
+    try:
+        return json.loads(f'"{match.group(1)}"') or None
+    except json.JSONDecodeError:
+        return None
+
+
+def _extract_movie_id(text: str) -> Optional[int]:
+    match = _MOVIE_ID_PATTERN.search(text)
+    return int(match.group(1)) if match else None
+
+
+class FindBotService:
+    """AI 영화 찾기 서비스
+
+    비슷한 질의의 검증된 결과가 의미 캐시에 있으면 모델을 호출하지 않고 재사용한다.
+    다음으로 로컬 영화 색인에서 후보를 찾아 프롬프트에 함께 전달한다 (후보 중 하나를 고르면
+    TMDB 검증 생략). findbot_local_answer 설정이 켜져 있으면 확실한 일치는 바로 반환한다.
+    모델 응답을 스트리밍으로 받으면서 제목과 영화 ID가 나타나는 즉시
+    TMDB 제목 검색(ID 검증)과 해당 영화 상세 조회를 동시에 시작하고,
+    응답이 끝나면 검증된 ID의 영화만 DB에 저장한다 (검증되지 않은 ID는 저장하지 않음).
+    """
+
+    def __init__(
+        self,
+        movie_service: Optional[MovieService] = None,
+        tmdb_service: Optional[TMDBService] = None,
+    ):
+        self.movie_service = movie_service or MovieService()
+        self.tmdb_service = tmdb_service or TMDBService()
+        self.settings = get_settings()
+
+    async def find_movie(self, query: str) -> FindBotResponse:
+        """AI 영화 찾기 (검증된 최종 결과만 반환)"""
+        result = None
+        async for event, data in self.stream(query):
+            if event == "result":
+                result = data
+        return result
+
+    async def stream(self, query: str) -> AsyncIterator[Tuple[str, Any]]:
+        """("token", 응답 조각)을 도착 순서대로, 마지막에 ("result", FindBotResponse) 반환"""
+        started = time.perf_counter()
+        cached = await asyncio.to_thread(findbot_cache.lookup, query)
+        if cached.answer is not None:
+            yield "result", FindBotResponse(**cached.answer)
+            return
+
+        retrieval = await asyncio.to_thread(movie_retrieval_service.retrieve, query)
+        if retrieval.confident:
+            top = retrieval.candidates[0]
+            print(f"로컬 검색 확실한 일치: {top.title} ({top.movie_id})")
+            if self.settings.findbot_local_answer:
+                yield "result", FindBotResponse(
+                    success=True,
+                    title=top.title,
+                    movie_id=top.movie_id,
+                    reason="단서가 이 영화의 줄거리/리뷰 요약과 일치합니다",
+                    plot=top.overview,
+                )
+                return
+
+        # 로컬 후보는 이미 DB에 있는 TMDB 영화이므로 검증/저장이 필요 없음
+        local_ids = {candidate.movie_id for candidate in retrieval.candidates}
+        local_titles = {normalize(candidate.title) for candidate in retrieval.candidates}
+        context = movie_retrieval_service.build_prompt_context(retrieval.candidates)
+
+        text = ""
+        search_task: Optional[asyncio.Task] = None
+        detail_task: Optional[asyncio.Task] = None
+        try:
+            async for content in findbot_stream(query, context if local_ids else None):
+                text += content
+                yield "token", content
+
+                if search_task is None:
+                    title = _extract_title(text)
+                    if title and normalize(title) not in local_titles:
+                        search_task = asyncio.create_task(self._search_movie_id(title))
+                if detail_task is None:
+                    movie_id = _extract_movie_id(text)
+                    if movie_id and movie_id not in local_ids:
+                        detail_task = asyncio.create_task(self._fetch_movie_details(movie_id))
+
+            result = self._parse_response(text)
+            if not result.get("success", False):
+                yield "result", FindBotResponse(
+                    success=False, message=result.get("message", "영화를 찾을 수 없습니다")
+                )
+                return
+
+            ai_movie_title = result.get("title")
+            ai_movie_id = result.get("movie_id")
+            if not ai_movie_title or not ai_movie_id:
+                raise Exception("AI 응답에 영화 제목 또는 ID가 없습니다")
+
+            if ai_movie_id in local_ids:
+                verified_movie_id = ai_movie_id
+                print(f"로컬 후보에서 선택된 영화 ID: {ai_movie_id}")
+            else:
+                verified_movie_id = await self._verify_and_save(
+                    ai_movie_title, ai_movie_id, search_task, detail_task
+                )
+
+            response = FindBotResponse(
+                success=True,
+                title=ai_movie_title,
+                movie_id=verified_movie_id,
+                reason=result.get("reason"),
+                plot=result.get("plot"),
+            )
+            tokens = findbot_cache.estimate_tokens(prompt_service.get_findbot_prompt(), query, text)
+            findbot_cache.store(
+                cached, response.model_dump(), time.perf_counter() - started, tokens
+            )
+            yield "result", response
+
+        finally:
+            # 오류 또는 클라이언트 연결 종료 시 진행 중인 작업 취소
+            for task in (search_task, detail_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    async def _verify_and_save(
+        self,
+        title: str,
+        ai_movie_id: int,
+        search_task: Optional[asyncio.Task],
+        detail_task: Optional[asyncio.Task],
+    ) -> int:
+        """TMDB 검색으로 ID 검증 후 검증된 영화만 저장 (스트리밍 중 시작한 작업은 이어서 사용)"""
+        if search_task is None:
+            search_task = asyncio.create_task(self._search_movie_id(title))
+        if detail_task is None:
+            detail_task = asyncio.create_task(self._fetch_movie_details(ai_movie_id))
+
+        matched_id = await search_task
+        verified_movie_id = matched_id or ai_movie_id
+        if not matched_id:
+            print(f"TMDB 검색으로 검증하지 못함. AI ID 사용: {ai_movie_id}")
+
+        if verified_movie_id == ai_movie_id:
+            # 미리 가져온 상세 정보로 저장
+            await self._save_movie(ai_movie_id, await detail_task)
+        else:
+            # 검색 결과와 다른 AI ID는 저장하지 않음
+            detail_task.cancel()
+            await self._save_movie(verified_movie_id)
+        return verified_movie_id
+
+    def _parse_response(self, text: str) -> dict:
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as parse_error:
+            print(f"JSON 파싱 에러: {str(parse_error)}")
+            print(f"파싱 실패한 응답: {text}")
+            raise Exception(f"AI 응답 파싱 실패: {str(parse_error)}")
+
+    async def _search_movie_id(self, title: str) -> Optional[int]:
+        """TMDB에서 영화 제목으로 검색하여 가장 적합한 영화 ID 반환"""
+        try:
+            print(f"TMDB에서 영화 검색 시작: {title}")
+            search_results = await self.tmdb_service.search_movie_by_title(title)
+            if not search_results:
+                return None
+
+            matched_id = self.tmdb_service.find_best_movie_match(search_results, title)
+            if matched_id:
+                print(f"TMDB 검색으로 검증된 영화 ID: {matched_id}")
+            return matched_id
+
+        except Exception as search_error:
+            print(f"TMDB 검색 중 오류 발생: {str(search_error)}")
+            return None
+
+    async def _fetch_movie_details(self, movie_id: int) -> Optional[dict]:
+        """TMDB 영화 상세 조회만 수행 (저장은 ID 검증 후)"""
+        try:
+            return await self.tmdb_service.get_movie_details(movie_id, language="ko-KR")
+        except Exception as fetch_error:
+            print(f"TMDB 상세 조회 중 오류 발생: {str(fetch_error)}")
+            return None
+
+    async def _save_movie(self, movie_id: int, tmdb_data: Optional[dict] = None):
+        """영화 DB 저장 (미리 가져온 상세 정보가 없으면 상세 조회로 저장, 실패해도 결과에 영향 없음)"""
+        try:
+            if tmdb_data:
+                await self.movie_service.save_tmdb_movie(movie_id, tmdb_data)
+            else:
+                await self.movie_service.get_movie_detail(movie_id)
+            print(f"영화 DB 저장 완료: {movie_id}")
+        except Exception as db_error:
+            print(f"영화 DB 저장 실패: {str(db_error)}")
@@ -0,0 +1,310 @@
+# app/services/follow_suggestion_service.py
+
+import time
+from datetime import datetime
+from typing import Iterator, List, Optional
+import numpy as np
+from sqlalchemy import select, delete, insert, union, func
+from sqlalchemy.orm import Session
+from app.core.cooccurrence import TwoHopIndex, top_k_per_group
+from app.database import SessionLocal, route_request
+from app.models.comment import CommentModel
+from app.models.follow_suggestion import FollowSuggestionModel
+from app.models.movie_like import MovieLikeModel
+from app.models.user import UserModel
+from app.models.user_follow import UserFollowModel
+from app.schemas.user_follow import FollowSuggestion, FollowSuggestionResponse
+from app.services.counter_service import CounterService
+
+
+class FollowSuggestionService:
+    """팔로우 추천 서비스
+
+    일괄 작업(compute_all)이 전체 팔로우 그래프와 좋아요/댓글 영화 집합을 numpy 배열로 읽어
+    친구의 친구(내가 팔로우하는 사람들이 팔로우하는 사용자)와 취향이 겹치는 사용자
+    (좋아요/댓글 영화 집합의 Jaccard 유사도)를 점수화하고 사용자별 상위 K명을 저장한다.
+    조회 시에는 저장된 추천에서 그 사이 팔로우한 사용자만 제외하고, 저장된 추천이 없는
+    신규 사용자는 DB에서 친구의 친구를 바로 계산한다.
+    """
+
+    TOP_K = 50
+    MUTUAL_WEIGHT = 1.0  # log(1 + 공통 팔로잉 수) 가중치
+    TASTE_WEIGHT = 4.0  # Jaccard 유사도 가중치
+    MIN_COMMON_MOVIES = 2  # 취향 후보로 인정할 최소 공통 영화 수
+    MAX_MOVIE_FANOUT = 2000  # 이보다 많은 사용자가 반응한 영화는 취향 비교에서 제외
+    MAX_FOLLOWING_FANOUT = 5000  # 이보다 많이 팔로우하는 사용자는 친구의 친구 경유지에서 제외
+    BLOCK_PATHS = 1_000_000  # 한 번에 집계할 최대 경로 수 (메모리 제한)
+    INSERT_BATCH_SIZE = 5000
+
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
+
+    def _get_db(self) -> Session:
+        """데이터베이스 세션 생성 (요청 단위 세션이 주입되면 재사용)"""
+        if self.db is not None:
+            return self.db
+        return SessionLocal()
+
+    async def get_follow_suggestions(
+        self, user_id: int, limit: int = 20
+    ) -> FollowSuggestionResponse:
+        """팔로우 추천 목록 조회"""
+        db = self._get_db()
+        try:
+            following_ids = self._get_following_ids_with_db(user_id, db)
+
+            stmt = (
+                select(
+                    FollowSuggestionModel.suggested_user_id,
+                    FollowSuggestionModel.score,
+                    FollowSuggestionModel.mutual_follows,
+                    FollowSuggestionModel.common_movies,
+                    FollowSuggestionModel.reason,
+                    UserModel.name,
+                    UserModel.profile_image_url,
+                )
+                .join(UserModel, UserModel.user_id == FollowSuggestionModel.suggested_user_id)
+                .where(FollowSuggestionModel.user_id == user_id, UserModel.is_active.is_(True))
+                .order_by(FollowSuggestionModel.rank)
+            )
+            suggestions = [
+                FollowSuggestion(
+                    user_id=row.suggested_user_id,
+                    name=row.name,
+                    profile_image_url=row.profile_image_url,
+                    score=row.score,
+                    mutual_follows=row.mutual_follows,
+                    common_movies=row.common_movies,
+                    reason=row.reason,
+                )
+                for row in db.execute(stmt)
+                if row.suggested_user_id not in following_ids
+            ]
+
+            if not suggestions:
+                suggestions = self._live_suggestions_with_db(user_id, following_ids, db)
+
+            return FollowSuggestionResponse(
+                users=suggestions[:limit], total=len(suggestions[:limit])
+            )
+
+        except Exception as e:
+            raise Exception(f"팔로우 추천 조회 실패: {str(e)}")
+        finally:
+            db.close()
+
+    def _get_following_ids_with_db(self, user_id: int, db: Session) -> set:
+        """현재 팔로우 중인 사용자 ID"""
+        stmt = select(UserFollowModel.following_id).where(UserFollowModel.follower_id == user_id)
+        return set(db.execute(stmt).scalars().all())
+
+    def _live_suggestions_with_db(
+        self, user_id: int, following_ids: set, db: Session
+    ) -> List[FollowSuggestion]:
+        """저장된 추천이 없을 때 DB에서 친구의 친구 계산"""
+        if not following_ids:
+            return []
+
+        # 너무 많이 팔로우하는 사용자는 경유지에서 제외 (일괄 작업과 같은 기준)
+        counts = CounterService().get_counts_with_db("user", list(following_ids), db)
+        via_ids = [
+            followee_id
+            for followee_id in following_ids
+            if counts[followee_id]["following_count"] <= self.MAX_FOLLOWING_FANOUT
+        ]
+        if not via_ids:
+            return []
+
+        mutual_count = func.count().label("mutual_follows")
+        stmt = (
+            select(UserFollowModel.following_id, mutual_count)
+            .where(
+                UserFollowModel.follower_id.in_(via_ids),
+                UserFollowModel.following_id.notin_(list(following_ids | {user_id})),
+            )
+            .group_by(UserFollowModel.following_id)
+            .order_by(mutual_count.desc(), UserFollowModel.following_id)
+            .limit(self.TOP_K)
+        )
+        top = db.execute(stmt).all()
+        if not top:
+            return []
+
+        stmt = select(UserModel.user_id, UserModel.name, UserModel.profile_image_url).where(
+            UserModel.user_id.in_([candidate_id for candidate_id, _ in top]),
+            UserModel.is_active.is_(True),
+        )
+        users = {row.user_id: row for row in db.execute(stmt)}
+        return [
+            FollowSuggestion(
+                user_id=candidate_id,
+                name=users[candidate_id].name,
+                profile_image_url=users[candidate_id].profile_image_url,
+                score=self.MUTUAL_WEIGHT * float(np.log1p(count)),
+                mutual_follows=count,
+                common_movies=0,
+                reason="mutual_follows",
+            )
+            for candidate_id, count in top
+            if candidate_id in users
+        ]
+
+    def compute_all(self) -> int:
+        """전체 사용자 팔로우 추천 계산 후 교체, 저장한 추천 수 반환"""
+        db = self._get_db()
+        try:
+            started = time.perf_counter()
+            with route_request(force_primary=True):
+                follows = self._load_pairs_with_db(
+                    select(UserFollowModel.follower_id, UserFollowModel.following_id), db
+                )
+                tastes = self._load_pairs_with_db(
+                    union(
+                        select(MovieLikeModel.user_id, MovieLikeModel.movie_id),
+                        select(CommentModel.user_id, CommentModel.movie_id),
+                    ),
+                    db,
+                )
+
+                saved = 0
+                db.execute(delete(FollowSuggestionModel))
+                for rows in self._iter_suggestions(follows, tastes):
+                    for start in range(0, len(rows), self.INSERT_BATCH_SIZE):
+                        db.execute(
+                            insert(FollowSuggestionModel),
+                            rows[start : start + self.INSERT_BATCH_SIZE],
+                        )
+                    saved += len(rows)
+                db.commit()
+
+            print(
+                f"팔로우 추천 계산 완료: 팔로우 {len(follows)}건, 취향 {len(tastes)}건 → "
+                f"추천 {saved}건 ({time.perf_counter() - started:.1f}초)"
+            )
+            return saved
+
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"팔로우 추천 계산 실패: {str(e)}")
+        finally:
+            db.close()
+
+    def _load_pairs_with_db(self, stmt, db: Session) -> np.ndarray:
+        """(ID, ID) 행을 (n, 2) 정수 배열로 조회"""
+        pairs = np.array(db.execute(stmt).all(), dtype=np.int64)
+        return pairs.reshape(-1, 2)
+
+    def _iter_suggestions(self, follows: np.ndarray, tastes: np.ndarray) -> Iterator[List[dict]]:
+        """친구의 친구 + 취향 유사도 점수로 사용자별 상위 K명 구성 (사용자 묶음 단위)"""
+        # 사용자 ID를 0..n-1로 압축 (영화 ID는 중간 정점으로만 쓰이므로 그대로 사용)
+        user_ids, compact = np.unique(
+            np.concatenate((follows[:, 0], follows[:, 1], tastes[:, 0])), return_inverse=True
+        )
+        size = len(user_ids)
+        if size == 0:
+            return
+        followers = compact[: len(follows)]
+        followings = compact[len(follows) : 2 * len(follows)]
+        taste_users = compact[2 * len(follows) :]
+        taste_movies = tastes[:, 1]
+
+        # 친구의 친구: 내가 팔로우하는 사람(중간) → 그 사람이 팔로우하는 사용자
+        # 취향: 사용자 → 영화(중간) → 같은 영화에 반응한 사용자
+        follow_index = TwoHopIndex(followers, followings, self.MAX_FOLLOWING_FANOUT)
+        taste_index = TwoHopIndex(taste_movies, taste_users, self.MAX_MOVIE_FANOUT)
+        context = {
+            "size": size,
+            "movie_counts": np.bincount(taste_users, minlength=size),
+            "follow_keys": np.sort(followers.astype(np.int64) * size + followings),
+        }
+
+        follow_order = np.argsort(followers, kind="stable")
+        followers, followings = followers[follow_order], followings[follow_order]
+        taste_order = np.argsort(taste_users, kind="stable")
+        taste_users, taste_movies = taste_users[taste_order], taste_movies[taste_order]
+
+        # 사용자별 경로 수로 묶음을 나눠 중간 결과 메모리 제한
+        paths = np.bincount(
+            followers, weights=follow_index.fanouts(followings), minlength=size
+        ) + np.bincount(taste_users, weights=taste_index.fanouts(taste_movies), minlength=size)
+        cumulative = np.cumsum(paths)
+
+        created_at = datetime.now()
+        start = 0
+        while start < size:
+            offset = cumulative[start - 1] if start else 0
+            end = int(np.searchsorted(cumulative, offset + self.BLOCK_PATHS, side="right"))
+            end = max(end, start + 1)
+
+            follow_range = slice(*np.searchsorted(followers, [start, end]))
+            taste_range = slice(*np.searchsorted(taste_users, [start, end]))
+            mutual = follow_index.counts(followers[follow_range], followings[follow_range], size)
+            common = taste_index.counts(taste_users[taste_range], taste_movies[taste_range], size)
+            rows = self._top_candidates(mutual, common, context)
+            for row in rows:
+                row["user_id"] = int(user_ids[row["user_id"]])
+                row["suggested_user_id"] = int(user_ids[row["suggested_user_id"]])
+                row["created_at"] = created_at
+            yield rows
+            start = end
+
+    def _top_candidates(self, mutual: tuple, common: tuple, context: dict) -> List[dict]:
+        """한 묶음의 (사용자, 후보)별 두 신호를 합쳐 점수 상위 K명"""
+        size = context["size"]
+        mutual_sources, mutual_targets, mutual_counts = mutual
+        taste_sources, taste_targets, common_counts = common
+
+        enough = common_counts >= self.MIN_COMMON_MOVIES
+        taste_sources, taste_targets, common_counts = (
+            taste_sources[enough],
+            taste_targets[enough],
+            common_counts[enough],
+        )
+        movie_counts = context["movie_counts"]
+        jaccard = common_counts / (
+            movie_counts[taste_sources] + movie_counts[taste_targets] - common_counts
+        )
+
+        # (사용자, 후보) 키로 두 신호 합치기
+        mutual_keys = mutual_sources * size + mutual_targets
+        taste_keys = taste_sources * size + taste_targets
+        keys, inverse = np.unique(np.concatenate((mutual_keys, taste_keys)), return_inverse=True)
+        mutual = np.zeros(len(keys), dtype=np.int64)
+        common = np.zeros(len(keys), dtype=np.int64)
+        similarity = np.zeros(len(keys))
+        mutual[inverse[: len(mutual_keys)]] = mutual_counts
+        common[inverse[len(mutual_keys) :]] = common_counts
+        similarity[inverse[len(mutual_keys) :]] = jaccard
+
+        # 자기 자신과 이미 팔로우 중인 사용자 제외
+        sources = keys // size
+        targets = keys % size
+        follow_keys = context["follow_keys"]
+        followed = np.minimum(np.searchsorted(follow_keys, keys), max(len(follow_keys) - 1, 0))
+        already_following = (
+            follow_keys[followed] == keys if len(follow_keys) else np.zeros(len(keys), dtype=bool)
+        )
+        candidate = (sources != targets) & ~already_following
+
+        mutual_scores = self.MUTUAL_WEIGHT * np.log1p(mutual)
+        taste_scores = self.TASTE_WEIGHT * similarity
+        scores = mutual_scores + taste_scores
+
+        positions = np.flatnonzero(candidate)
+        top, ranks = top_k_per_group(sources[positions], scores[positions], self.TOP_K)
+        return [
+            {
+                "user_id": int(sources[position]),
+                "suggested_user_id": int(targets[position]),
+                "rank": int(rank),
+                "score": float(scores[position]),
+                "mutual_follows": int(mutual[position]),
+                "common_movies": int(common[position]),
+                "reason": (
+                    "mutual_follows"
+                    if mutual_scores[position] >= taste_scores[position]
+                    else "taste"
+                ),
+            }
+            for position, rank in zip(positions[top].tolist(), ranks.tolist())
+        ]
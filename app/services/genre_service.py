@@ -1,9 +1,12 @@
 # app/services/genre_service.py
 
+from decimal import Decimal
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, desc
+from sqlalchemy import select, and_, or_
+from app.core.pagination import encode_cursor, decode_cursor
 from app.models.genre import GenreModel
+from app.models.genre_movie_rank import GenreMovieRankModel
 from app.models.movie import MovieModel
 from app.models.movie_genre import MovieGenreModel
 from app.schemas.genre import (
@@ -15,15 +18,18 @@ from app.schemas.genre import (
 )
 from app.schemas.movie import Movie
 from app.database import SessionLocal
+from app.services.genre_stats_service import GenreStatsService
 
 
 class GenreService:
 
-    def __init__(self):
-        pass
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
 
     def _get_db(self) -> Session:
-        """데이터베이스 세션 생성"""
+        """데이터베이스 세션 생성 (요청 단위 세션이 주입되면 재사용)"""
+        if self.db is not None:
+            return self.db
         return SessionLocal()
 
     async def get_all_genres(self) -> GenreListResponse:
@@ -56,9 +62,10 @@ class GenreService:
             db.close()
 
     async def get_movies_by_genre(
-        self, genre_id: int, skip: int = 0, limit: int = 20
+        self, genre_id: int, skip: int = 0, limit: int = 20, cursor: Optional[str] = None
     ) -> GenreMovieListResponse:
-        """특정 장르의 영화 목록 조회"""
+        """특정 장르의 영화 목록 조회 (평점 순위 인덱스 keyset 페이지네이션)"""
+        position = decode_cursor(cursor, Decimal, int)
         db = self._get_db()
         try:
             # 장르 정보 조회
@@ -68,25 +75,44 @@ class GenreService:
 
             genre = self._build_genre_response(genre_model)
 
-            # 해당 장르의 영화 목록 조회
+            # 해당 장르의 영화 목록 조회 (평점 내림차순, 같은 평점은 영화 ID 내림차순)
             movies_stmt = (
-                select(MovieModel)
-                .join(MovieGenreModel, MovieModel.movie_id == MovieGenreModel.movie_id)
-                .where(MovieGenreModel.genre_id == genre_id)
-                .order_by(desc(MovieModel.average_rating))
-                .offset(skip)
-                .limit(limit)
+                select(MovieModel, GenreMovieRankModel.average_rating.label("rank_rating"))
+                .join(GenreMovieRankModel, MovieModel.movie_id == GenreMovieRankModel.movie_id)
+                .where(GenreMovieRankModel.genre_id == genre_id)
+                .order_by(
+                    GenreMovieRankModel.average_rating.desc(), GenreMovieRankModel.movie_id.desc()
+                )
             )
 
-            movies_result = db.execute(movies_stmt)
-            movies = movies_result.scalars().all()
+            if position:
+                rating, movie_id = position
+                movies_stmt = movies_stmt.where(
+                    or_(
+                        GenreMovieRankModel.average_rating < rating,
+                        and_(
+                            GenreMovieRankModel.average_rating == rating,
+                            GenreMovieRankModel.movie_id < movie_id,
+                        ),
+                    )
+                )
+            elif skip:
+                movies_stmt = movies_stmt.offset(skip)
+
+            rows = db.execute(movies_stmt.limit(limit + 1)).all()
+            movie_list = [self._build_movie_response(row.MovieModel) for row in rows[:limit]]
 
-            movie_list = [self._build_movie_response(movie) for movie in movies]
+            next_cursor = None
+            if len(rows) > limit:
+                last = rows[limit - 1]
+                next_cursor = encode_cursor(last.rank_rating, last.MovieModel.movie_id)
 
-            # 총 영화 수
-            total = self._get_genre_movie_count(genre_id, db)
+            # 총 영화 수 (장르 집계)
+            total = GenreStatsService(db).get_movie_count_with_db(genre_id, db)
 
-            return GenreMovieListResponse(genre=genre, movies=movie_list, total=total)
+            return GenreMovieListResponse(
+                genre=genre, movies=movie_list, total=total, next_cursor=next_cursor
+            )
 
         except Exception as e:
             raise Exception(f"장르별 영화 조회 실패: {str(e)}")
@@ -94,29 +120,12 @@ class GenreService:
             db.close()
 
     async def get_genre_stats(self) -> GenreStatsResponse:
-        """장르별 통계 조회"""
+        """장르별 통계 조회 (장르 집계 캐시)"""
         db = self._get_db()
         try:
-            # 장르별 영화 수 조회
-            stmt = (
-                select(
-                    GenreModel.genre_id,
-                    GenreModel.name,
-                    func.count(MovieGenreModel.movie_id).label("movie_count"),
-                )
-                .outerjoin(MovieGenreModel, GenreModel.genre_id == MovieGenreModel.genre_id)
-                .group_by(GenreModel.genre_id, GenreModel.name)
-                .order_by(desc(func.count(MovieGenreModel.movie_id)))
-            )
-
-            result = db.execute(stmt)
-            stats_data = result.all()
-
             genre_stats = [
-                GenreWithMovieCount(
-                    genre_id=row.genre_id, name=row.name, movie_count=row.movie_count or 0
-                )
-                for row in stats_data
+                GenreWithMovieCount(**stats)
+                for stats in GenreStatsService(db).get_stats_with_db(db)
             ]
 
             return GenreStatsResponse(genres=genre_stats, total_genres=len(genre_stats))
@@ -127,30 +136,14 @@ class GenreService:
             db.close()
 
     async def get_popular_genres(self, limit: int = 10) -> List[GenreWithMovieCount]:
-        """인기 장르 조회 (영화 수 기준)"""
+        """인기 장르 조회 (영화 수 기준, 장르 집계 캐시)"""
         db = self._get_db()
         try:
-            stmt = (
-                select(
-                    GenreModel.genre_id,
-                    GenreModel.name,
-                    func.count(MovieGenreModel.movie_id).label("movie_count"),
-                )
-                .join(MovieGenreModel, GenreModel.genre_id == MovieGenreModel.genre_id)
-                .group_by(GenreModel.genre_id, GenreModel.name)
-                .order_by(desc(func.count(MovieGenreModel.movie_id)))
-                .limit(limit)
-            )
-
-            result = db.execute(stmt)
-            popular_data = result.all()
-
             return [
-                GenreWithMovieCount(
-                    genre_id=row.genre_id, name=row.name, movie_count=row.movie_count
-                )
-                for row in popular_data
-            ]
+                GenreWithMovieCount(**stats)
+                for stats in GenreStatsService(db).get_stats_with_db(db)
+                if stats["movie_count"] > 0
+            ][:limit]
 
         except Exception as e:
             raise Exception(f"인기 장르 조회 실패: {str(e)}")
@@ -229,16 +222,6 @@ class GenreService:
         result = db.execute(stmt)
         return result.scalar_one_or_none()
 
-    def _get_genre_movie_count(self, genre_id: int, db: Session) -> int:
-        """장르별 영화 수 조회"""
-        total_stmt = (
-            select(func.count(MovieModel.movie_id))
-            .join(MovieGenreModel, MovieModel.movie_id == MovieGenreModel.movie_id)
-            .where(MovieGenreModel.genre_id == genre_id)
-        )
-        total_result = db.execute(total_stmt)
-        return total_result.scalar() or 0
-
     def _is_movie_genre_connected(self, movie_id: int, genre_id: int, db: Session) -> bool:
         """영화-장르 연결 여부 확인"""
         existing_stmt = select(MovieGenreModel).where(
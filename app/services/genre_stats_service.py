@@ -0,0 +1,375 @@
+# app/services/genre_stats_service.py
+
+import threading
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, List, Optional
+from cachetools import TTLCache
+from sqlalchemy import select, delete, update, insert, func, bindparam, event, inspect, tuple_
+from sqlalchemy.orm import Session
+from app.database import SessionLocal, dialect_insert, route_request
+from app.models.genre import GenreModel
+from app.models.genre_movie_rank import GenreMovieRankModel
+from app.models.genre_stats import GenreStatsModel
+from app.models.movie import MovieModel
+from app.models.movie_genre import MovieGenreModel
+
+# 장르 통계 목록 캐시 (워커 프로세스 단위, 장르 변경 커밋 시 무효화)
+_stats_cache = TTLCache(maxsize=1, ttl=300)
+_stats_cache_lock = threading.Lock()
+
+# 상위 영화 백그라운드 갱신 진행 여부 (워커 프로세스 단위)
+_refreshing = False
+_refresh_lock = threading.Lock()
+
+_ranks = GenreMovieRankModel.__table__
+_stats = GenreStatsModel.__table__
+_count_stmt = (
+    update(_stats)
+    .where(_stats.c.genre_id == bindparam("b_genre_id"))
+    .values(movie_count=_stats.c.movie_count + bindparam("b_delta"), is_stale=True)
+)
+_rating_stmt = (
+    update(_ranks)
+    .where(_ranks.c.movie_id == bindparam("b_movie_id"))
+    .values(average_rating=bindparam("b_rating"))
+)
+
+
+class GenreStatsService:
+    """장르 집계 서비스
+
+    장르별 영화 수와 평점 상위 영화(genre_stats), 장르별 평점 순위(genre_movie_ranks)를
+    영화-장르 연결/영화 평점 변경과 같은 트랜잭션에서 갱신한다(ORM 이벤트).
+    장르 페이지는 이 집계와 순위 인덱스만 읽으므로 movie_genres를 집계하지 않는다.
+    평점 상위 영화는 오래됨(is_stale) 표시만 하고, 조회 경로는 쓰지 않도록
+    별도 세션의 백그라운드 갱신(start_refresh)이 다시 계산한다.
+    전체 재구성(rebuild_all)은 최초 적재와 정합성 점검에만 사용한다.
+    """
+
+    TOP_MOVIES = 10
+
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
+
+    def _get_db(self) -> Session:
+        """데이터베이스 세션 생성 (요청 단위 세션이 주입되면 재사용)"""
+        if self.db is not None:
+            return self.db
+        return SessionLocal()
+
+    def get_stats_with_db(self, db: Session) -> List[dict]:
+        """장르별 집계 목록 (영화 수 내림차순, 캐시 우선)
+
+        상위 영화가 오래된 장르가 있으면 백그라운드 갱신을 시작하고, 갱신 전까지는
+        저장된 상위 영화를 캐시하지 않고 반환한다.
+        """
+        with _stats_cache_lock:
+            cached = _stats_cache.get("all")
+        if cached is not None:
+            return cached
+
+        has_stale = (
+            db.execute(
+                select(GenreStatsModel.genre_id).where(GenreStatsModel.is_stale.is_(True)).limit(1)
+            ).first()
+            is not None
+        )
+        if has_stale:
+            self.start_refresh()
+
+        stmt = (
+            select(
+                GenreModel.genre_id,
+                GenreModel.name,
+                func.coalesce(GenreStatsModel.movie_count, 0).label("movie_count"),
+                GenreStatsModel.top_movies,
+            )
+            .outerjoin(GenreStatsModel, GenreStatsModel.genre_id == GenreModel.genre_id)
+            .order_by(func.coalesce(GenreStatsModel.movie_count, 0).desc(), GenreModel.genre_id)
+        )
+        stats = [
+            {
+                "genre_id": row.genre_id,
+                "name": row.name,
+                "movie_count": row.movie_count,
+                "top_movies": row.top_movies or [],
+            }
+            for row in db.execute(stmt)
+        ]
+
+        if not has_stale:
+            with _stats_cache_lock:
+                _stats_cache["all"] = stats
+        return stats
+
+    def start_refresh(self):
+        """오래된 장르의 평점 상위 영화 백그라운드 갱신 시작 (이미 진행 중이면 무시)"""
+        global _refreshing
+        with _refresh_lock:
+            if _refreshing:
+                return
+            _refreshing = True
+
+        threading.Thread(target=self._refresh_stale, name="genre-stats", daemon=True).start()
+
+    def _refresh_stale(self):
+        """오래된 장르의 평점 상위 영화 재구성 (주 DB, 별도 세션)"""
+        global _refreshing
+        db = SessionLocal()
+        try:
+            with route_request(force_primary=True):
+                stale_ids = (
+                    db.execute(
+                        select(GenreStatsModel.genre_id).where(GenreStatsModel.is_stale.is_(True))
+                    )
+                    .scalars()
+                    .all()
+                )
+                if stale_ids:
+                    self._rebuild_top_movies_with_db(stale_ids, db)
+                    db.commit()
+
+            with _stats_cache_lock:
+                _stats_cache.clear()
+
+        except Exception as e:
+            db.rollback()
+            print(f"장르 상위 영화 갱신 실패: {str(e)}")
+        finally:
+            with _refresh_lock:
+                _refreshing = False
+            db.close()
+
+    def get_movie_count_with_db(self, genre_id: int, db: Session) -> int:
+        """장르별 영화 수"""
+        for stats in self.get_stats_with_db(db):
+            if stats["genre_id"] == genre_id:
+                return stats["movie_count"]
+        return 0
+
+    def _rebuild_top_movies_with_db(self, genre_ids: List[int], db: Session):
+        """장르별 평점 상위 영화 재구성 (순위 인덱스 범위 조회, 커밋은 호출 측에서)"""
+        for genre_id in genre_ids:
+            stmt = (
+                select(
+                    MovieModel.movie_id,
+                    MovieModel.title,
+                    MovieModel.poster_url,
+                    GenreMovieRankModel.average_rating,
+                )
+                .join(MovieModel, MovieModel.movie_id == GenreMovieRankModel.movie_id)
+                .where(GenreMovieRankModel.genre_id == genre_id)
+                .order_by(
+                    GenreMovieRankModel.average_rating.desc(), GenreMovieRankModel.movie_id.desc()
+                )
+                .limit(self.TOP_MOVIES)
+            )
+            top_movies = [
+                {
+                    "movie_id": row.movie_id,
+                    "title": row.title,
+                    "poster_url": row.poster_url,
+                    "average_rating": float(row.average_rating or 0),
+                }
+                for row in db.execute(stmt)
+            ]
+            db.execute(
+                update(GenreStatsModel)
+                .where(GenreStatsModel.genre_id == genre_id)
+                .values(top_movies=top_movies, is_stale=False)
+            )
+
+    def ensure_built(self):
+        """순위 테이블이 비어 있으면 전체 재구성 (최초 배포 시 한 번)"""
+        db = self._get_db()
+        try:
+            is_empty = db.execute(select(GenreMovieRankModel.movie_id).limit(1)).first() is None
+        finally:
+            db.close()
+
+        if is_empty:
+            try:
+                self.rebuild_all()
+            except Exception as e:
+                print(str(e))
+
+    def rebuild_all(self) -> int:
+        """movie_genres + movies에서 순위/집계 전체 재구성, 장르 수 반환"""
+        db = self._get_db()
+        try:
+            with route_request(force_primary=True):
+                db.execute(delete(GenreMovieRankModel))
+                db.execute(
+                    insert(GenreMovieRankModel).from_select(
+                        ["genre_id", "movie_id", "average_rating"],
+                        select(
+                            MovieGenreModel.genre_id,
+                            MovieGenreModel.movie_id,
+                            func.coalesce(MovieModel.average_rating, 0),
+                        ).join(MovieModel, MovieModel.movie_id == MovieGenreModel.movie_id),
+                    )
+                )
+
+                counts = dict(
+                    db.execute(
+                        select(GenreMovieRankModel.genre_id, func.count()).group_by(
+                            GenreMovieRankModel.genre_id
+                        )
+                    ).all()
+                )
+                genre_ids = db.execute(select(GenreModel.genre_id)).scalars().all()
+                db.execute(delete(GenreStatsModel))
+                if genre_ids:
+                    db.execute(
+                        insert(GenreStatsModel),
+                        [
+                            {
+                                "genre_id": genre_id,
+                                "movie_count": counts.get(genre_id, 0),
+                                "top_movies": [],
+                                "is_stale": False,
+                            }
+                            for genre_id in genre_ids
+                        ],
+                    )
+                self._rebuild_top_movies_with_db(genre_ids, db)
+                db.commit()
+
+            with _stats_cache_lock:
+                _stats_cache.clear()
+            print(
+                f"장르 집계 재구성 완료: 장르 {len(genre_ids)}개, 영화 연결 {sum(counts.values())}건"
+            )
+            return len(genre_ids)
+
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"장르 집계 재구성 실패: {str(e)}")
+        finally:
+            db.close()
+
+
+def _rating_changed(movie: MovieModel) -> bool:
+    return inspect(movie).attrs.average_rating.history.has_changes()
+
+
+def _summary_changed(movie: MovieModel) -> bool:
+    """상위 영화 요약에 포함된 필드 변경 여부"""
+    attrs = inspect(movie).attrs
+    return any(
+        getattr(attrs, name).history.has_changes()
+        for name in ("title", "poster_url", "average_rating")
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_genre_aggregates(session, flush_context):
+    """영화-장르 연결/영화 평점 변경을 같은 트랜잭션에서 순위/집계에 반영"""
+    added = []
+    removed = []
+    rated = {}
+    summary_changed = set()
+    genres_changed = False
+    for instance in session.new:
+        if isinstance(instance, MovieGenreModel):
+            added.append((instance.genre_id, instance.movie_id))
+        elif isinstance(instance, GenreModel):
+            genres_changed = True
+    for instance in session.deleted:
+        if isinstance(instance, MovieGenreModel):
+            removed.append((instance.genre_id, instance.movie_id))
+    for instance in session.dirty:
+        if isinstance(instance, GenreModel):
+            genres_changed = True
+        elif isinstance(instance, MovieModel) and _summary_changed(instance):
+            summary_changed.add(instance.movie_id)
+            if _rating_changed(instance):
+                rated[instance.movie_id] = instance.average_rating or Decimal("0.00")
+
+    if genres_changed:
+        session.info["genre_stats_changed"] = True
+    if not added and not removed and not summary_changed:
+        return
+
+    conn = session.connection()
+    deltas: Dict[int, int] = defaultdict(int)
+    if added:
+        movie_ids = {movie_id for _, movie_id in added}
+        ratings = dict(
+            conn.execute(
+                select(MovieModel.movie_id, MovieModel.average_rating).where(
+                    MovieModel.movie_id.in_(movie_ids)
+                )
+            ).all()
+        )
+        rows = [
+            {
+                "genre_id": genre_id,
+                "movie_id": movie_id,
+                "average_rating": ratings.get(movie_id) or 0,
+            }
+            for genre_id, movie_id in added
+        ]
+        stmt = dialect_insert(conn, _ranks).values(rows)
+        conn.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["genre_id", "movie_id"],
+                set_={"average_rating": stmt.excluded.average_rating},
+            )
+        )
+        for genre_id, _ in added:
+            deltas[genre_id] += 1
+    if removed:
+        conn.execute(
+            delete(_ranks).where(tuple_(_ranks.c.genre_id, _ranks.c.movie_id).in_(removed))
+        )
+        for genre_id, _ in removed:
+            deltas[genre_id] -= 1
+
+    if deltas:
+        # 집계 행이 없는 새 장르는 0으로 만든 뒤 증감
+        conn.execute(
+            dialect_insert(conn, _stats)
+            .values(
+                [
+                    {"genre_id": genre_id, "movie_count": 0, "top_movies": [], "is_stale": True}
+                    for genre_id in deltas
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["genre_id"])
+        )
+        conn.execute(
+            _count_stmt,
+            [{"b_genre_id": genre_id, "b_delta": delta} for genre_id, delta in deltas.items()],
+        )
+
+    if rated:
+        conn.execute(
+            _rating_stmt,
+            [{"b_movie_id": movie_id, "b_rating": rating} for movie_id, rating in rated.items()],
+        )
+    if summary_changed:
+        conn.execute(
+            update(_stats)
+            .where(
+                _stats.c.genre_id.in_(
+                    select(_ranks.c.genre_id).where(_ranks.c.movie_id.in_(summary_changed))
+                )
+            )
+            .values(is_stale=True)
+        )
+
+    session.info["genre_stats_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_genre_stats(session):
+    if session.info.pop("genre_stats_changed", False):
+        with _stats_cache_lock:
+            _stats_cache.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_genre_stats_changes(session):
+    session.info.pop("genre_stats_changed", None)
@@ -0,0 +1,353 @@
+# app/services/job_service.py
+
+import asyncio
+import json
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, NamedTuple, Optional
+from sqlalchemy import select, update, and_, or_
+from sqlalchemy.orm import Session
+from app.core.cron import CronSchedule
+from app.database import SessionLocal, dialect_insert
+from app.models.scheduled_job import ScheduledJobModel
+
+JOB_IDLE = "idle"
+JOB_RUNNING = "running"
+
+
+class JobDefinition(NamedTuple):
+    name: str
+    schedule: Optional[str]  # cron 식 (서버 로컬 시각, after를 쓰면 None)
+    description: str
+    method: str  # SchedulerService에서 실행할 메서드 이름 (context 인자를 받음)
+    after: Optional[str] = None  # 이 작업이 끝나면 이어서 실행 (순서가 중요한 작업)
+
+
+def _next_run_at(definition: JobDefinition, now: datetime) -> Optional[datetime]:
+    """다음 실행 일시 (선행 작업에 이어 실행하는 작업은 None)"""
+    if definition.schedule is None:
+        return None
+    return CronSchedule(definition.schedule).next_after(now)
+
+
+class JobCancelled(Exception):
+    """관리자 요청으로 취소된 작업"""
+
+
+class JobContext:
+    """실행 중인 작업의 체크포인트/취소 상태
+
+    작업은 단계(step)별로 결과를 체크포인트에 남기며, 프로세스가 재시작되어 다른 워커가
+    이어받으면 완료된 단계를 건너뛰고 다음 단계부터 실행한다.
+    """
+
+    def __init__(
+        self,
+        job_service: "JobService",
+        job_name: str,
+        checkpoint: Optional[dict],
+        cancel_requested: bool = False,
+    ):
+        self.job_service = job_service
+        self.job_name = job_name
+        self.checkpoint = checkpoint or {}
+        self.cancel_requested = cancel_requested
+
+    async def step(self, name: str, run: Callable[[], Awaitable]):
+        """단계 실행 (체크포인트에 완료 기록이 있으면 저장된 결과 반환)"""
+        steps = self.checkpoint.setdefault("steps", {})
+        if name in steps:
+            print(f"작업 {self.job_name}: 완료된 단계 {name} 건너뜀 (체크포인트)")
+            return steps[name]
+        if self.cancel_requested:
+            raise JobCancelled(self.job_name)
+
+        steps[name] = await run()
+        await asyncio.to_thread(self.job_service.save_checkpoint, self.job_name, self.checkpoint)
+        return steps[name]
+
+
+class JobService:
+    """DB 기반 정기 작업 관리 서비스
+
+    scheduled_jobs 행마다 cron 일정과 다음 실행 일시를 저장한다. 실행할 워커는 조건부
+    UPDATE(실행 중이 아니거나 임대가 만료된 행만)로 임대를 선점하므로 워커가 여러 개여도
+    작업은 한 번만 실행되고, 실행 중에는 LEASE_SECONDS 임대를 주기적으로 연장한다.
+    after가 지정된 작업은 일정 없이 선행 작업이 끝날 때 실행 일시가 잡힌다.
+    """
+
+    LEASE_SECONDS = 300  # 실행 임대 기간 (이 시간 동안 연장이 없으면 다른 워커가 이어받음)
+    HEARTBEAT_INTERVAL = 60  # 임대 연장 주기 (초)
+
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    def _get_db(self) -> Session:
+        """데이터베이스 세션 생성"""
+        if self.db is not None:
+            return self.db
+        return SessionLocal()
+
+    def register(self, definitions: List[JobDefinition]):
+        """작업 행 생성, 코드에서 일정이 바뀐 작업은 다음 실행 일시 재계산"""
+        db = self._get_db()
+        try:
+            now = datetime.now()
+            jobs = ScheduledJobModel.__table__
+            for definition in definitions:
+                scheduled_at = _next_run_at(definition, now)
+                db.execute(
+                    dialect_insert(db, jobs)
+                    .values(
+                        job_name=definition.name,
+                        schedule=definition.schedule,
+                        status=JOB_IDLE,
+                        next_run_at=scheduled_at,
+                        cancel_requested=False,
+                    )
+                    .on_conflict_do_nothing(index_elements=[jobs.c.job_name])
+                )
+                db.execute(
+                    update(ScheduledJobModel)
+                    .where(
+                        and_(
+                            ScheduledJobModel.job_name == definition.name,
+                            ScheduledJobModel.schedule.is_distinct_from(definition.schedule),
+                        )
+                    )
+                    .values(schedule=definition.schedule, next_run_at=scheduled_at)
+                )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"정기 작업 등록 실패: {str(e)}")
+        finally:
+            db.close()
+
+    def list_jobs(self, definitions: List[JobDefinition]) -> List[dict]:
+        """등록된 작업 상태 조회"""
+        db = self._get_db()
+        try:
+            by_name = {definition.name: definition for definition in definitions}
+            stmt = (
+                select(ScheduledJobModel)
+                .where(ScheduledJobModel.job_name.in_(list(by_name)))
+                .order_by(ScheduledJobModel.job_name)
+            )
+            return [
+                {
+                    **self._to_dict(job),
+                    "description": by_name[job.job_name].description,
+                    "after": by_name[job.job_name].after,
+                }
+                for job in db.execute(stmt).scalars()
+            ]
+        except Exception as e:
+            raise Exception(f"정기 작업 조회 실패: {str(e)}")
+        finally:
+            db.close()
+
+    def claim_due_jobs(self, job_names: List[str]) -> List[JobContext]:
+        """실행 시각이 된 작업의 임대 선점 (다른 워커가 선점한 작업은 제외)"""
+        db = self._get_db()
+        try:
+            now = datetime.now()
+            claimed = []
+            for job_name in job_names:
+                result = db.execute(
+                    update(ScheduledJobModel)
+                    .where(
+                        and_(
+                            ScheduledJobModel.job_name == job_name,
+                            ScheduledJobModel.next_run_at <= now,
+                            or_(
+                                ScheduledJobModel.status != JOB_RUNNING,
+                                ScheduledJobModel.lease_expires_at < now,
+                            ),
+                        )
+                    )
+                    .values(
+                        status=JOB_RUNNING,
+                        lease_owner=self.worker_id,
+                        lease_expires_at=now + timedelta(seconds=self.LEASE_SECONDS),
+                        last_started_at=now,
+                    )
+                )
+                db.commit()
+                if result.rowcount != 1:
+                    continue
+
+                job = db.get(ScheduledJobModel, job_name)
+                checkpoint = json.loads(job.checkpoint) if job.checkpoint else None
+                if checkpoint:
+                    print(f"작업 {job_name}: 체크포인트에서 재개")
+                claimed.append(JobContext(self, job_name, checkpoint, job.cancel_requested))
+            return claimed
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"정기 작업 선점 실패: {str(e)}")
+        finally:
+            db.close()
+
+    def heartbeat(self, job_name: str) -> Optional[bool]:
+        """임대 연장 후 취소 요청 여부 반환 (임대를 잃었으면 None)"""
+        db = self._get_db()
+        try:
+            now = datetime.now()
+            result = db.execute(
+                update(ScheduledJobModel)
+                .where(
+                    and_(
+                        ScheduledJobModel.job_name == job_name,
+                        ScheduledJobModel.lease_owner == self.worker_id,
+                    )
+                )
+                .values(lease_expires_at=now + timedelta(seconds=self.LEASE_SECONDS))
+            )
+            db.commit()
+            if result.rowcount != 1:
+                return None
+            return bool(
+                db.execute(
+                    select(ScheduledJobModel.cancel_requested).where(
+                        ScheduledJobModel.job_name == job_name
+                    )
+                ).scalar()
+            )
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"작업 임대 연장 실패: {str(e)}")
+        finally:
+            db.close()
+
+    def save_checkpoint(self, job_name: str, checkpoint: dict):
+        """체크포인트 저장 (임대를 가진 워커만)"""
+        self._update_owned(job_name, checkpoint=json.dumps(checkpoint, default=str))
+
+    def release(self, job_name: str):
+        """종료로 중단된 작업의 임대 반납 (체크포인트는 유지해 다른 워커가 바로 이어받음)"""
+        self._update_owned(job_name, lease_expires_at=datetime.now())
+
+    def finish(
+        self,
+        definition: JobDefinition,
+        last_status: str,
+        error: Optional[str] = None,
+        successors: Optional[List[str]] = None,
+    ):
+        """실행 종료 기록 후 다음 실행 일시 예약 (이어서 실행할 작업은 바로 실행 예약)"""
+        now = datetime.now()
+        self._update_owned(
+            definition.name,
+            status=JOB_IDLE,
+            lease_owner=None,
+            lease_expires_at=None,
+            checkpoint=None,
+            cancel_requested=False,
+            last_finished_at=now,
+            last_status=last_status,
+            last_error=error,
+            next_run_at=_next_run_at(definition, now),
+        )
+        if successors:
+            self._schedule_successors(successors, now)
+
+    def request_run(self, job_name: str):
+        """즉시 실행 예약"""
+        self._update_job(
+            job_name,
+            ScheduledJobModel.status != JOB_RUNNING,
+            "이미 실행 중인 작업입니다",
+            next_run_at=datetime.now(),
+        )
+
+    def request_cancel(self, job_name: str):
+        """실행 중인 작업 취소 요청 (실행 중인 워커가 다음 임대 연장 때 반영)"""
+        self._update_job(
+            job_name,
+            ScheduledJobModel.status == JOB_RUNNING,
+            "실행 중인 작업이 아닙니다",
+            cancel_requested=True,
+        )
+
+    def _schedule_successors(self, job_names: List[str], now: datetime):
+        db = self._get_db()
+        try:
+            db.execute(
+                update(ScheduledJobModel)
+                .where(
+                    and_(
+                        ScheduledJobModel.job_name.in_(job_names),
+                        ScheduledJobModel.status != JOB_RUNNING,
+                    )
+                )
+                .values(next_run_at=now)
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"후속 작업 예약 실패: {str(e)}")
+        finally:
+            db.close()
+
+    def _update_owned(self, job_name: str, **values):
+        db = self._get_db()
+        try:
+            db.execute(
+                update(ScheduledJobModel)
+                .where(
+                    and_(
+                        ScheduledJobModel.job_name == job_name,
+                        ScheduledJobModel.lease_owner == self.worker_id,
+                    )
+                )
+                .values(**values)
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"정기 작업 상태 저장 실패: {str(e)}")
+        finally:
+            db.close()
+
+    def _update_job(self, job_name: str, condition, conflict_message: str, **values):
+        db = self._get_db()
+        try:
+            if db.get(ScheduledJobModel, job_name) is None:
+                raise Exception(f"작업을 찾을 수 없습니다: {job_name}")
+            result = db.execute(
+                update(ScheduledJobModel)
+                .where(and_(ScheduledJobModel.job_name == job_name, condition))
+                .values(**values)
+            )
+            if result.rowcount != 1:
+                raise Exception(conflict_message)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _to_dict(self, job: ScheduledJobModel) -> dict:
+        return {
+            "job_name": job.job_name,
+            "schedule": job.schedule,
+            "status": job.status,
+            "next_run_at": job.next_run_at,
+            "last_started_at": job.last_started_at,
+            "last_finished_at": job.last_finished_at,
+            "last_status": job.last_status,
+            "last_error": job.last_error,
+            "lease_owner": job.lease_owner,
+            "lease_expires_at": job.lease_expires_at,
+            "cancel_requested": job.cancel_requested,
+            "checkpoint": json.loads(job.checkpoint) if job.checkpoint else None,
+        }
+
+
+# 전역 인스턴스
+job_service = JobService()
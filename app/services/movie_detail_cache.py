@@ -0,0 +1,107 @@
+# app/services/movie_detail_cache.py
+
+import threading
+from typing import Dict, Iterable, Optional, Set
+from cachetools import TTLCache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.models.genre import GenreModel
+from app.models.movie import MovieModel
+from app.models.movie_cast import MovieCastModel
+from app.models.movie_genre import MovieGenreModel
+from app.models.person import PersonModel
+
+
+class MovieDetailCache:
+    """영화 상세 문서 캐시 (기본 정보 + 장르 + 출연진/감독)
+
+    사용자별 정보(좋아요/왓치리스트 여부, 좋아요 수)는 포함하지 않는다.
+    영화/장르/출연진/인물 행이 커밋되면 ORM 이벤트로 해당 문서를 무효화하고,
+    다른 워커에서 변경된 행은 TTL이 지나면 다시 조회한다.
+    """
+
+    MAX_SIZE = 5000
+    TTL_SECONDS = 600
+
+    def __init__(self):
+        self._documents = TTLCache(maxsize=self.MAX_SIZE, ttl=self.TTL_SECONDS)
+        self._versions: Dict[int, int] = {}
+        self._movies_by_person: Dict[int, Set[int]] = {}
+        self._lock = threading.Lock()
+
+    def version(self, movie_id: int) -> int:
+        """문서 조회 시작 시점의 무효화 버전"""
+        with self._lock:
+            return self._versions.get(movie_id, 0)
+
+    def get(self, movie_id: int) -> Optional[dict]:
+        with self._lock:
+            return self._documents.get(movie_id)
+
+    def put(self, movie_id: int, document: dict, version: int):
+        """조회 중 무효화가 없었을 때만 문서 저장"""
+        with self._lock:
+            if self._versions.get(movie_id, 0) != version:
+                return
+            self._documents[movie_id] = document
+            for person in document["cast"] + document["crew"]:
+                self._movies_by_person.setdefault(person["person_id"], set()).add(movie_id)
+
+    def invalidate(self, movie_ids: Iterable[int]):
+        with self._lock:
+            for movie_id in movie_ids:
+                self._versions[movie_id] = self._versions.get(movie_id, 0) + 1
+                self._documents.pop(movie_id, None)
+
+    def invalidate_persons(self, person_ids: Iterable[int]):
+        """인물이 포함된 문서 무효화 (이름/프로필 이미지 변경)"""
+        movie_ids = set()
+        with self._lock:
+            for person_id in person_ids:
+                movie_ids |= self._movies_by_person.pop(person_id, set())
+        self.invalidate(movie_ids)
+
+    def clear(self):
+        with self._lock:
+            for movie_id in self._documents.keys():
+                self._versions[movie_id] = self._versions.get(movie_id, 0) + 1
+            self._documents.clear()
+            self._movies_by_person.clear()
+
+
+# 전역 인스턴스
+movie_detail_cache = MovieDetailCache()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_movie_changes(session, flush_context):
+    """flush된 변경 중 영화 상세 문서에 영향을 주는 행 수집"""
+    changes = session.info.setdefault(
+        "movie_detail_changes", {"movies": set(), "persons": set(), "genres": False}
+    )
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, (MovieModel, MovieGenreModel, MovieCastModel)):
+            changes["movies"].add(instance.movie_id)
+        elif isinstance(instance, PersonModel):
+            changes["persons"].add(instance.person_id)
+        elif isinstance(instance, GenreModel):
+            changes["genres"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_movie_details(session):
+    """커밋된 변경에 해당하는 문서 무효화"""
+    changes = session.info.pop("movie_detail_changes", None)
+    if not changes:
+        return
+
+    if changes["genres"]:
+        movie_detail_cache.clear()
+        return
+    movie_detail_cache.invalidate(changes["movies"])
+    movie_detail_cache.invalidate_persons(changes["persons"])
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_movie_changes(session):
+    session.info.pop("movie_detail_changes", None)
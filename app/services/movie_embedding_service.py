@@ -0,0 +1,279 @@
+# app/services/movie_embedding_service.py
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.ai import embed_sentences, sentence_model_dir
+from app.core.vector_index import CURRENT_FILE, VectorIndex, VectorIndexWriter
+from app.database import SessionLocal
+from app.models.genre import GenreModel
+from app.models.movie import MovieModel
+from app.models.movie_cast import MovieCastModel
+from app.models.movie_genre import MovieGenreModel
+from app.models.person import PersonModel
+
+
+class MovieEmbeddingService:
+    """영화 콘텐츠 임베딩 색인 서비스
+
+    제목/장르/주요 출연진·감독/줄거리/AI 리뷰 요약으로 만든 영화 문서를 CPU 문장 임베딩
+    모델로 벡터화해 INDEX_DIR에 memmap 색인(VectorIndex)으로 저장한다.
+    재빌드 시 문서 해시가 같은 영화는 기존 벡터를 복사하고 바뀐 영화만 다시 계산한다.
+    워커 프로세스는 RELOAD_INTERVAL마다 current.json을 확인해 새 빌드를 연다.
+    """
+
+    INDEX_DIR = Path("data/movie_embeddings")
+    BUILD_BATCH_SIZE = 1000
+    EMBED_BATCH_SIZE = 64
+    RELOAD_INTERVAL = 60  # 새 빌드 확인 주기 (초)
+    MAX_CAST = 5
+    OVERVIEW_LENGTH = 1000
+    MAX_TOKENS = 256
+
+    def __init__(self):
+        self._index: Optional[VectorIndex] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_index(self) -> Optional[VectorIndex]:
+        """현재 색인 (다른 프로세스가 새로 빌드했으면 다시 열기, 빌드 전이면 None)"""
+        now = time.monotonic()
+        if now - self._checked_at < self.RELOAD_INTERVAL:
+            return self._index
+
+        with self._lock:
+            self._checked_at = now
+            try:
+                current_path = self.INDEX_DIR / CURRENT_FILE
+                if not current_path.exists():
+                    return self._index
+                build = json.loads(current_path.read_text(encoding="utf-8"))["build"]
+                if self._index is None or self._index.meta.get("build") != build:
+                    self._index = VectorIndex.open(self.INDEX_DIR)
+            except Exception as e:
+                print(f"영화 임베딩 색인 열기 실패: {str(e)}")
+            return self._index
+
+    def similar_movies(self, movie_id: int, limit: int = 10) -> Optional[List[Tuple[int, float]]]:
+        """콘텐츠가 비슷한 영화 (영화 ID, 코사인 유사도) 목록, 색인에 없는 영화면 None"""
+        index = self.get_index()
+        if index is None:
+            return None
+        vector = index.vector(movie_id)
+        if vector is None:
+            return None
+        return index.top_k(vector, limit, exclude_ids=[movie_id])
+
+    def get_similar_movies_with_db(
+        self, movie_id: int, limit: int, db: Session
+    ) -> Optional[List[dict]]:
+        """비슷한 영화 기본 정보 (유사도 순, 색인에 없는 영화면 None)"""
+        similar = self.similar_movies(movie_id, limit)
+        if similar is None:
+            return None
+
+        stmt = select(
+            MovieModel.movie_id, MovieModel.title, MovieModel.poster_url, MovieModel.release_date
+        ).where(MovieModel.movie_id.in_([similar_id for similar_id, _ in similar]))
+        movies = {row.movie_id: row for row in db.execute(stmt)}
+
+        return [
+            {
+                "movie_id": similar_id,
+                "title": movies[similar_id].title,
+                "poster_url": movies[similar_id].poster_url,
+                "release_date": movies[similar_id].release_date,
+                "similarity": round(similarity, 4),
+            }
+            for similar_id, similarity in similar
+            if similar_id in movies
+        ]
+
+    def content_scores(
+        self, watched_movie_ids: Iterable[int], candidate_ids: Iterable[int]
+    ) -> Dict[int, float]:
+        """시청한 영화들의 평균 벡터와 후보 영화의 유사도 (0~1, 색인이 없으면 빈 dict)"""
+        index = self.get_index()
+        if index is None:
+            return {}
+        taste = index.mean_vector(watched_movie_ids)
+        if taste is None:
+            return {}
+        return {
+            movie_id: max(score, 0.0)
+            for movie_id, score in index.scores(taste, candidate_ids).items()
+        }
+
+    def taste_neighbors(
+        self, watched_movie_ids: Iterable[int], limit: int, exclude_ids: Iterable[int] = ()
+    ) -> List[int]:
+        """시청한 영화들의 평균 벡터와 가까운 영화 ID (색인이 없으면 빈 목록)"""
+        index = self.get_index()
+        if index is None:
+            return []
+        taste = index.mean_vector(watched_movie_ids)
+        if taste is None:
+            return []
+        return [movie_id for movie_id, _ in index.top_k(taste, limit, exclude_ids)]
+
+    def rebuild(self) -> dict:
+        """전체 색인 재빌드 (바뀐 영화만 임베딩 계산)"""
+        started = time.perf_counter()
+        previous = VectorIndex.open(self.INDEX_DIR)
+        if previous is not None and previous.meta.get("model") != sentence_model_dir:
+            previous = None  # 모델이 바뀌면 전체 다시 계산
+        writer = VectorIndexWriter(self.INDEX_DIR)
+        db = SessionLocal()
+        embedded = 0
+        try:
+            last_movie_id = None
+            while True:
+                stmt = (
+                    select(
+                        MovieModel.movie_id,
+                        MovieModel.title,
+                        MovieModel.overview,
+                        MovieModel.concise_review,
+                    )
+                    .where(MovieModel.is_adult.is_(False))
+                    .order_by(MovieModel.movie_id)
+                    .limit(self.BUILD_BATCH_SIZE)
+                )
+                if last_movie_id is not None:
+                    stmt = stmt.where(MovieModel.movie_id > last_movie_id)
+                movies = db.execute(stmt).all()
+                if not movies:
+                    break
+                last_movie_id = movies[-1].movie_id
+
+                embedded += self._write_batch_with_db(movies, previous, writer, db)
+                db.expunge_all()
+
+            writer.commit(model=sentence_model_dir, built_at=time.strftime("%Y-%m-%dT%H:%M:%S"))
+            result = {
+                "movies": len(writer),
+                "embedded": embedded,
+                "seconds": round(time.perf_counter() - started, 1),
+            }
+            print(f"영화 임베딩 색인 빌드 완료: {result}")
+            return result
+
+        except Exception as e:
+            writer.abort()
+            raise Exception(f"영화 임베딩 색인 빌드 실패: {str(e)}")
+        finally:
+            db.close()
+            with self._lock:
+                self._checked_at = 0.0
+
+    def _write_batch_with_db(
+        self, movies, previous: Optional[VectorIndex], writer: VectorIndexWriter, db: Session
+    ) -> int:
+        """영화 한 묶음의 벡터 기록 (해시가 같으면 기존 벡터 재사용), 새로 계산한 수 반환"""
+        movie_ids = [movie.movie_id for movie in movies]
+        genres = self._get_genre_names_with_db(movie_ids, db)
+        people = self._get_people_names_with_db(movie_ids, db)
+
+        documents = [
+            self._build_document(movie, genres.get(movie.movie_id, []), people.get(movie.movie_id))
+            for movie in movies
+        ]
+        hashes = [
+            int.from_bytes(hashlib.blake2b(document.encode("utf-8"), digest_size=8).digest(), "big")
+            for document in documents
+        ]
+
+        rows = None
+        reusable = np.zeros(len(movies), dtype=bool)
+        if previous is not None and len(previous):
+            rows = previous.rows(movie_ids)
+            hash_values = np.asarray(hashes, dtype=np.uint64)
+            reusable = (rows >= 0) & (previous.hashes[np.maximum(rows, 0)] == hash_values)
+
+        stale = np.flatnonzero(~reusable)
+        embeddings = self._embed([documents[position] for position in stale])
+        dim = embeddings.shape[1] if len(stale) else previous.dim
+
+        vectors = np.empty((len(movies), dim), dtype=np.float32)
+        if reusable.any():
+            vectors[reusable] = previous.vectors[rows[reusable]]
+        if len(stale):
+            vectors[stale] = embeddings
+
+        writer.append(movie_ids, hashes, vectors)
+        return len(stale)
+
+    def _embed(self, documents: List[str]) -> Optional[np.ndarray]:
+        if not documents:
+            return None
+        return np.concatenate(
+            [
+                embed_sentences(
+                    documents[start : start + self.EMBED_BATCH_SIZE], max_length=self.MAX_TOKENS
+                )
+                for start in range(0, len(documents), self.EMBED_BATCH_SIZE)
+            ]
+        )
+
+    def _build_document(self, movie, genre_names: List[str], people: Optional[dict]) -> str:
+        """임베딩할 영화 문서"""
+        parts = [movie.title]
+        if genre_names:
+            parts.append(f"장르: {', '.join(genre_names)}")
+        if people and people["directors"]:
+            parts.append(f"감독: {', '.join(people['directors'])}")
+        if people and people["cast"]:
+            parts.append(f"출연: {', '.join(people['cast'][: self.MAX_CAST])}")
+        if movie.overview:
+            parts.append(movie.overview[: self.OVERVIEW_LENGTH])
+        if movie.concise_review:
+            parts.append(movie.concise_review)
+        return "\n".join(parts)
+
+    def _get_genre_names_with_db(self, movie_ids: List[int], db: Session) -> Dict[int, List[str]]:
+        stmt = (
+            select(MovieGenreModel.movie_id, GenreModel.name)
+            .join(GenreModel, MovieGenreModel.genre_id == GenreModel.genre_id)
+            .where(MovieGenreModel.movie_id.in_(movie_ids))
+            .order_by(MovieGenreModel.movie_id, GenreModel.genre_id)
+        )
+        genres: Dict[int, List[str]] = {}
+        for movie_id, name in db.execute(stmt):
+            genres.setdefault(movie_id, []).append(name)
+        return genres
+
+    def _get_people_names_with_db(self, movie_ids: List[int], db: Session) -> Dict[int, dict]:
+        """영화별 주요 출연진(배역 순서)과 감독 이름"""
+        stmt = (
+            select(
+                MovieCastModel.movie_id,
+                PersonModel.name,
+                MovieCastModel.department,
+                MovieCastModel.job,
+                MovieCastModel.cast_order,
+            )
+            .join(PersonModel, MovieCastModel.person_id == PersonModel.person_id)
+            .where(MovieCastModel.movie_id.in_(movie_ids))
+        )
+        people: Dict[int, dict] = {}
+        for movie_id, name, department, job, cast_order in db.execute(stmt):
+            entry = people.setdefault(movie_id, {"cast": [], "directors": []})
+            if department == "Acting":
+                entry["cast"].append((cast_order if cast_order is not None else 999, name))
+            elif job == "Director":
+                entry["directors"].append(name)
+
+        for entry in people.values():
+            entry["cast"] = [name for _, name in sorted(entry["cast"])]
+            entry["directors"].sort()
+        return people
+
+
+# 전역 인스턴스
+movie_embedding_service = MovieEmbeddingService()
@@ -0,0 +1,169 @@
+# app/services/movie_retrieval_service.py
+
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from sqlalchemy import select
+from app.core.bm25 import BM25Index
+from app.database import SessionLocal
+from app.models.movie import MovieModel
+
+
+class MovieCandidate(NamedTuple):
+    movie_id: int
+    title: str
+    year: Optional[int]
+    overview: Optional[str]
+    score: float
+
+
+class RetrievalResult(NamedTuple):
+    candidates: List[MovieCandidate]
+    confident: bool
+
+
+class MovieRetrievalService:
+    """로컬 영화 검색 서비스 (findbot 후보 검색)
+
+    제목/원제/줄거리/AI 리뷰 요약을 BM25 색인(BM25Index)으로 워커 프로세스마다 유지한다.
+    상위 후보는 findbot 프롬프트에 함께 전달한다. 1위가 질의 토큰 대부분과 일치하고
+    점수가 기준 점수/최소 점수를 넘으며 2위(없으면 최소 점수)보다 충분히 높으면 confident로
+    표시한다 (모델 호출 생략 여부는 findbot 설정이 결정).
+    색인은 주기적인 전체 빌드로 갱신한다.
+    """
+
+    REBUILD_INTERVAL = 1800  # 전체 재빌드 주기 (초)
+    BUILD_BATCH_SIZE = 5000
+    CANDIDATE_LIMIT = 5
+    OVERVIEW_LENGTH = 300  # 프롬프트에 넣을 줄거리 길이
+
+    # 확실한 일치 기준
+    CONFIDENT_RATIO = (
+        0.6  # 1위 점수 / 기준 점수 (색인에 없는 토큰 포함 모든 질의 토큰이 한 번씩 일치)
+    )
+    CONFIDENT_COVERAGE = 0.6  # 1위 문서에 나타나는 질의 토큰 비율
+    CONFIDENT_MIN_SCORE = 10.0  # 2위가 없거나 점수가 낮을 때 대신 비교할 최소 점수
+    CONFIDENT_MARGIN = 1.5  # 1위 점수 / max(2위 점수, 최소 점수)
+
+    def __init__(self):
+        self._index: Optional[BM25Index] = None
+        self._titles: Dict[int, Tuple[str, Optional[int]]] = {}
+        self._last_build = 0.0
+        self._building = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_ready(self) -> bool:
+        return self._index is not None
+
+    def start_build(self):
+        """백그라운드 전체 빌드 시작 (이미 진행 중이면 무시)"""
+        with self._lock:
+            if self._building:
+                return
+            self._building = True
+            self._last_build = time.monotonic()
+
+        threading.Thread(target=self._build, name="movie-retrieval-index", daemon=True).start()
+
+    def retrieve(self, query: str, limit: int = CANDIDATE_LIMIT) -> RetrievalResult:
+        """단서와 비슷한 로컬 영화 후보 (색인 준비 전이면 빈 목록)"""
+        if self._index is None or time.monotonic() - self._last_build > self.REBUILD_INTERVAL:
+            self.start_build()
+        index, titles = self._index, self._titles
+        if index is None:
+            return RetrievalResult([], False)
+
+        results = index.search(query, limit)
+        if not results:
+            return RetrievalResult([], False)
+
+        overviews = self._get_overviews([movie_id for movie_id, _ in results])
+        candidates = [
+            MovieCandidate(movie_id, *titles[movie_id], overviews.get(movie_id), score)
+            for movie_id, score in results
+            if movie_id in titles
+        ]
+
+        top_id, top_score = results[0]
+        runner_up = results[1][1] if len(results) > 1 else 0.0
+        confident = (
+            top_score >= index.reference_score(query) * self.CONFIDENT_RATIO
+            and top_score >= max(runner_up, self.CONFIDENT_MIN_SCORE) * self.CONFIDENT_MARGIN
+            and index.coverage(query, top_id) >= self.CONFIDENT_COVERAGE
+        )
+        return RetrievalResult(candidates, confident and bool(candidates))
+
+    def _get_overviews(self, movie_ids: List[int]) -> Dict[int, Optional[str]]:
+        """후보 영화 줄거리 조회"""
+        db = SessionLocal()
+        try:
+            rows = db.execute(
+                select(MovieModel.movie_id, MovieModel.overview).where(
+                    MovieModel.movie_id.in_(movie_ids)
+                )
+            )
+            return {movie_id: overview for movie_id, overview in rows}
+        except Exception as e:
+            print(f"후보 영화 줄거리 조회 실패: {str(e)}")
+            return {}
+        finally:
+            db.close()
+
+    def build_prompt_context(self, candidates: List[MovieCandidate]) -> str:
+        """findbot 프롬프트에 덧붙일 후보 목록"""
+        lines = [
+            "다음은 단서와 비슷한 줄거리를 가진 영화 후보입니다. "
+            "찾는 영화가 후보에 있으면 해당 movie_id를 그대로 사용하세요."
+        ]
+        for candidate in candidates:
+            year = f" ({candidate.year})" if candidate.year else ""
+            overview = (candidate.overview or "")[: self.OVERVIEW_LENGTH]
+            lines.append(f"- movie_id={candidate.movie_id} | {candidate.title}{year} | {overview}")
+        return "\n".join(lines)
+
+    def _documents(self, db, titles: Dict[int, Tuple[str, Optional[int]]]):
+        """색인 대상 (영화 ID, 본문) 목록 (제목/개봉 연도는 titles에 함께 저장)"""
+        rows = db.execute(
+            select(
+                MovieModel.movie_id,
+                MovieModel.title,
+                MovieModel.original_title,
+                MovieModel.release_date,
+                MovieModel.overview,
+                MovieModel.concise_review,
+            )
+            .where(MovieModel.is_adult.is_(False))
+            .execution_options(yield_per=self.BUILD_BATCH_SIZE)
+        )
+        for movie_id, title, original_title, release_date, overview, concise_review in rows:
+            titles[movie_id] = (title, release_date.year if release_date else None)
+            fields = (title, original_title, overview, concise_review)
+            yield movie_id, " ".join(field for field in fields if field)
+
+    def _build(self):
+        """전체 색인 빌드 후 교체"""
+        db = SessionLocal()
+        try:
+            started = time.perf_counter()
+            titles: Dict[int, Tuple[str, Optional[int]]] = {}
+            index = BM25Index.build(self._documents(db, titles))
+
+            with self._lock:
+                self._index, self._titles = index, titles
+
+            print(
+                f"영화 후보 검색 색인 빌드 완료: {len(index)}건 "
+                f"({time.perf_counter() - started:.1f}초)"
+            )
+
+        except Exception as e:
+            print(f"영화 후보 검색 색인 빌드 실패: {str(e)}")
+        finally:
+            with self._lock:
+                self._building = False
+            db.close()
+
+
+# 전역 인스턴스
+movie_retrieval_service = MovieRetrievalService()
@@ -1,7 +1,10 @@
-from typing import List, Optional
+import asyncio
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
 from decimal import Decimal
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, or_, exists, literal
+from app.core.pagination import encode_cursor, decode_cursor
 from app.models.movie import MovieModel
 from app.models.genre import GenreModel
 from app.models.movie_genre import MovieGenreModel
@@ -9,62 +12,134 @@ from app.models.movie_cast import MovieCastModel
 from app.models.person import PersonModel
 from app.models.movie_like import MovieLikeModel
 from app.models.watchlist import WatchlistModel
-from app.schemas.movie import Movie, MovieLike, Watchlist, WatchlistMovie
+from app.schemas.movie import Movie, MovieLike, Watchlist, WatchlistMovie, WatchlistMovieCompact
 from app.services.tmdb_service import TMDBService
+from app.services.suggest_service import suggest_service
+from app.services.movie_detail_cache import movie_detail_cache
 from app.database import SessionLocal
 from app.models.comment import CommentModel
 
 
 class MovieService:
 
-    def __init__(self):
+    TMDB_FETCH_CONCURRENCY = 5  # 일괄 조회 시 TMDB 동시 요청 수
+    STREAM_BATCH_SIZE = 500  # 목록 스트리밍 시 한 번에 읽을 행 수
+
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
         self.tmdb_service = TMDBService()
 
     def _get_db(self) -> Session:
-        """데이터베이스 세션 생성"""
+        """데이터베이스 세션 생성 (요청 단위 세션이 주입되면 재사용)"""
+        if self.db is not None:
+            return self.db
         return SessionLocal()
 
     async def get_movie_detail(
         self, movie_id: int, user_id: Optional[int] = None
     ) -> Optional[dict]:
-        """영화 상세 정보 조회"""
+        """영화 상세 정보 조회 (공통 문서는 캐시, 사용자별 정보는 한 번에 조회)"""
         db = self._get_db()
         try:
-            # 1. DB에서 영화 조회
-            movie_model = self._get_movie_model_by_id(movie_id, db)
+            # 1. 영화 상세 문서 (기본 정보 + 장르 + 출연진/감독)
+            document = await self._get_movie_detail_document_with_db(movie_id, db)
+            if document is None:
+                return None
 
-            # 2. DB에 없으면 TMDB에서 가져와서 저장
-            if not movie_model:
-                movie_model = await self._fetch_and_save_from_tmdb_with_db(movie_id, db)
-                if not movie_model:
-                    return None
+            # 2. 좋아요 수 + 사용자 액션 정보 추가
+            movie_dict = dict(document)
+            movie_dict.update(self._get_movie_viewer_state_with_db(movie_id, user_id, db))
 
-            # 3. 영화 기본 정보 구성
-            movie_dict = self._build_movie_detail_dict(movie_model)
+            return movie_dict
 
-            # 4. 장르 정보 추가
-            genres = await self._get_movie_genres_with_db(movie_id, db)
-            movie_dict["genres"] = genres
+        except Exception as e:
+            raise Exception(f"영화 상세 조회 실패: {str(e)}")
+        finally:
+            db.close()
 
-            # 5. 출연진/스태프 정보 추가
-            cast_info = await self._get_movie_cast_info_with_db(movie_id, db, limit_cast=True)
-            movie_dict.update(cast_info)
+    async def get_movie_details_batch(
+        self, movie_ids: List[int], user_id: Optional[int] = None
+    ) -> List[dict]:
+        """여러 영화 상세 정보 일괄 조회 (ID별 상태 포함)"""
+        db = self._get_db()
+        try:
+            movie_ids = list(dict.fromkeys(movie_ids))
+
+            # 1. 캐시된 문서 조회, 나머지는 DB에서 한 번에 조회
+            documents = {}
+            versions = {}
+            for movie_id in movie_ids:
+                document = movie_detail_cache.get(movie_id)
+                if document is not None:
+                    documents[movie_id] = document
+                else:
+                    versions[movie_id] = movie_detail_cache.version(movie_id)
+
+            movie_models = self._get_movie_models_by_ids(list(versions), db) if versions else {}
+
+            # 2. DB에 없는 영화는 TMDB에서 동시에 가져와서 저장
+            errors = {}
+            to_fetch = [movie_id for movie_id in versions if movie_id not in movie_models]
+            if to_fetch:
+                fetched, errors = await self._fetch_movies_from_tmdb(to_fetch)
+                for movie_id, tmdb_data in fetched.items():
+                    movie_model = await self._save_tmdb_movie_with_db(movie_id, tmdb_data, db)
+                    if movie_model:
+                        movie_models[movie_id] = movie_model
+                        versions[movie_id] = movie_detail_cache.version(movie_id)
+                    else:
+                        errors[movie_id] = "영화 정보 저장 실패"
+
+            # 3. 장르/출연진을 한 번에 조회해 문서 구성
+            if movie_models:
+                ids = list(movie_models)
+                genres = self._get_movies_genres_with_db(ids, db)
+                cast_infos = self._get_movies_cast_info_with_db(ids, db, limit_cast=True)
+                for movie_id, movie_model in movie_models.items():
+                    document = self._build_movie_detail_dict(movie_model)
+                    document["genres"] = genres.get(movie_id, [])
+                    document.update(
+                        cast_infos.get(movie_id) or self._build_cast_info([], limit_cast=True)
+                    )
+                    movie_detail_cache.put(movie_id, document, versions[movie_id])
+                    documents[movie_id] = document
+
+            # 4. 좋아요 수 + 사용자 액션 정보 추가
+            viewer_states = (
+                self._get_movies_viewer_state_with_db(list(documents), user_id, db)
+                if documents
+                else {}
+            )
 
-            # 6. 사용자 액션 정보 추가
-            if user_id:
-                movie_dict["is_liked"] = self._is_movie_liked_with_db(user_id, movie_id, db)
-                movie_dict["is_in_watchlist"] = self._is_in_watchlist_with_db(user_id, movie_id, db)
-            else:
-                movie_dict["is_liked"] = False
-                movie_dict["is_in_watchlist"] = False
+            results = []
+            for movie_id in movie_ids:
+                if movie_id in documents:
+                    movie_dict = dict(documents[movie_id])
+                    movie_dict.update(viewer_states.get(movie_id) or self._empty_viewer_state())
+                    results.append({"movie_id": movie_id, "status": "ok", "movie": movie_dict})
+                elif movie_id in errors:
+                    results.append(
+                        {"movie_id": movie_id, "status": "error", "detail": errors[movie_id]}
+                    )
+                else:
+                    results.append({"movie_id": movie_id, "status": "not_found"})
+            return results
 
-            # 7. 좋아요 수 추가
-            movie_dict["likes_count"] = self._get_movie_likes_count_with_db(movie_id, db)
+        except Exception as e:
+            raise Exception(f"영화 일괄 조회 실패: {str(e)}")
+        finally:
+            db.close()
 
-            return movie_dict
+    async def save_tmdb_movie(self, movie_id: int, tmdb_data: dict) -> bool:
+        """미리 가져온 TMDB 상세 정보로 영화 저장 (이미 있으면 건너뜀)"""
+        db = self._get_db()
+        try:
+            if self._get_movie_model_by_id(movie_id, db):
+                return True
+            return await self._save_tmdb_movie_with_db(movie_id, tmdb_data, db) is not None
 
         except Exception as e:
-            raise Exception(f"영화 상세 조회 실패: {str(e)}")
+            raise Exception(f"영화 저장 실패: {str(e)}")
         finally:
             db.close()
 
@@ -169,85 +244,55 @@ class MovieService:
             db.close()
 
     async def get_user_watchlist(
-        self, user_id: int, limit: int = 20, offset: int = 0
-    ) -> list[WatchlistMovie]:
-        """사용자 왓치리스트 조회"""
+        self,
+        user_id: int,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        compact: bool = False,
+    ) -> Tuple[list, Optional[str]]:
+        """사용자 왓치리스트 조회 (추가일 최신순), (목록, 다음 페이지 커서) 반환"""
+        position = decode_cursor(cursor, datetime.fromisoformat, int)
         db = self._get_db()
         try:
-            stmt = (
-                select(
-                    MovieModel.movie_id,
-                    MovieModel.title,
-                    MovieModel.poster_url,
-                    MovieModel.release_date,
-                    MovieModel.average_rating,
-                    WatchlistModel.created_at,
-                )
-                .join(WatchlistModel, MovieModel.movie_id == WatchlistModel.movie_id)
-                .where(WatchlistModel.user_id == user_id)
-                .order_by(WatchlistModel.created_at.desc())
-                .limit(limit)
-                .offset(offset)
+            return self._get_user_movie_page_with_db(
+                WatchlistModel, user_id, limit, offset, position, compact, db
             )
 
-            result = db.execute(stmt)
-            return [
-                WatchlistMovie(
-                    movie_id=row.movie_id,
-                    title=row.title,
-                    poster_url=row.poster_url,
-                    release_date=row.release_date,
-                    average_rating=row.average_rating,
-                    added_at=row.created_at,
-                )
-                for row in result
-            ]
-
         except Exception as e:
             raise Exception(f"왓치리스트 조회 실패: {str(e)}")
         finally:
             db.close()
 
     async def get_user_liked_movies(
-        self, user_id: int, limit: int = 20, offset: int = 0
-    ) -> list[WatchlistMovie]:
-        """사용자가 좋아요한 영화"""
+        self,
+        user_id: int,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        compact: bool = False,
+    ) -> Tuple[list, Optional[str]]:
+        """사용자가 좋아요한 영화 (좋아요 최신순), (목록, 다음 페이지 커서) 반환"""
+        position = decode_cursor(cursor, datetime.fromisoformat, int)
         db = self._get_db()
         try:
-            stmt = (
-                select(
-                    MovieModel.movie_id,
-                    MovieModel.title,
-                    MovieModel.poster_url,
-                    MovieModel.release_date,
-                    MovieModel.average_rating,
-                    MovieLikeModel.created_at,
-                )
-                .join(MovieLikeModel, MovieModel.movie_id == MovieLikeModel.movie_id)
-                .where(MovieLikeModel.user_id == user_id)
-                .order_by(MovieLikeModel.created_at.desc())
-                .limit(limit)
-                .offset(offset)
+            return self._get_user_movie_page_with_db(
+                MovieLikeModel, user_id, limit, offset, position, compact, db
             )
 
-            result = db.execute(stmt)
-            return [
-                WatchlistMovie(
-                    movie_id=row.movie_id,
-                    title=row.title,
-                    poster_url=row.poster_url,
-                    release_date=row.release_date,
-                    average_rating=row.average_rating,
-                    added_at=row.created_at,
-                )
-                for row in result
-            ]
-
         except Exception as e:
             raise Exception(f"좋아요 영화 조회 실패: {str(e)}")
         finally:
             db.close()
 
+    def iter_user_watchlist(self, user_id: int, compact: bool = False) -> Iterator:
+        """사용자 왓치리스트 전체 순회 (NDJSON 스트리밍용)"""
+        return self._iter_user_movies(WatchlistModel, user_id, compact)
+
+    def iter_user_liked_movies(self, user_id: int, compact: bool = False) -> Iterator:
+        """사용자가 좋아요한 영화 전체 순회 (NDJSON 스트리밍용)"""
+        return self._iter_user_movies(MovieLikeModel, user_id, compact)
+
     async def get_all_movies(self, skip: int = 0, limit: int = 100) -> List[Movie]:
         """전체 영화 조회"""
         db = self._get_db()
@@ -325,6 +370,17 @@ class MovieService:
             if not tmdb_data:
                 return None
 
+            return await self._save_tmdb_movie_with_db(movie_id, tmdb_data, db)
+
+        except Exception as e:
+            db.rollback()
+            return None
+
+    async def _save_tmdb_movie_with_db(
+        self, movie_id: int, tmdb_data: dict, db: Session
+    ) -> Optional[MovieModel]:
+        """TMDB 영화 상세 정보를 DB에 저장 (장르, 출연진/스태프 포함)"""
+        try:
             # 영화 정보 저장
             movie_model = MovieModel(
                 movie_id=movie_id,
@@ -343,6 +399,7 @@ class MovieService:
             db.add(movie_model)
             db.commit()
             db.refresh(movie_model)
+            suggest_service.add_movie(movie_model)
 
             # 장르 정보 저장
             await self._save_movie_genres_with_db(movie_id, tmdb_data.get("genres", []), db)
@@ -356,6 +413,29 @@ class MovieService:
             db.rollback()
             return None
 
+    async def _fetch_movies_from_tmdb(
+        self, movie_ids: List[int]
+    ) -> Tuple[Dict[int, dict], Dict[int, str]]:
+        """TMDB 영화 상세 정보 동시 조회 (동시 요청 수 제한)"""
+        semaphore = asyncio.Semaphore(self.TMDB_FETCH_CONCURRENCY)
+
+        async def fetch(movie_id: int) -> dict:
+            async with semaphore:
+                return await self.tmdb_service.get_movie_details(movie_id, language="ko-KR")
+
+        responses = await asyncio.gather(
+            *(fetch(movie_id) for movie_id in movie_ids), return_exceptions=True
+        )
+
+        fetched = {}
+        errors = {}
+        for movie_id, response in zip(movie_ids, responses):
+            if isinstance(response, Exception):
+                errors[movie_id] = str(response)
+            elif response:
+                fetched[movie_id] = response
+        return fetched, errors
+
     async def _save_movie_genres_with_db(self, movie_id: int, genres: List[dict], db: Session):
         """영화 장르 저장"""
         try:
@@ -452,6 +532,7 @@ class MovieService:
                 )
                 db.add(person)
                 db.commit()
+                suggest_service.add_person(person)
 
         except Exception:
             db.rollback()
@@ -495,6 +576,11 @@ class MovieService:
         result = db.execute(stmt)
         return result.scalar_one_or_none()
 
+    def _get_movie_models_by_ids(self, movie_ids: List[int], db: Session) -> Dict[int, MovieModel]:
+        """여러 영화 모델을 한 번에 조회"""
+        stmt = select(MovieModel).where(MovieModel.movie_id.in_(movie_ids))
+        return {movie.movie_id: movie for movie in db.execute(stmt).scalars()}
+
     async def _get_movie_genres_with_db(self, movie_id: int, db: Session) -> List[dict]:
         """영화의 장르 목록 조회"""
         try:
@@ -512,61 +598,251 @@ class MovieService:
         except Exception:
             return []
 
+    def _get_movies_genres_with_db(self, movie_ids: List[int], db: Session) -> Dict[int, list]:
+        """여러 영화의 장르 목록을 한 번에 조회"""
+        stmt = (
+            select(MovieGenreModel.movie_id, GenreModel.genre_id, GenreModel.name)
+            .join(GenreModel, GenreModel.genre_id == MovieGenreModel.genre_id)
+            .where(MovieGenreModel.movie_id.in_(movie_ids))
+        )
+
+        genres_by_movie: Dict[int, list] = {}
+        for row in db.execute(stmt):
+            genres_by_movie.setdefault(row.movie_id, []).append(
+                {"id": row.genre_id, "name": row.name}
+            )
+        return genres_by_movie
+
     async def _get_movie_cast_info_with_db(
         self, movie_id: int, db: Session, limit_cast: bool = False
     ) -> dict:
         """영화의 출연진/감독 조회"""
         try:
-            stmt = (
-                select(
-                    MovieCastModel.person_id,
-                    PersonModel.name,
-                    PersonModel.profile_image_url,
-                    MovieCastModel.character_name,
-                    MovieCastModel.job,
-                    MovieCastModel.department,
-                    MovieCastModel.cast_order,
-                    MovieCastModel.is_main_cast,
+            cast_infos = self._get_movies_cast_info_with_db([movie_id], db, limit_cast)
+            return cast_infos.get(movie_id) or self._build_cast_info([], limit_cast)
+
+        except Exception:
+            return self._build_cast_info([], limit_cast)
+
+    def _get_movies_cast_info_with_db(
+        self, movie_ids: List[int], db: Session, limit_cast: bool = False
+    ) -> Dict[int, dict]:
+        """여러 영화의 출연진/감독을 한 번에 조회"""
+        stmt = (
+            select(
+                MovieCastModel.movie_id,
+                MovieCastModel.person_id,
+                PersonModel.name,
+                PersonModel.profile_image_url,
+                MovieCastModel.character_name,
+                MovieCastModel.job,
+                MovieCastModel.department,
+                MovieCastModel.cast_order,
+                MovieCastModel.is_main_cast,
+            )
+            .join(PersonModel, MovieCastModel.person_id == PersonModel.person_id)
+            .where(MovieCastModel.movie_id.in_(movie_ids))
+            .order_by(MovieCastModel.cast_order.nulls_last())
+        )
+
+        rows_by_movie: Dict[int, list] = {}
+        for row in db.execute(stmt):
+            rows_by_movie.setdefault(row.movie_id, []).append(row)
+
+        return {
+            movie_id: self._build_cast_info(rows, limit_cast)
+            for movie_id, rows in rows_by_movie.items()
+        }
+
+    def _build_cast_info(self, rows: list, limit_cast: bool) -> dict:
+        """출연진/감독 행을 응답 형식으로 구성"""
+        cast_acting = []
+        directors = []
+
+        for row in rows:
+            item = {
+                "person_id": row.person_id,
+                "name": row.name,
+                "profile_image_url": row.profile_image_url,
+                "character_name": row.character_name,
+                "job": row.job,
+                "department": row.department,
+                "cast_order": row.cast_order,
+                "is_main_cast": row.is_main_cast,
+            }
+
+            if row.department == "Acting":
+                cast_acting.append(item)
+            elif row.department == "Directing" and row.job == "Director":
+                directors.append(item)
+
+        # 제한 적용
+        cast_result = cast_acting[:5] if limit_cast else cast_acting
+
+        return {
+            "cast": cast_result,
+            "crew": directors[:1],
+            "cast_total": len(cast_acting),
+            "directors_total": len(directors),
+        }
+
+    async def _get_movie_detail_document_with_db(
+        self, movie_id: int, db: Session
+    ) -> Optional[dict]:
+        """캐시된 영화 상세 문서 조회 (없으면 DB → TMDB 순으로 구성 후 캐시)"""
+        document = movie_detail_cache.get(movie_id)
+        if document is not None:
+            return document
+
+        version = movie_detail_cache.version(movie_id)
+        movie_model = self._get_movie_model_by_id(movie_id, db)
+
+        # DB에 없으면 TMDB에서 가져와서 저장
+        if not movie_model:
+            movie_model = await self._fetch_and_save_from_tmdb_with_db(movie_id, db)
+            if not movie_model:
+                return None
+            version = movie_detail_cache.version(movie_id)
+
+        document = self._build_movie_detail_dict(movie_model)
+        document["genres"] = await self._get_movie_genres_with_db(movie_id, db)
+        document.update(await self._get_movie_cast_info_with_db(movie_id, db, limit_cast=True))
+
+        movie_detail_cache.put(movie_id, document, version)
+        return document
+
+    def _get_movie_viewer_state_with_db(
+        self, movie_id: int, user_id: Optional[int], db: Session
+    ) -> dict:
+        """좋아요 수와 사용자의 좋아요/왓치리스트 여부를 한 번에 조회"""
+        viewer_states = self._get_movies_viewer_state_with_db([movie_id], user_id, db)
+        return viewer_states.get(movie_id) or self._empty_viewer_state()
+
+    def _get_movies_viewer_state_with_db(
+        self, movie_ids: List[int], user_id: Optional[int], db: Session
+    ) -> Dict[int, dict]:
+        """여러 영화의 좋아요 수와 사용자의 좋아요/왓치리스트 여부를 한 번에 조회"""
+        likes_count = (
+            select(func.count(MovieLikeModel.user_id))
+            .where(MovieLikeModel.movie_id == MovieModel.movie_id)
+            .scalar_subquery()
+        )
+        if user_id:
+            is_liked = exists().where(
+                and_(
+                    MovieLikeModel.user_id == user_id,
+                    MovieLikeModel.movie_id == MovieModel.movie_id,
                 )
-                .join(PersonModel, MovieCastModel.person_id == PersonModel.person_id)
-                .where(MovieCastModel.movie_id == movie_id)
-                .order_by(MovieCastModel.cast_order.nulls_last())
             )
+            is_in_watchlist = exists().where(
+                and_(
+                    WatchlistModel.user_id == user_id,
+                    WatchlistModel.movie_id == MovieModel.movie_id,
+                )
+            )
+        else:
+            is_liked = is_in_watchlist = literal(False)
 
-            rows = db.execute(stmt).fetchall()
-
-            cast_acting = []
-            directors = []
-
-            for row in rows:
-                item = {
-                    "person_id": row.person_id,
-                    "name": row.name,
-                    "profile_image_url": row.profile_image_url,
-                    "character_name": row.character_name,
-                    "job": row.job,
-                    "department": row.department,
-                    "cast_order": row.cast_order,
-                    "is_main_cast": row.is_main_cast,
-                }
-
-                if row.department == "Acting":
-                    cast_acting.append(item)
-                elif row.department == "Directing" and row.job == "Director":
-                    directors.append(item)
-
-            # 제한 적용
-            cast_result = cast_acting[:5] if limit_cast else cast_acting
-
-            return {
-                "cast": cast_result,
-                "crew": directors[:1],
-                "cast_total": len(cast_acting),
-                "directors_total": len(directors),
+        stmt = select(
+            MovieModel.movie_id,
+            likes_count.label("likes_count"),
+            is_liked.label("is_liked"),
+            is_in_watchlist.label("is_in_watchlist"),
+        ).where(MovieModel.movie_id.in_(movie_ids))
+
+        return {
+            row.movie_id: {
+                "is_liked": bool(row.is_liked),
+                "is_in_watchlist": bool(row.is_in_watchlist),
+                "likes_count": row.likes_count or 0,
             }
+            for row in db.execute(stmt)
+        }
 
-        except Exception:
-            return {"cast": [], "crew": [], "cast_total": 0, "directors_total": 0}
+    def _user_movies_stmt(self, model, user_id: int, compact: bool):
+        """왓치리스트/좋아요 목록 쿼리 (추가일, 영화 ID 내림차순)"""
+        if compact:
+            columns = [MovieModel.movie_id, MovieModel.poster_url, model.created_at]
+        else:
+            columns = [
+                MovieModel.movie_id,
+                MovieModel.title,
+                MovieModel.poster_url,
+                MovieModel.release_date,
+                MovieModel.average_rating,
+                model.created_at,
+            ]
+        return (
+            select(*columns)
+            .join(model, MovieModel.movie_id == model.movie_id)
+            .where(model.user_id == user_id)
+            .order_by(model.created_at.desc(), model.movie_id.desc())
+        )
+
+    def _get_user_movie_page_with_db(
+        self,
+        model,
+        user_id: int,
+        limit: int,
+        offset: int,
+        position: Optional[list],
+        compact: bool,
+        db: Session,
+    ) -> Tuple[list, Optional[str]]:
+        """왓치리스트/좋아요 목록 한 페이지 (커서 위치가 있으면 keyset, 없으면 offset)"""
+        stmt = self._user_movies_stmt(model, user_id, compact)
+
+        if position:
+            created_at, movie_id = position
+            stmt = stmt.where(
+                or_(
+                    model.created_at < created_at,
+                    and_(model.created_at == created_at, model.movie_id < movie_id),
+                )
+            )
+        elif offset:
+            stmt = stmt.offset(offset)
+
+        rows = db.execute(stmt.limit(limit + 1)).all()
+        items = [self._build_user_movie_item(row, compact) for row in rows[:limit]]
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last.created_at.isoformat(), last.movie_id)
+        return items, next_cursor
+
+    def _iter_user_movies(self, model, user_id: int, compact: bool) -> Iterator:
+        """목록 전체를 yield_per 단위로 읽으며 순회
+
+        응답 전송 중에 순회되므로 요청 세션 대신 자체 세션을 사용한다.
+        """
+        db = SessionLocal()
+        try:
+            stmt = self._user_movies_stmt(model, user_id, compact).execution_options(
+                yield_per=self.STREAM_BATCH_SIZE
+            )
+            for row in db.execute(stmt):
+                yield self._build_user_movie_item(row, compact)
+        finally:
+            db.close()
+
+    def _build_user_movie_item(self, row, compact: bool):
+        if compact:
+            return WatchlistMovieCompact(
+                movie_id=row.movie_id, poster_url=row.poster_url, added_at=row.created_at
+            )
+        return WatchlistMovie(
+            movie_id=row.movie_id,
+            title=row.title,
+            poster_url=row.poster_url,
+            release_date=row.release_date,
+            average_rating=row.average_rating,
+            added_at=row.created_at,
+        )
+
+    def _empty_viewer_state(self) -> dict:
+        return {"is_liked": False, "is_in_watchlist": False, "likes_count": 0}
 
     def _is_movie_liked_with_db(self, user_id: int, movie_id: int, db: Session) -> bool:
         """좋아요 여부 확인"""
@@ -0,0 +1,301 @@
+# app/services/person_credits_service.py
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import select, update, or_, inspect, event
+from sqlalchemy.orm import Session
+from app.database import SessionLocal, dialect_insert
+from app.models.movie import MovieModel
+from app.models.movie_cast import MovieCastModel
+from app.models.person_credits import PersonCreditsModel
+from app.services.movie_detail_cache import movie_detail_cache
+from app.services.suggest_service import suggest_service
+from app.services.tmdb_service import TMDBService
+
+# 진행 중인 백그라운드 동기화 (워커 프로세스 단위)
+_sync_running: Set[int] = set()
+_sync_tasks: Set[asyncio.Task] = set()
+
+
+class PersonCreditsService:
+    """인물 출연작 문서 서비스
+
+    TMDB 출연작 전체를 백그라운드에서 movies/movie_casts에 일괄 저장하고,
+    인물별 작품 목록을 개봉일 역순으로 정렬한 문서(person_credits)로 미리 구성한다.
+    출연진이나 영화 정보가 바뀌면 문서를 stale로 표시하고 다음 조회 시 다시 구성한다.
+    """
+
+    # 저장할 주요 스태프 역할
+    MAIN_CREW_JOBS = (
+        "Director",
+        "Producer",
+        "Executive Producer",
+        "Screenplay",
+        "Story",
+        "Director of Photography",
+    )
+    INSERT_BATCH_SIZE = 500
+    SYNC_CONCURRENCY = 3
+
+    _sync_semaphore: Optional[asyncio.Semaphore] = None
+
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
+        self.tmdb_service = TMDBService()
+
+    def _get_db(self) -> Session:
+        """데이터베이스 세션 생성 (요청 단위 세션이 주입되면 재사용)"""
+        if self.db is not None:
+            return self.db
+        return SessionLocal()
+
+    def rebuild_document_with_db(
+        self, person_id: int, db: Session, synced_at: Optional[datetime] = None
+    ) -> dict:
+        """movie_casts + movies에서 출연작 문서를 구성해 저장 (커밋은 호출 측에서)"""
+        stmt = (
+            select(
+                MovieCastModel.movie_id,
+                MovieModel.title,
+                MovieModel.poster_url,
+                MovieModel.release_date,
+                MovieCastModel.character_name,
+                MovieCastModel.job,
+                MovieCastModel.department,
+                MovieCastModel.is_main_cast,
+                MovieCastModel.cast_order,
+            )
+            .select_from(MovieCastModel)
+            .outerjoin(MovieModel, MovieCastModel.movie_id == MovieModel.movie_id)
+            .where(MovieCastModel.person_id == person_id)
+        )
+
+        acting_credits = []
+        crew_credits = []
+        for row in sorted(db.execute(stmt), key=self._credit_sort_key):
+            credit = {
+                "movie_id": row.movie_id,
+                "movie_title": row.title or f"영화 {row.movie_id}",
+                "movie_poster_url": row.poster_url,
+                "release_date": row.release_date.isoformat() if row.release_date else None,
+                "character_name": row.character_name,
+                "job": row.job,
+                "department": row.department,
+                "is_main_cast": bool(row.is_main_cast),
+            }
+            if row.department == "Acting":
+                acting_credits.append(credit)
+            else:
+                crew_credits.append(credit)
+
+        document = {
+            "acting_credits": acting_credits,
+            "crew_credits": crew_credits,
+            "total_movies": len(acting_credits) + len(crew_credits),
+        }
+
+        values = dict(document, is_stale=False, updated_at=datetime.now())
+        if synced_at is not None:
+            values["synced_at"] = synced_at
+        stmt = dialect_insert(db, PersonCreditsModel.__table__).values(
+            person_id=person_id, **values
+        )
+        db.execute(stmt.on_conflict_do_update(index_elements=["person_id"], set_=values))
+
+        return document
+
+    def _credit_sort_key(self, row) -> Tuple[bool, int, int]:
+        """개봉일 역순 (개봉일 없는 작품은 마지막), 같은 날은 배역 순서"""
+        release_ordinal = row.release_date.toordinal() if row.release_date else 0
+        cast_order = row.cast_order if row.cast_order is not None else 999
+        return row.release_date is None, -release_ordinal, cast_order
+
+    def schedule_sync(self, person_id: int):
+        """TMDB 출연작 동기화를 백그라운드 작업으로 예약 (이미 진행 중이면 무시)"""
+        if person_id in _sync_running:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        _sync_running.add(person_id)
+        task = loop.create_task(self._run_sync(person_id))
+        _sync_tasks.add(task)
+        task.add_done_callback(_sync_tasks.discard)
+
+    async def _run_sync(self, person_id: int):
+        """요청 세션과 분리된 세션으로 동기화 실행 (동시 실행 수 제한)"""
+        if PersonCreditsService._sync_semaphore is None:
+            PersonCreditsService._sync_semaphore = asyncio.Semaphore(self.SYNC_CONCURRENCY)
+
+        try:
+            async with PersonCreditsService._sync_semaphore:
+                synced = await PersonCreditsService().sync_from_tmdb(person_id)
+                print(f"인물 {person_id} 출연작 동기화 완료: {synced}편")
+        except Exception as e:
+            print(f"인물 {person_id} 출연작 동기화 실패: {str(e)}")
+        finally:
+            _sync_running.discard(person_id)
+
+    async def sync_from_tmdb(self, person_id: int) -> int:
+        """TMDB 출연작 전체를 일괄 저장하고 문서 재구성, 저장한 작품 수 반환"""
+        credits_data = await self.tmdb_service.get_person_movie_credits(person_id)
+        if not credits_data:
+            return 0
+
+        db = self._get_db()
+        try:
+            movies, casts = self._collect_credits(person_id, credits_data)
+            new_movies = self._insert_movies_with_db(movies, db)
+            self._insert_casts_with_db(list(casts.values()), db)
+            self.rebuild_document_with_db(person_id, db, synced_at=datetime.now())
+            db.commit()
+
+            # ORM 이벤트를 거치지 않는 일괄 INSERT이므로 직접 반영
+            movie_detail_cache.invalidate(casts.keys())
+            for movie in new_movies:
+                suggest_service.add_movie(MovieModel(**movie))
+
+            return len(casts)
+
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"출연작 저장 실패: {str(e)}")
+        finally:
+            db.close()
+
+    def _collect_credits(
+        self, person_id: int, credits_data: dict
+    ) -> Tuple[Dict[int, dict], Dict[int, dict]]:
+        """TMDB 출연작 응답을 영화/출연진 행으로 변환 (영화당 1행, 출연 우선)"""
+        movies: Dict[int, dict] = {}
+        casts: Dict[int, dict] = {}
+
+        credits = [(credit, True) for credit in credits_data.get("cast", [])]
+        credits += [
+            (credit, False)
+            for credit in credits_data.get("crew", [])
+            if credit.get("job") in self.MAIN_CREW_JOBS
+        ]
+
+        for credit, is_acting in credits:
+            movie_id = credit.get("id")
+            if not movie_id or movie_id in casts:
+                continue
+
+            movies[movie_id] = {
+                "movie_id": movie_id,
+                "title": credit.get("title", ""),
+                "release_date": self._parse_date(credit.get("release_date")),
+                "poster_url": self._build_image_url(credit.get("poster_path"), "w500"),
+                "average_rating": Decimal("0.0"),
+                "is_adult": bool(credit.get("adult", False)),
+            }
+
+            if is_acting:
+                cast_order = credit.get("order", 999)
+                casts[movie_id] = {
+                    "movie_id": movie_id,
+                    "person_id": person_id,
+                    "character_name": credit.get("character"),
+                    "job": "Actor",
+                    "department": "Acting",
+                    "cast_order": cast_order,
+                    "is_main_cast": cast_order < 10,
+                }
+            else:
+                casts[movie_id] = {
+                    "movie_id": movie_id,
+                    "person_id": person_id,
+                    "character_name": None,
+                    "job": credit.get("job"),
+                    "department": credit.get("department"),
+                    "cast_order": None,
+                    "is_main_cast": credit.get("job") in ["Director", "Producer"],
+                }
+
+        return movies, casts
+
+    def _insert_movies_with_db(self, movies: Dict[int, dict], db: Session) -> List[dict]:
+        """DB에 없는 영화 기본 정보 일괄 저장, 새로 저장한 영화 반환"""
+        if not movies:
+            return []
+
+        existing = set()
+        movie_ids = list(movies)
+        for start in range(0, len(movie_ids), self.INSERT_BATCH_SIZE):
+            chunk = movie_ids[start : start + self.INSERT_BATCH_SIZE]
+            existing.update(
+                db.execute(select(MovieModel.movie_id).where(MovieModel.movie_id.in_(chunk)))
+                .scalars()
+                .all()
+            )
+
+        new_movies = [movie for movie_id, movie in movies.items() if movie_id not in existing]
+        for start in range(0, len(new_movies), self.INSERT_BATCH_SIZE):
+            stmt = dialect_insert(db, MovieModel.__table__).values(
+                new_movies[start : start + self.INSERT_BATCH_SIZE]
+            )
+            db.execute(stmt.on_conflict_do_nothing(index_elements=["movie_id"]))
+
+        return new_movies
+
+    def _insert_casts_with_db(self, casts: List[dict], db: Session):
+        """movie_casts 일괄 저장 (영화 저장 시 함께 저장된 기존 행은 유지)"""
+        for start in range(0, len(casts), self.INSERT_BATCH_SIZE):
+            stmt = dialect_insert(db, MovieCastModel.__table__).values(
+                casts[start : start + self.INSERT_BATCH_SIZE]
+            )
+            db.execute(stmt.on_conflict_do_nothing(index_elements=["movie_id", "person_id"]))
+
+    def _parse_date(self, date_str: Optional[str]):
+        if not date_str:
+            return None
+        try:
+            return datetime.strptime(date_str, "%Y-%m-%d").date()
+        except:
+            return None
+
+    def _build_image_url(self, path: Optional[str], size: str) -> Optional[str]:
+        return f"https://image.tmdb.org/t/p/{size}{path}" if path else None
+
+
+def _credit_fields_changed(movie: MovieModel) -> bool:
+    """출연작 문서에 포함된 영화 필드 변경 여부"""
+    attrs = inspect(movie).attrs
+    return any(
+        getattr(attrs, name).history.has_changes()
+        for name in ("title", "poster_url", "release_date")
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_person_credits_stale(session, flush_context):
+    """출연진 또는 영화 정보가 바뀐 인물의 출연작 문서를 stale로 표시"""
+    person_ids = set()
+    movie_ids = set()
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, MovieCastModel):
+            person_ids.add(instance.person_id)
+        elif isinstance(instance, MovieModel) and instance in session.dirty:
+            if _credit_fields_changed(instance):
+                movie_ids.add(instance.movie_id)
+
+    if not person_ids and not movie_ids:
+        return
+
+    conditions = []
+    if person_ids:
+        conditions.append(PersonCreditsModel.person_id.in_(person_ids))
+    if movie_ids:
+        conditions.append(
+            PersonCreditsModel.person_id.in_(
+                select(MovieCastModel.person_id).where(MovieCastModel.movie_id.in_(movie_ids))
+            )
+        )
+    session.connection().execute(
+        update(PersonCreditsModel.__table__).where(or_(*conditions)).values(is_stale=True)
+    )
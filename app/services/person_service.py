@@ -2,11 +2,10 @@
 
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, and_, desc, or_
+from sqlalchemy import select, and_, desc, or_
 from app.models.person import PersonModel
 from app.models.person_follow import PersonFollowModel
-from app.models.movie_cast import MovieCastModel
-from app.models.movie import MovieModel
+from app.models.person_credits import PersonCreditsModel
 from app.schemas.person import (
     Person,
     PersonFollow,
@@ -18,15 +17,22 @@ from app.schemas.person import (
 )
 from app.services.tmdb_service import TMDBService
 from app.database import SessionLocal
+from app.services.search_index_service import person_search_index
+from app.services.suggest_service import suggest_service
+from app.services.person_credits_service import PersonCreditsService
+from app.services.counter_service import CounterService
 
 
 class PersonService:
 
-    def __init__(self):
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
         self.tmdb_service = TMDBService()
 
     def _get_db(self) -> Session:
-        """데이터베이스 세션 생성"""
+        """데이터베이스 세션 생성 (요청 단위 세션이 주입되면 재사용)"""
+        if self.db is not None:
+            return self.db
         return SessionLocal()
 
     async def get_person_by_id(
@@ -61,25 +67,51 @@ class PersonService:
             db.close()
 
     async def get_person_credits(self, person_id: int) -> PersonCreditsResponse:
-        """인물의 영화 출연 작품 조회"""
+        """인물의 영화 출연 작품 조회 (미리 구성된 출연작 문서를 키로 조회)"""
         db = self._get_db()
         try:
-            person = await self._get_person_basic_info(person_id, db)
-            if not person:
+            stmt = (
+                select(
+                    PersonModel,
+                    PersonCreditsModel.acting_credits,
+                    PersonCreditsModel.crew_credits,
+                    PersonCreditsModel.total_movies,
+                    PersonCreditsModel.is_stale,
+                    PersonCreditsModel.synced_at,
+                )
+                .outerjoin(
+                    PersonCreditsModel, PersonCreditsModel.person_id == PersonModel.person_id
+                )
+                .where(PersonModel.person_id == person_id)
+            )
+            row = db.execute(stmt).one_or_none()
+            if not row:
                 raise Exception("존재하지 않는 인물입니다")
 
-            # 출연 작품 조회
-            acting_credits = self._get_person_acting_credits(person_id, db)
-            # 스태프 참여 작품 조회
-            crew_credits = self._get_person_crew_credits(person_id, db)
+            followers_count = self._get_person_followers_count_with_db(person_id, db)
+            person = self._build_person_response(row.PersonModel, False, followers_count)
+            credits_service = PersonCreditsService(db)
 
-            total_movies = len(acting_credits) + len(crew_credits)
+            # 문서가 없거나 출연진/영화 변경으로 stale이면 다시 구성
+            if row.total_movies is None or row.is_stale:
+                document = credits_service.rebuild_document_with_db(person_id, db)
+                db.commit()
+            else:
+                document = {
+                    "acting_credits": row.acting_credits,
+                    "crew_credits": row.crew_credits,
+                    "total_movies": row.total_movies,
+                }
+
+            # TMDB 전체 출연작을 아직 저장하지 않은 인물은 백그라운드 동기화
+            if row.synced_at is None:
+                credits_service.schedule_sync(person_id)
 
             return PersonCreditsResponse(
                 person=person,
-                acting_credits=acting_credits,
-                crew_credits=crew_credits,
-                total_movies=total_movies,
+                acting_credits=[MovieCredit(**credit) for credit in document["acting_credits"]],
+                crew_credits=[MovieCredit(**credit) for credit in document["crew_credits"]],
+                total_movies=document["total_movies"],
             )
 
         except Exception as e:
@@ -184,7 +216,7 @@ class PersonService:
     async def _update_person_details_from_tmdb_with_db(
         self, person_id: int, existing_person: Optional[PersonModel], db: Session
     ) -> Optional[PersonModel]:
-        """TMDB에서 인물 상세 정보로 업데이트 + 영화 기본 정보와 movie_cast 저장"""
+        """TMDB에서 인물 상세 정보로 업데이트 + 출연작 동기화 예약"""
         try:
             # 1. TMDB에서 인물 상세 정보 조회
             tmdb_data = await self.tmdb_service.get_person_details(person_id)
@@ -203,9 +235,10 @@ class PersonService:
                 db.add(person_model)
                 db.commit()
                 db.refresh(person_model)
+            suggest_service.add_person(person_model)
 
-            # 3. 영화 기본 정보 + movie_cast 저장
-            await self._save_person_movie_cast_with_movie_basic_db(person_id, db)
+            # 3. 전체 출연작(영화 기본 정보 + movie_cast)은 백그라운드에서 일괄 저장
+            PersonCreditsService(db).schedule_sync(person_id)
 
             return person_model
 
@@ -213,143 +246,6 @@ class PersonService:
             db.rollback()
             return existing_person
 
-    async def _save_person_movie_cast_with_movie_basic_db(self, person_id: int, db: Session):
-        """영화 기본 정보 + movie_cast 저장"""
-        try:
-            # TMDB에서 인물의 영화 출연 정보 조회
-            credits_data = await self.tmdb_service.get_person_movie_credits(person_id)
-            if not credits_data:
-                return
-
-            # 출연 작품 저장 (상위 30편까지)
-            cast_credits = credits_data.get("cast", [])
-            for cast in cast_credits[:30]:
-                movie_id = cast.get("id")
-                if not movie_id:
-                    continue
-
-                # 영화 기본 정보 저장
-                await self._ensure_movie_basic_info_db(
-                    movie_id=movie_id,
-                    title=cast.get("title", ""),
-                    poster_path=cast.get("poster_path"),
-                    release_date=cast.get("release_date"),
-                    db=db,
-                )
-
-                # movie_cast 연결 저장
-                await self._ensure_movie_cast_connection_db(
-                    movie_id=movie_id,
-                    person_id=person_id,
-                    character_name=cast.get("character"),
-                    job="Actor",
-                    department="Acting",
-                    cast_order=cast.get("order", 999),
-                    is_main_cast=cast.get("order", 999) < 10,
-                    db=db,
-                )
-
-            # 스태프 참여 작품 저장
-            crew_credits = credits_data.get("crew", [])
-            for crew in crew_credits:
-                movie_id = crew.get("id")
-                if not movie_id:
-                    continue
-
-                # 주요 역할만 저장
-                if crew.get("job") in [
-                    "Director",
-                    "Producer",
-                    "Executive Producer",
-                    "Screenplay",
-                    "Story",
-                    "Director of Photography",
-                ]:
-                    # 영화 기본 정보 저장
-                    await self._ensure_movie_basic_info_db(
-                        movie_id=movie_id,
-                        title=crew.get("title", ""),
-                        poster_path=crew.get("poster_path"),
-                        release_date=crew.get("release_date"),
-                        db=db,
-                    )
-
-                    # movie_cast 연결 저장
-                    await self._ensure_movie_cast_connection_db(
-                        movie_id=movie_id,
-                        person_id=person_id,
-                        character_name=None,
-                        job=crew.get("job"),
-                        department=crew.get("department"),
-                        cast_order=None,
-                        is_main_cast=crew.get("job") in ["Director", "Producer"],
-                        db=db,
-                    )
-
-        except Exception:
-            pass
-
-    async def _ensure_movie_basic_info_db(
-        self,
-        movie_id: int,
-        title: str,
-        poster_path: Optional[str],
-        release_date: Optional[str],
-        db: Session,
-    ):
-        """영화 기본 정보만 저장"""
-        try:
-            if not self._movie_exists(movie_id, db):
-                from decimal import Decimal
-
-                basic_movie = MovieModel(
-                    movie_id=movie_id,
-                    title=title,
-                    original_title=None,
-                    overview=None,
-                    release_date=self._parse_date(release_date),
-                    runtime=None,
-                    poster_url=self._build_image_url(poster_path, "w500"),
-                    backdrop_url=None,
-                    average_rating=Decimal("0.0"),
-                    is_adult=False,
-                    trailer_url=None,
-                )
-                db.add(basic_movie)
-                db.commit()
-
-        except Exception:
-            db.rollback()
-
-    async def _ensure_movie_cast_connection_db(
-        self,
-        movie_id: int,
-        person_id: int,
-        character_name: Optional[str],
-        job: Optional[str],
-        department: Optional[str],
-        cast_order: Optional[int],
-        is_main_cast: bool,
-        db: Session,
-    ):
-        """movie_cast 연결 중복 체크 후 저장"""
-        try:
-            if not self._movie_cast_connection_exists(movie_id, person_id, job, db):
-                new_cast = MovieCastModel(
-                    movie_id=movie_id,
-                    person_id=person_id,
-                    character_name=character_name,
-                    job=job,
-                    department=department,
-                    cast_order=cast_order,
-                    is_main_cast=is_main_cast,
-                )
-                db.add(new_cast)
-                db.commit()
-
-        except Exception:
-            db.rollback()
-
     async def _search_persons_from_tmdb(self, query: str, limit: int) -> List[Person]:
         """TMDB에서 인물 검색하고 DB에 저장"""
         try:
@@ -379,111 +275,41 @@ class PersonService:
         result = db.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def _get_person_basic_info(self, person_id: int, db: Session) -> Optional[Person]:
-        """인물 기본 정보 조회"""
-        person_model = self._get_person_model_by_id(person_id, db)
-        if not person_model:
-            return None
-
-        followers_count = self._get_person_followers_count_with_db(person_id, db)
-        return self._build_person_response(person_model, False, followers_count)
-
-    def _get_person_acting_credits(self, person_id: int, db: Session) -> List[MovieCredit]:
-        """출연 작품 조회"""
-        acting_stmt = (
-            select(
-                MovieCastModel.movie_id,
-                MovieModel.title,
-                MovieModel.poster_url,
-                MovieModel.release_date,
-                MovieCastModel.character_name,
-                MovieCastModel.job,
-                MovieCastModel.department,
-                MovieCastModel.is_main_cast,
-            )
-            .select_from(MovieCastModel)
-            .outerjoin(MovieModel, MovieCastModel.movie_id == MovieModel.movie_id)
-            .where(
-                and_(MovieCastModel.person_id == person_id, MovieCastModel.department == "Acting")
-            )
-            .order_by(MovieCastModel.cast_order.nulls_last())
-        )
-
-        acting_result = db.execute(acting_stmt)
-        return [
-            MovieCredit(
-                movie_id=row.movie_id,
-                movie_title=row.title or f"영화 {row.movie_id}",
-                movie_poster_url=row.poster_url,
-                release_date=row.release_date,
-                character_name=row.character_name,
-                job=row.job,
-                department=row.department,
-                is_main_cast=row.is_main_cast,
+    def _search_persons_in_db(self, query: str, skip: int, limit: int, db: Session) -> List[Person]:
+        """DB에서 인물 검색 (검색 색인 우선, 색인 준비 전에는 ILIKE 검색)"""
+        person_ids = person_search_index.search(query, skip, limit, db)
+
+        if person_ids is None:
+            stmt = (
+                select(PersonModel)
+                .where(
+                    or_(
+                        PersonModel.name.ilike(f"%{query}%"),
+                        PersonModel.original_name.ilike(f"%{query}%"),
+                    )
+                )
+                .order_by(desc(PersonModel.popularity))
+                .offset(skip)
+                .limit(limit)
             )
-            for row in acting_result.fetchall()
-        ]
+            persons = db.execute(stmt).scalars().all()
+        elif person_ids:
+            stmt = select(PersonModel).where(PersonModel.person_id.in_(person_ids))
+            persons_by_id = {person.person_id: person for person in db.execute(stmt).scalars()}
+            persons = [persons_by_id[pid] for pid in person_ids if pid in persons_by_id]
+        else:
+            persons = []
 
-    def _get_person_crew_credits(self, person_id: int, db: Session) -> List[MovieCredit]:
-        """스태프 참여 작품 조회"""
-        crew_stmt = (
-            select(
-                MovieCastModel.movie_id,
-                MovieModel.title,
-                MovieModel.poster_url,
-                MovieModel.release_date,
-                MovieCastModel.character_name,
-                MovieCastModel.job,
-                MovieCastModel.department,
-                MovieCastModel.is_main_cast,
-            )
-            .select_from(MovieCastModel)
-            .outerjoin(MovieModel, MovieCastModel.movie_id == MovieModel.movie_id)
-            .where(
-                and_(MovieCastModel.person_id == person_id, MovieCastModel.department != "Acting")
-            )
+        counts = CounterService(db).get_counts_with_db(
+            "person", [person.person_id for person in persons], db
         )
-
-        crew_result = db.execute(crew_stmt)
         return [
-            MovieCredit(
-                movie_id=row.movie_id,
-                movie_title=row.title or f"영화 {row.movie_id}",
-                movie_poster_url=row.poster_url,
-                release_date=row.release_date,
-                character_name=row.character_name,
-                job=row.job,
-                department=row.department,
-                is_main_cast=row.is_main_cast,
+            self._build_person_response(
+                person_model, False, counts[person_model.person_id]["followers_count"]
             )
-            for row in crew_result.fetchall()
+            for person_model in persons
         ]
 
-    def _search_persons_in_db(self, query: str, skip: int, limit: int, db: Session) -> List[Person]:
-        """DB에서 인물 검색"""
-        stmt = (
-            select(PersonModel)
-            .where(
-                or_(
-                    PersonModel.name.ilike(f"%{query}%"),
-                    PersonModel.original_name.ilike(f"%{query}%"),
-                )
-            )
-            .order_by(desc(PersonModel.popularity))
-            .offset(skip)
-            .limit(limit)
-        )
-
-        result = db.execute(stmt)
-        persons = result.scalars().all()
-
-        person_list = []
-        for person_model in persons:
-            followers_count = self._get_person_followers_count_with_db(person_model.person_id, db)
-            person_list.append(self._build_person_response(person_model, False, followers_count))
-
-        return person_list
-
     def _is_following_person_with_db(self, user_id: int, person_id: int, db: Session) -> bool:
         """사용자가 인물을 팔로우하는지 확인"""
         try:
@@ -496,13 +322,9 @@ class PersonService:
             return False
 
     def _get_person_followers_count_with_db(self, person_id: int, db: Session) -> int:
-        """인물의 팔로워 수 조회"""
+        """인물의 팔로워 수 조회 (entity_counters)"""
         try:
-            stmt = select(func.count(PersonFollowModel.user_id)).where(
-                PersonFollowModel.person_id == person_id
-            )
-            result = db.execute(stmt)
-            return result.scalar() or 0
+            return CounterService(db).get_count_with_db("person", person_id, "followers_count", db)
         except Exception:
             return 0
 
@@ -510,26 +332,6 @@ class PersonService:
         """인물 존재 여부 확인"""
         return self._get_person_model_by_id(person_id, db) is not None
 
-    def _movie_exists(self, movie_id: int, db: Session) -> bool:
-        """영화 존재 여부 확인"""
-        stmt = select(MovieModel).where(MovieModel.movie_id == movie_id)
-        result = db.execute(stmt)
-        return result.scalar_one_or_none() is not None
-
-    def _movie_cast_connection_exists(
-        self, movie_id: int, person_id: int, job: str, db: Session
-    ) -> bool:
-        """movie_cast 연결 존재 여부 확인"""
-        stmt = select(MovieCastModel).where(
-            and_(
-                MovieCastModel.movie_id == movie_id,
-                MovieCastModel.person_id == person_id,
-                MovieCastModel.job == job,
-            )
-        )
-        result = db.execute(stmt)
-        return result.scalar_one_or_none() is not None
-
     def _update_existing_person(self, existing_person: PersonModel, tmdb_data: dict):
         """기존 인물 정보를 TMDB 데이터로 업데이트"""
         existing_person.name = tmdb_data.get("name", existing_person.name)
@@ -1,8 +1,13 @@
 # app/services/recommendation_service.py
 
-from typing import List, Dict, Optional
+import asyncio
+import threading
+from datetime import date, datetime, timedelta
+from itertools import chain, zip_longest
+from typing import List, Dict, Optional, Tuple
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, and_, or_, desc
+from sqlalchemy import select, func, and_, or_, desc, union
 import math
 import random
 import httpx
@@ -10,43 +15,125 @@ from app.models.movie import MovieModel
 from app.models.comment import CommentModel
 from app.models.movie_genre import MovieGenreModel
 from app.models.genre import GenreModel
+from app.models.genre_movie_rank import GenreMovieRankModel
 from app.models.movie_cast import MovieCastModel
+from app.models.movie_like import MovieLikeModel
+from app.models.watchlist import WatchlistModel
 from app.database import SessionLocal
+from app.core.experiments import Variant
+from app.services.cf_service import cf_service
+from app.services.experiment_service import RECOMMENDATION_WEIGHTS_EXPERIMENT, experiment_service
+from app.services.movie_embedding_service import movie_embedding_service
 from app.core.config import get_settings
 
+# 사용자/날짜/변형별 추천 결과 캐시 (같은 날 같은 사용자는 같은 결과이므로 캐시 가능)
+_recommendation_cache = TTLCache(maxsize=50_000, ttl=600)
+_recommendation_cache_lock = threading.Lock()
+
+# 트렌딩 후보 풀 캐시 (워커 프로세스 단위)
+_trending_cache = TTLCache(maxsize=1, ttl=600)
+_trending_cache_lock = threading.Lock()
+
 
 class RecommendationService:
 
-    def __init__(self):
+    MAX_CANDIDATES = 500  # 랭킹 단계에서 점수를 계산할 최대 후보 수
+    POOL_SIZE = 150  # 후보 풀별 최대 영화 수
+    MIN_CANDIDATE_RATING = 6.0
+    TRENDING_DAYS = 7
+    TMDB_FANOUT = 3  # TMDB 추천을 요청할 최근 시청 영화 수
+    TMDB_BUDGET_SECONDS = 1.5  # TMDB 요청 전체가 공유하는 대기 시간
+
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
         self.settings = get_settings()
 
     def _get_db(self) -> Session:
-        """데이터베이스 세션 생성"""
+        """데이터베이스 세션 생성 (요청 단위 세션이 주입되면 재사용)"""
+        if self.db is not None:
+            return self.db
         return SessionLocal()
 
     async def get_movie_recommendations(self, user_id: int) -> List[Dict]:
-        """사용자 시청 기록 기반 영화 추천 (5개)"""
-        db = self._get_db()
-        try:
-            user_profile = await self._analyze_user_profile_with_db(user_id, db)
+        """사용자 시청 기록 기반 영화 추천 (5개, 같은 날 같은 사용자는 같은 결과)"""
+        experiment = RECOMMENDATION_WEIGHTS_EXPERIMENT
+        variant_index, variant = experiment.assign(user_id)
+        today = date.today()
+        cache_key = (user_id, today, variant.name)
+
+        with _recommendation_cache_lock:
+            recommendations = _recommendation_cache.get(cache_key)
+
+        if recommendations is None:
+            db = self._get_db()
+            try:
+                recommendations = await self._get_movie_recommendations_with_db(
+                    user_id, variant, experiment.rng(user_id, today), db
+                )
+            except Exception as e:
+                return []
+            finally:
+                db.close()
+
+            if recommendations:
+                with _recommendation_cache_lock:
+                    _recommendation_cache[cache_key] = recommendations
+
+        experiment_service.log_impressions(
+            experiment, user_id, variant_index, [movie["movie_id"] for movie in recommendations]
+        )
+        return recommendations
+
+    async def _get_movie_recommendations_with_db(
+        self, user_id: int, variant: Variant, rng: random.Random, db: Session
+    ) -> List[Dict]:
+        """변형 가중치 범위와 시드 난수로 추천 계산"""
+        user_profile = await self._analyze_user_profile_with_db(user_id, db)
 
-            if not user_profile["watched_movies"]:
+        # 좋아요/왓치리스트/평점으로 학습한 협업 필터링 추천 (이미 반응한 영화 제외)
+        interacted_ids = self._get_interacted_movie_ids_with_db(user_id, db)
+        cf_recs = self._get_cf_recommendations_with_db(user_id, interacted_ids, db)
+
+        if not user_profile["watched_movies"]:
+            if not cf_recs:
                 return await self._get_popular_movies_with_db(5, db)
+            all_recs = await self._merge_recommendations_with_db(cf_recs, [], interacted_ids, db)
+            return [self._to_simple_format(movie) for movie in all_recs[:5]]
 
-            # 자체 알고리즘 3개 + TMDB API 2개
-            internal_recs = await self._get_internal_recommendations_with_db(user_profile, db)
-            tmdb_recs = await self._get_tmdb_recommendations(user_profile["latest_movie"])
+        # 로컬 후보 풀 점수 계산(DB 작업, 스레드)과 최근 시청 영화들의 TMDB 추천 요청을 동시에 실행
+        weights = self._generate_random_weights(variant.weight_ranges, rng)
+        scores, tmdb_results = await asyncio.gather(
+            asyncio.to_thread(
+                self._score_local_candidates_with_db, user_profile, weights, interacted_ids, db
+            ),
+            self._fetch_tmdb_fanout(user_profile["watched_movies"][: self.TMDB_FANOUT]),
+        )
 
-            # 중복 제거 후 최종 5개 반환
-            all_recs = await self._merge_recommendations_with_db(
-                internal_recs, tmdb_recs, user_profile["watched_movies"], db
+        # TMDB가 추천한 로컬 영화 중 아직 평가하지 않은 영화도 같은 기준으로 점수 계산
+        excluded = set(interacted_ids) | scores.keys()
+        late_ids = list(
+            dict.fromkeys(
+                movie["id"]
+                for movie in tmdb_results
+                if movie.get("id") and movie["id"] not in excluded
+            )
+        )
+        if late_ids:
+            scores.update(
+                self._score_candidates_with_db(
+                    user_profile, weights, late_ids[: self.POOL_SIZE], db
+                )
             )
-            return [self._to_simple_format(movie) for movie in all_recs[:5]]
 
-        except Exception as e:
-            return []
-        finally:
-            db.close()
+        # 자체 알고리즘 3개 + 협업 필터링 3개 + TMDB API 2개
+        internal_recs = await self._top_recommendations_with_db(scores, db)
+        tmdb_recs = self._select_tmdb_recommendations(tmdb_results, rng)
+
+        # 중복 제거 후 최종 5개 반환
+        all_recs = await self._merge_recommendations_with_db(
+            internal_recs + cf_recs, tmdb_recs, interacted_ids, db
+        )
+        return [self._to_simple_format(movie) for movie in all_recs[:5]]
 
     async def _analyze_user_profile_with_db(self, user_id: int, db: Session) -> Dict:
         """사용자 시청 기록 및 선호도 분석"""
@@ -130,14 +217,27 @@ class RecommendationService:
             return []
 
     async def _get_internal_recommendations_with_db(
-        self, user_profile: Dict, db: Session
+        self,
+        user_profile: Dict,
+        db: Session,
+        weights: Optional[Dict[str, float]] = None,
+        candidate_ids: Optional[List[int]] = None,
     ) -> List[Dict]:
         """자체 알고리즘으로 3개 추천"""
         try:
-            weights = self._generate_random_weights()
-            scores = await self._calculate_recommendation_scores_with_db(user_profile, weights, db)
+            weights = weights or self._generate_random_weights()
+            scores = await self._calculate_recommendation_scores_with_db(
+                user_profile, weights, db, candidate_ids
+            )
+            return await self._top_recommendations_with_db(scores, db)
+        except Exception:
+            return []
 
-            # 상위 3개 선택
+    async def _top_recommendations_with_db(
+        self, scores: Dict[int, float], db: Session
+    ) -> List[Dict]:
+        """점수 상위 3개 영화 정보"""
+        try:
             top_movies = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:3]
 
             result = []
@@ -151,48 +251,232 @@ class RecommendationService:
         except Exception:
             return []
 
-    async def _get_tmdb_recommendations(self, latest_movie_id: Optional[int]) -> List[Dict]:
-        """TMDB API로 2개 추천"""
+    def _get_interacted_movie_ids_with_db(self, user_id: int, db: Session) -> List[int]:
+        """좋아요, 왓치리스트, 댓글을 남긴 영화 ID 목록"""
+        try:
+            stmt = union(
+                select(MovieLikeModel.movie_id).where(MovieLikeModel.user_id == user_id),
+                select(WatchlistModel.movie_id).where(WatchlistModel.user_id == user_id),
+                select(CommentModel.movie_id).where(CommentModel.user_id == user_id),
+            )
+            return list(db.execute(stmt).scalars().all())
+        except Exception:
+            return []
+
+    def _get_cf_recommendations_with_db(
+        self, user_id: int, exclude_ids: List[int], db: Session
+    ) -> List[Dict]:
+        """협업 필터링으로 3개 추천 (모델에 없는 사용자면 빈 목록)"""
+        try:
+            predicted = cf_service.recommend(user_id, 3, exclude_ids)
+            if not predicted:
+                return []
+
+            stmt = select(MovieModel.movie_id, MovieModel.title, MovieModel.poster_url).where(
+                MovieModel.movie_id.in_([movie_id for movie_id, _ in predicted])
+            )
+            movies = {row.movie_id: row for row in db.execute(stmt)}
+            return [
+                {
+                    "movie_id": movie_id,
+                    "title": movies[movie_id].title,
+                    "poster_url": movies[movie_id].poster_url,
+                    "recommendation_score": min(max(score, 0.0), 1.0),
+                }
+                for movie_id, score in predicted
+                if movie_id in movies
+            ]
+        except Exception:
+            return []
+
+    async def _fetch_tmdb_fanout(self, movie_ids: List[int]) -> List[Dict]:
+        """여러 영화의 TMDB 추천을 동시에 요청해 번갈아 합친 결과 (중복 제거)
+
+        모든 요청이 공유하는 TMDB_BUDGET_SECONDS 안에 끝나지 않은 요청은 취소하고
+        그때까지 받은 결과만 사용하므로, 느린 TMDB 응답이 추천 지연으로 이어지지 않는다.
+        """
+        if not movie_ids:
+            return []
+
+        timeout = httpx.Timeout(self.settings.tmdb_timeout)
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            tasks = [
+                asyncio.create_task(self._fetch_tmdb_recommendations(movie_id, client))
+                for movie_id in movie_ids
+            ]
+            done, pending = await asyncio.wait(tasks, timeout=self.TMDB_BUDGET_SECONDS)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if pending:
+            print(f"TMDB 추천 요청 {len(pending)}/{len(tasks)}건 시간 초과로 제외")
+
+        merged = []
+        seen_ids = set()
+        per_movie = [task.result() if task in done else [] for task in tasks]
+        for movie in chain.from_iterable(zip_longest(*per_movie)):
+            if movie is None or movie.get("id") in seen_ids:
+                continue
+            seen_ids.add(movie.get("id"))
+            merged.append(movie)
+        return merged
+
+    async def _fetch_tmdb_recommendations(
+        self, movie_id: Optional[int], client: Optional[httpx.AsyncClient] = None
+    ) -> List[Dict]:
+        """TMDB 영화별 추천 결과 (첫 페이지, 실패하면 빈 목록)"""
         try:
-            if not latest_movie_id:
+            if not movie_id:
                 return []
 
-            url = f"{self.settings.tmdb_base_url}/movie/{latest_movie_id}/recommendations"
+            if client is None:
+                timeout = httpx.Timeout(self.settings.tmdb_timeout)
+                async with httpx.AsyncClient(timeout=timeout) as client:
+                    return await self._fetch_tmdb_recommendations(movie_id, client)
+
+            url = f"{self.settings.tmdb_base_url}/movie/{movie_id}/recommendations"
             params = {"api_key": self.settings.tmdb_api_key, "language": "ko-KR", "page": 1}
+            response = await client.get(url, params=params, headers=self.settings.tmdb_headers)
 
-            timeout = httpx.Timeout(self.settings.tmdb_timeout)
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url, params=params, headers=self.settings.tmdb_headers)
+            if response.status_code != 200:
+                return []
 
-                if response.status_code != 200:
-                    return []
+            return response.json().get("results", [])
 
-                results = response.json().get("results", [])
-                if not results:
-                    return []
+        except Exception:
+            return []
+
+    def _select_tmdb_recommendations(
+        self, results: List[Dict], rng: Optional[random.Random] = None
+    ) -> List[Dict]:
+        """TMDB 추천 결과 상위에서 2개 선택"""
+        rng = rng or random
+        if not results:
+            return []
+
+        selected_count = min(2, len(results))
+        selected = (
+            rng.sample(results[:8], selected_count)
+            if len(results) >= 4
+            else results[:selected_count]
+        )
+
+        return [
+            {
+                "movie_id": movie.get("id"),
+                "title": movie.get("title", ""),
+                "poster_url": self._build_image_url(movie.get("poster_path")),
+                "recommendation_score": 0.5,
+            }
+            for movie in selected
+            if movie.get("id")
+        ]
+
+    def _generate_candidates_with_db(
+        self,
+        user_profile: Dict,
+        exclude_ids: List[int],
+        tmdb_movie_ids: List[int],
+        db: Session,
+    ) -> List[int]:
+        """인덱스로 읽을 수 있는 풀에서 후보 영화 모으기 (최대 MAX_CANDIDATES개)
+
+        TMDB 추천, 취향 임베딩 이웃, 선호 인물 출연작, 선호 장르 평점 상위, 트렌딩 풀을
+        번갈아 합쳐 어느 한 풀이 후보를 독점하지 않게 한다. 랭킹 비용은 카탈로그 크기와
+        무관하게 후보 수로 제한된다.
+        """
+        excluded = set(exclude_ids)
+        pools = [
+            tmdb_movie_ids[: self.POOL_SIZE],
+            movie_embedding_service.taste_neighbors(
+                user_profile["watched_movies"], self.POOL_SIZE, exclude_ids
+            ),
+            self._get_people_pool_with_db(user_profile["preferred_people"], db),
+            self._get_genre_pool_with_db(user_profile["preferred_genres"], db),
+            self._get_trending_pool_with_db(db),
+        ]
+
+        candidates = []
+        seen = set(excluded)
+        for movie_id in chain.from_iterable(zip_longest(*pools)):
+            if movie_id is None or movie_id in seen:
+                continue
+            seen.add(movie_id)
+            candidates.append(movie_id)
+            if len(candidates) >= self.MAX_CANDIDATES:
+                break
+        return candidates
+
+    def _get_genre_pool_with_db(self, genre_ids: List[int], db: Session) -> List[int]:
+        """선호 장르별 평점 상위 영화 (장르 순위 인덱스 범위 조회)"""
+        try:
+            per_genre = []
+            for genre_id in genre_ids:
+                stmt = (
+                    select(GenreMovieRankModel.movie_id)
+                    .where(
+                        GenreMovieRankModel.genre_id == genre_id,
+                        GenreMovieRankModel.average_rating >= self.MIN_CANDIDATE_RATING,
+                    )
+                    .order_by(
+                        desc(GenreMovieRankModel.average_rating), desc(GenreMovieRankModel.movie_id)
+                    )
+                    .limit(self.POOL_SIZE // max(len(genre_ids), 1) + 1)
+                )
+                per_genre.append(db.execute(stmt).scalars().all())
+            return [
+                movie_id
+                for movie_id in chain.from_iterable(zip_longest(*per_genre))
+                if movie_id is not None
+            ]
+        except Exception:
+            return []
 
-                # 상위 결과에서 2개 선택
-                selected_count = min(2, len(results))
-                selected = (
-                    random.sample(results[:8], selected_count)
-                    if len(results) >= 4
-                    else results[:selected_count]
+    def _get_people_pool_with_db(self, person_ids: List[int], db: Session) -> List[int]:
+        """선호 배우/감독 출연작 중 평점 상위 영화"""
+        if not person_ids:
+            return []
+        try:
+            stmt = (
+                select(MovieModel.movie_id)
+                .join(MovieCastModel, MovieCastModel.movie_id == MovieModel.movie_id)
+                .where(
+                    MovieCastModel.person_id.in_(person_ids),
+                    MovieModel.average_rating >= self.MIN_CANDIDATE_RATING,
                 )
+                .group_by(MovieModel.movie_id, MovieModel.average_rating)
+                .order_by(desc(func.count()), desc(MovieModel.average_rating))
+                .limit(self.POOL_SIZE)
+            )
+            return db.execute(stmt).scalars().all()
+        except Exception:
+            return []
 
-                return [
-                    {
-                        "movie_id": movie.get("id"),
-                        "title": movie.get("title", ""),
-                        "poster_url": self._build_image_url(movie.get("poster_path")),
-                        "recommendation_score": 0.5,
-                    }
-                    for movie in selected
-                    if movie.get("id")
-                ]
+    def _get_trending_pool_with_db(self, db: Session) -> List[int]:
+        """최근 TRENDING_DAYS일 공개 댓글이 많은 영화 (워커 단위 캐시)"""
+        with _trending_cache_lock:
+            cached = _trending_cache.get("movies")
+        if cached is not None:
+            return cached
 
+        try:
+            since = datetime.now() - timedelta(days=self.TRENDING_DAYS)
+            stmt = (
+                select(CommentModel.movie_id)
+                .where(CommentModel.created_at >= since, CommentModel.is_public.is_(True))
+                .group_by(CommentModel.movie_id)
+                .order_by(desc(func.count()))
+                .limit(self.POOL_SIZE)
+            )
+            trending = db.execute(stmt).scalars().all()
         except Exception:
             return []
 
+        with _trending_cache_lock:
+            _trending_cache["movies"] = trending
+        return trending
+
     async def _merge_recommendations_with_db(
         self,
         internal_recs: List[Dict],
@@ -229,50 +513,74 @@ class RecommendationService:
         return all_recs
 
     async def _calculate_recommendation_scores_with_db(
-        self, user_profile: Dict, weights: Dict[str, float], db: Session
+        self,
+        user_profile: Dict,
+        weights: Dict[str, float],
+        db: Session,
+        candidate_ids: Optional[List[int]] = None,
     ) -> Dict[int, float]:
         """추천 점수 계산"""
-        try:
-            # 후보 영화들 조회
-            stmt = select(MovieModel.movie_id, MovieModel.average_rating).where(
-                and_(
-                    (
-                        MovieModel.movie_id.notin_(user_profile["watched_movies"])
-                        if user_profile["watched_movies"]
-                        else True
-                    ),
-                    MovieModel.average_rating >= 6.0,
-                )
+        if candidate_ids is None:
+            return self._score_local_candidates_with_db(
+                user_profile, weights, user_profile["watched_movies"], db
             )
+        return self._score_candidates_with_db(user_profile, weights, candidate_ids, db)
 
-            candidates = db.execute(stmt).all()
-            scores = {}
-
-            for movie_id, rating in candidates:
-                score = 0.0
+    def _score_local_candidates_with_db(
+        self, user_profile: Dict, weights: Dict[str, float], exclude_ids: List[int], db: Session
+    ) -> Dict[int, float]:
+        """로컬 후보 풀(TMDB 제외) 생성 후 점수 계산"""
+        candidate_ids = self._generate_candidates_with_db(user_profile, exclude_ids, [], db)
+        return self._score_candidates_with_db(user_profile, weights, candidate_ids, db)
 
-                # 장르 유사도
-                score += (
-                    await self._calculate_genre_similarity_with_db(
-                        movie_id, user_profile["preferred_genres"], db
-                    )
-                    * weights["genre"]
-                )
+    def _score_candidates_with_db(
+        self, user_profile: Dict, weights: Dict[str, float], candidate_ids: List[int], db: Session
+    ) -> Dict[int, float]:
+        """후보 영화 점수 계산 (후보 영화의 특징을 묶음 쿼리로 조회)"""
+        try:
+            if not candidate_ids:
+                return {}
 
-                # 인물 유사도
-                score += (
-                    await self._calculate_people_similarity_with_db(
-                        movie_id, user_profile["preferred_people"], db
-                    )
-                    * weights["people"]
-                )
+            stmt = select(MovieModel.movie_id, MovieModel.average_rating).where(
+                MovieModel.movie_id.in_(candidate_ids),
+                MovieModel.average_rating >= self.MIN_CANDIDATE_RATING,
+            )
+            candidates = db.execute(stmt).all()
+            movie_ids = [movie_id for movie_id, _ in candidates]
+
+            genre_matches = self._count_by_movie_with_db(
+                MovieGenreModel.movie_id,
+                MovieGenreModel.genre_id.in_(user_profile["preferred_genres"]),
+                movie_ids,
+                db,
+                enabled=bool(user_profile["preferred_genres"]),
+            )
+            people_matches = self._count_by_movie_with_db(
+                MovieCastModel.movie_id,
+                MovieCastModel.person_id.in_(user_profile["preferred_people"]),
+                movie_ids,
+                db,
+                enabled=bool(user_profile["preferred_people"]),
+            )
+            comment_counts = self._count_by_movie_with_db(
+                CommentModel.movie_id, CommentModel.is_public == True, movie_ids, db
+            )
 
-                # 평점 점수
-                score += (float(rating) / 10.0) * weights["rating"]
+            # 시청한 영화들과의 콘텐츠 임베딩 유사도 (색인이 없으면 0)
+            content_scores = movie_embedding_service.content_scores(
+                user_profile["watched_movies"], movie_ids
+            )
 
-                # 인기도 점수
-                score += (
-                    await self._calculate_popularity_score_with_db(movie_id, db)
+            genre_count = max(len(user_profile["preferred_genres"]), 1)
+            people_count = max(len(user_profile["preferred_people"]), 1)
+            scores = {}
+            for movie_id, rating in candidates:
+                score = (
+                    genre_matches.get(movie_id, 0) / genre_count * weights["genre"]
+                    + people_matches.get(movie_id, 0) / people_count * weights["people"]
+                    + content_scores.get(movie_id, 0.0) * weights["content"]
+                    + (float(rating) / 10.0) * weights["rating"]
+                    + min(math.log(comment_counts.get(movie_id, 0) + 1) / 10.0, 1.0)
                     * weights["popularity"]
                 )
 
@@ -283,46 +591,18 @@ class RecommendationService:
         except Exception:
             return {}
 
-    async def _calculate_genre_similarity_with_db(
-        self, movie_id: int, preferred_genres: List[int], db: Session
-    ) -> float:
-        """장르 유사도 계산"""
-        if not preferred_genres:
-            return 0.0
-
-        stmt = select(func.count()).where(
-            and_(
-                MovieGenreModel.movie_id == movie_id, MovieGenreModel.genre_id.in_(preferred_genres)
-            )
-        )
-
-        matching = db.execute(stmt).scalar() or 0
-        return matching / len(preferred_genres)
-
-    async def _calculate_people_similarity_with_db(
-        self, movie_id: int, preferred_people: List[int], db: Session
-    ) -> float:
-        """배우/감독 유사도 계산"""
-        if not preferred_people:
-            return 0.0
-
-        stmt = select(func.count()).where(
-            and_(
-                MovieCastModel.movie_id == movie_id, MovieCastModel.person_id.in_(preferred_people)
-            )
-        )
-
-        matching = db.execute(stmt).scalar() or 0
-        return matching / len(preferred_people)
-
-    async def _calculate_popularity_score_with_db(self, movie_id: int, db: Session) -> float:
-        """인기도 점수 계산"""
-        stmt = select(func.count()).where(
-            and_(CommentModel.movie_id == movie_id, CommentModel.is_public == True)
+    def _count_by_movie_with_db(
+        self, movie_column, condition, movie_ids: List[int], db: Session, enabled: bool = True
+    ) -> Dict[int, int]:
+        """후보 영화별 조건에 맞는 행 수 (GROUP BY 한 번)"""
+        if not enabled or not movie_ids:
+            return {}
+        stmt = (
+            select(movie_column, func.count())
+            .where(movie_column.in_(movie_ids), condition)
+            .group_by(movie_column)
         )
-
-        comment_count = db.execute(stmt).scalar() or 0
-        return min(math.log(comment_count + 1) / 10.0, 1.0)
+        return {movie_id: count for movie_id, count in db.execute(stmt)}
 
     async def _get_movie_basic_info_with_db(self, movie_id: int, db: Session) -> Optional[Dict]:
         """영화 기본 정보 조회"""
@@ -362,14 +642,15 @@ class RecommendationService:
             for row in db.execute(stmt).all()
         ]
 
-    def _generate_random_weights(self) -> Dict[str, float]:
-        """랜덤 가중치 생성"""
-        weights = {
-            "genre": random.uniform(0.1, 0.6),
-            "people": random.uniform(0.1, 0.6),
-            "rating": random.uniform(0.1, 0.4),
-            "popularity": random.uniform(0.05, 0.3),
-        }
+    def _generate_random_weights(
+        self,
+        weight_ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+        rng: Optional[random.Random] = None,
+    ) -> Dict[str, float]:
+        """가중치 범위 안에서 가중치 생성 (기본은 control 변형 범위)"""
+        rng = rng or random
+        weight_ranges = weight_ranges or RECOMMENDATION_WEIGHTS_EXPERIMENT.variants[0].weight_ranges
+        weights = {name: rng.uniform(low, high) for name, (low, high) in weight_ranges.items()}
 
         total = sum(weights.values())
         return {k: v / total for k, v in weights.items()}
@@ -440,34 +721,6 @@ class RecommendationService:
         finally:
             db.close()
 
-    async def _calculate_genre_similarity(
-        self, movie_id: int, preferred_genres: List[int]
-    ) -> float:
-        """장르 유사도 계산"""
-        db = self._get_db()
-        try:
-            return await self._calculate_genre_similarity_with_db(movie_id, preferred_genres, db)
-        finally:
-            db.close()
-
-    async def _calculate_people_similarity(
-        self, movie_id: int, preferred_people: List[int]
-    ) -> float:
-        """배우/감독 유사도 계산"""
-        db = self._get_db()
-        try:
-            return await self._calculate_people_similarity_with_db(movie_id, preferred_people, db)
-        finally:
-            db.close()
-
-    async def _calculate_popularity_score(self, movie_id: int) -> float:
-        """인기도 점수 계산"""
-        db = self._get_db()
-        try:
-            return await self._calculate_popularity_score_with_db(movie_id, db)
-        finally:
-            db.close()
-
     async def _get_movie_basic_info(self, movie_id: int) -> Optional[Dict]:
         """영화 기본 정보 조회"""
         db = self._get_db()
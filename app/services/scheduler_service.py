@@ -1,167 +1,313 @@
 import asyncio
-from datetime import datetime, timedelta
-from typing import List
+from datetime import datetime
+from typing import Dict, Optional
 from app.services.user_service import UserService
 from app.services.comment_service import CommentService
 from app.services.movie_service import MovieService
+from app.services.counter_service import CounterService
+from app.services.genre_stats_service import GenreStatsService
+from app.services.follow_suggestion_service import FollowSuggestionService
+from app.services.movie_embedding_service import movie_embedding_service
+from app.services.cf_service import cf_service
+from app.services.summary_state_service import (
+    MOVIE_SUMMARY,
+    PROFILE_SUMMARY,
+    SummaryStateService,
+    summary_input_hash,
+)
+from app.services.job_service import JobCancelled, JobContext, JobDefinition, job_service
 from app.ai import profile_reviewbot, concise_reviewbot
 
 
 class SchedulerService:
+    """정기 작업 스케줄러
+
+    JOBS의 작업을 DB 작업 테이블(scheduled_jobs) 기준으로 실행한다. 모든 워커 프로세스가
+    POLL_INTERVAL마다 실행 시각이 된 작업의 임대를 선점하려 하고, 선점한 워커만 실행한다.
+    영화 임베딩은 그날 갱신된 한줄평을 읽으므로 점검 작업은 AI 분석이 끝난 뒤 이어서 실행한다.
+    """
+
+    JOBS = [
+        JobDefinition(
+            "ai_analysis", "0 6 * * *", "사용자 프로필/영화 리뷰 AI 분석", "daily_ai_analysis"
+        ),
+        JobDefinition(
+            "maintenance",
+            None,
+            "집계 정합성 점검, 영화 임베딩 색인 갱신, 추천 모델 학습",
+            "daily_maintenance",
+            after="ai_analysis",
+        ),
+        JobDefinition(
+            "follow_suggestions",
+            None,
+            "사용자별 팔로우 추천 재계산",
+            "daily_follow_suggestions",
+            after="maintenance",
+        ),
+    ]
+    POLL_INTERVAL = 30  # 실행할 작업 확인 주기 (초)
 
     def __init__(self):
-        pass
+        self._running: Dict[str, asyncio.Task] = {}
+
+    async def _step(self, context: Optional[JobContext], name: str, run):
+        """작업 단계 실행 (스케줄러 실행이면 체크포인트 기록, 직접 호출이면 그대로 실행)"""
+        if context is None:
+            return await run()
+        return await context.step(name, run)
+
+    async def _run_steps(self, context: Optional[JobContext], steps) -> dict:
+        """단계를 순서대로 실행 (실패한 단계가 있어도 나머지를 실행한 뒤 작업을 실패로 끝냄)
+
+        실패한 단계는 체크포인트에 남지 않으므로 다음 실행에서 다시 시도한다.
+        """
+        results, failures = {}, []
+        for name, run in steps:
+            try:
+                results[name] = await self._step(context, name, run)
+            except JobCancelled:
+                raise
+            except Exception as e:
+                failures.append(f"{name}: {str(e)}")
+        if failures:
+            raise Exception(f"실패한 단계 {len(failures)}개 - " + "; ".join(failures))
+        return results
 
     async def daily_profile_analysis(self):
-        """사용자 프로필 분석"""
+        """사용자 프로필 분석 (공개 댓글이 바뀐 사용자만)"""
         print(f"프로필 분석 스케줄러 시작: {datetime.now()}")
 
         user_service = UserService()
         comment_service = CommentService()
 
-        try:
-            # 1. 모든 활성 사용자 조회
-            users = await user_service.get_all_users()
-            print(f"분석 대상 사용자 수: {len(users)}")
-
-            analysis_count = 0
-
-            for user in users:
-                try:
-                    # 2. 사용자의 댓글 조회
-                    comments = await comment_service.get_user_all_comments_text(user.user_id)
-
-                    # 3. 댓글이 5개 이상일 때만 분석
-                    if len(comments) >= 5:
-                        print(
-                            f"사용자 {user.name}({user.user_id}) 프로필 분석 시작 - 댓글 {len(comments)}개"
-                        )
-
-                        # 4. AI 프로필 분석 수행
-                        profile_analysis = await profile_reviewbot(user.name, comments)
-
-                        # 5. 결과를 DB에 저장
-                        success = await user_service.update_user_profile_review(
-                            user.user_id, profile_analysis
-                        )
-
-                        if success:
-                            analysis_count += 1
-                            print(f"사용자 {user.name} 프로필 분석 완료")
-                        else:
-                            print(f"사용자 {user.name} 프로필 저장 실패")
-                    else:
-                        print(f"사용자 {user.name}({user.user_id}) - 댓글 부족 ({len(comments)}개)")
-
-                    # 6. API 부하 방지를 위한 딜레이
-                    await asyncio.sleep(2)
-
-                except Exception as user_error:
-                    print(f"사용자 {user.name}({user.user_id}) 분석 실패: {str(user_error)}")
-                    continue
-
-            print(f"프로필 분석 완료: {analysis_count}명 성공")
-
-        except Exception as e:
-            print(f"프로필 분석 스케줄러 오류: {str(e)}")
-        finally:
-            # 리소스 정리
-            user_service.__del__()
-            comment_service.__del__()
+        return await self._run_incremental_summary(
+            PROFILE_SUMMARY,
+            "프로필 분석",
+            comment_service.get_user_all_comments_text,
+            profile_reviewbot,
+            user_service.update_user_profile_review,
+        )
 
     async def daily_movie_review_analysis(self):
-        """영화 리뷰 분석"""
+        """영화 리뷰 분석 (공개 댓글이 바뀐 영화만)"""
         print(f"영화 리뷰 분석 스케줄러 시작: {datetime.now()}")
 
         movie_service = MovieService()
         comment_service = CommentService()
 
-        try:
-            # 1. 댓글이 5개 이상인 영화들만 조회
-            movies = await movie_service.get_movies_with_comments(min_comments=5)
-            print(f"분석 대상 영화 수: {len(movies)}")
-
-            analysis_count = 0
+        return await self._run_incremental_summary(
+            MOVIE_SUMMARY,
+            "영화 리뷰 분석",
+            comment_service.get_movie_all_comments_text,
+            concise_reviewbot,
+            movie_service.update_movie_concise_review,
+        )
+
+    async def _run_incremental_summary(
+        self, definition, label: str, get_comments, summarize, save
+    ) -> dict:
+        """댓글이 추가/수정/삭제된 엔티티만 AI 요약 후 처리/건너뜀/실패 수 반환"""
+        summary_state_service = SummaryStateService()
+        result = {"processed": 0, "skipped": 0, "failed": 0}
 
-            for movie in movies:
+        try:
+            # 1. 지난 요약 이후 공개 댓글 수나 마지막 작성/수정 시각이 바뀐 엔티티만 조회
+            targets, skipped = await asyncio.to_thread(
+                summary_state_service.find_changed, definition
+            )
+            result["skipped"] = skipped
+            print(f"{label} 대상: {len(targets)}개 (변경 없음 {skipped}개 건너뜀)")
+
+            for target in targets:
                 try:
-                    # 2. 영화의 댓글들 조회
-                    comments = await comment_service.get_movie_all_comments_text(movie["movie_id"])
+                    # 2. 요약에 넣을 최근 공개 댓글 조회
+                    comments = await get_comments(target.entity_id)
+                    input_hash = summary_input_hash(comments)
+
+                    # 3. 요약 입력이 지난번과 같으면 (최근 댓글 밖의 변경 등) AI 호출 생략
+                    if input_hash == target.input_hash:
+                        await asyncio.to_thread(
+                            summary_state_service.record, definition, target, input_hash
+                        )
+                        result["skipped"] += 1
+                        continue
 
                     print(
-                        f"영화 {movie['title']}({movie['movie_id']}) 리뷰 분석 시작 - 댓글 {len(comments)}개"
+                        f"{target.name}({target.entity_id}) {label} 시작 - 댓글 {len(comments)}개"
                     )
 
-                    # 3. AI 리뷰 요약 수행
-                    review_summary = await concise_reviewbot(movie["title"], comments)
-
-                    # 4. 결과를 DB에 저장
-                    success = await movie_service.update_movie_concise_review(
-                        movie["movie_id"], review_summary
-                    )
+                    # 4. AI 요약 수행 후 DB에 저장
+                    summary = await summarize(target.name, comments)
+                    success = await save(target.entity_id, summary)
 
                     if success:
-                        analysis_count += 1
-                        print(f"영화 {movie['title']} 리뷰 분석 완료")
+                        await asyncio.to_thread(
+                            summary_state_service.record, definition, target, input_hash
+                        )
+                        result["processed"] += 1
                     else:
-                        print(f"영화 {movie['title']} 리뷰 저장 실패")
+                        result["failed"] += 1
+                        print(f"{target.name}({target.entity_id}) {label} 저장 실패")
 
-                    # 5. API 부하 방지를 위한 딜레이
+                    # 5. API 부하 방지를 위한 딜레이 (AI를 호출한 경우만)
                     await asyncio.sleep(2)
 
-                except Exception as movie_error:
-                    print(
-                        f"영화 {movie['title']}({movie['movie_id']}) 분석 실패: {str(movie_error)}"
-                    )
+                except Exception as target_error:
+                    result["failed"] += 1
+                    print(f"{target.name}({target.entity_id}) {label} 실패: {str(target_error)}")
                     continue
 
-            print(f"영화 리뷰 분석 완료: {analysis_count}개 성공")
-
         except Exception as e:
-            print(f"영화 리뷰 분석 스케줄러 오류: {str(e)}")
-        finally:
-            # 리소스 정리
-            movie_service.__del__()
-            comment_service.__del__()
+            print(f"{label} 스케줄러 오류: {str(e)}")
+            raise
+
+        print(
+            f"{label} 완료: 처리 {result['processed']}개, "
+            f"건너뜀 {result['skipped']}개, 실패 {result['failed']}개"
+        )
+        return result
 
-    async def daily_ai_analysis(self):
+    async def daily_ai_analysis(self, context: Optional[JobContext] = None):
         """사용자 프로필, 영화 리뷰 분석"""
         start_time = datetime.now()
         print(f"일일 AI 분석 시작: {start_time}")
 
-        # 1. 사용자 프로필 분석
-        await self.daily_profile_analysis()
-
-        print("사용자 프로필 분석 완료 - 영화 리뷰 분석 시작")
-
-        # 2. 영화 리뷰 분석
-        await self.daily_movie_review_analysis()
+        # 사용자 프로필 분석 후 영화 리뷰 분석
+        results = await self._run_steps(
+            context,
+            [
+                ("profiles", self.daily_profile_analysis),
+                ("movies", self.daily_movie_review_analysis),
+            ],
+        )
 
         end_time = datetime.now()
         total_duration = end_time - start_time
         print(f"일일 AI 분석 전체 완료 - 총 소요시간: {total_duration}")
+        return results
 
-    async def run_scheduler(self):
-        """스케줄러 실행"""
-        while True:
-            try:
-                now = datetime.now()
-                target_time = now.replace(hour=6, minute=0, second=0, microsecond=0)
+    async def reconcile_counters(self):
+        """카운터 정합성 점검 (누락된 증감 보정)"""
+        try:
+            fixed = await asyncio.to_thread(CounterService().reconcile)
+            print(f"카운터 정합성 점검 완료 - 보정 {fixed}건")
+        except Exception as e:
+            print(f"카운터 정합성 점검 오류: {str(e)}")
+            raise
+
+    async def rebuild_genre_stats(self):
+        """장르 순위/집계 전체 재구성"""
+        try:
+            await asyncio.to_thread(GenreStatsService().rebuild_all)
+        except Exception as e:
+            print(f"장르 집계 재구성 오류: {str(e)}")
+            raise
 
-                # 오늘 6시가 이미 지났으면 내일 6시로 설정
-                if now >= target_time:
-                    target_time += timedelta(days=1)
+    async def rebuild_movie_embeddings(self):
+        """영화 임베딩 색인 재빌드 (바뀐 영화만 다시 계산)"""
+        try:
+            await asyncio.to_thread(movie_embedding_service.rebuild)
+        except Exception as e:
+            print(f"영화 임베딩 색인 재빌드 오류: {str(e)}")
+            raise
 
-                # 다음 실행까지 대기
-                wait_seconds = (target_time - now).total_seconds()
-                print(f"다음 AI 분석 예정: {target_time}")
+    async def train_cf_model(self):
+        """좋아요/왓치리스트/평점 기반 협업 필터링 모델 학습"""
+        try:
+            await asyncio.to_thread(cf_service.train)
+        except Exception as e:
+            print(f"협업 필터링 모델 학습 오류: {str(e)}")
+            raise
+
+    async def daily_maintenance(self, context: Optional[JobContext] = None):
+        """집계 정합성 점검 (카운터, 장르 집계), 영화 임베딩 색인 갱신 및 추천 모델 학습"""
+        return await self._run_steps(
+            context,
+            [
+                ("counters", self.reconcile_counters),
+                ("genre_stats", self.rebuild_genre_stats),
+                ("movie_embeddings", self.rebuild_movie_embeddings),
+                ("cf_model", self.train_cf_model),
+            ],
+        )
+
+    async def daily_follow_suggestions(self, context: Optional[JobContext] = None):
+        """사용자별 팔로우 추천 재계산"""
+        try:
+            await asyncio.to_thread(FollowSuggestionService().compute_all)
+        except Exception as e:
+            print(f"팔로우 추천 계산 오류: {str(e)}")
+            raise
 
-                await asyncio.sleep(wait_seconds)
+    async def run_scheduler(self):
+        """스케줄러 실행 (실행 시각이 된 작업 중 임대를 선점한 작업만 실행)"""
+        await asyncio.to_thread(job_service.register, self.JOBS)
+        definitions = {definition.name: definition for definition in self.JOBS}
+        try:
+            while True:
+                try:
+                    idle = [name for name in definitions if name not in self._running]
+                    for context in await asyncio.to_thread(job_service.claim_due_jobs, idle):
+                        self._running[context.job_name] = asyncio.create_task(
+                            self._run_job(definitions[context.job_name], context)
+                        )
+                except Exception as e:
+                    print(f"스케줄러 오류: {str(e)}")
 
-                # 사용자 프로필, 영화 리뷰 분석 실행
-                await self.daily_ai_analysis()
+                await asyncio.sleep(self.POLL_INTERVAL)
+        finally:
+            # 종료 시 실행 중인 작업은 임대만 반납 (체크포인트에서 이어서 실행)
+            for task in self._running.values():
+                task.cancel()
+            await asyncio.gather(*self._running.values(), return_exceptions=True)
+
+    async def _run_job(self, definition: JobDefinition, context: JobContext):
+        """선점한 작업 실행 후 결과 기록"""
+        print(f"작업 {definition.name} 시작: {datetime.now()}")
+        task = asyncio.current_task()
+        heartbeat = asyncio.create_task(self._heartbeat(context, task))
+        try:
+            try:
+                await getattr(self, definition.method)(context)
+                last_status, error = "succeeded", None
+            except JobCancelled:
+                last_status, error = "cancelled", None
+            except asyncio.CancelledError:
+                if not context.cancel_requested:
+                    await asyncio.to_thread(job_service.release, definition.name)
+                    raise
+                last_status, error = "cancelled", None
+            except Exception as e:
+                last_status, error = "failed", str(e)
+            finally:
+                heartbeat.cancel()
+
+            # 취소/실패해도 이어서 실행할 작업은 예약 (선행 작업 결과가 없어도 각자 실행 가능)
+            successors = [job.name for job in self.JOBS if job.after == definition.name]
+            await asyncio.to_thread(job_service.finish, definition, last_status, error, successors)
+            print(f"작업 {definition.name} 종료 ({last_status}): {datetime.now()}")
+        except Exception as e:
+            print(f"작업 {definition.name} 상태 기록 오류: {str(e)}")
+        finally:
+            self._running.pop(definition.name, None)
 
+    async def _heartbeat(self, context: JobContext, task: asyncio.Task):
+        """실행 임대 연장, 취소 요청을 받았거나 임대를 잃으면 작업 중단"""
+        while True:
+            await asyncio.sleep(job_service.HEARTBEAT_INTERVAL)
+            try:
+                cancel_requested = await asyncio.to_thread(job_service.heartbeat, context.job_name)
             except Exception as e:
-                print(f"스케줄러 오류: {str(e)}")
-                # 오류 발생 시 1시간 후 재시도
-                await asyncio.sleep(3600)
+                print(f"작업 {context.job_name} 임대 연장 오류: {str(e)}")
+                continue
+
+            if cancel_requested is None:
+                print(f"작업 {context.job_name}: 임대를 잃어 중단")
+                task.cancel()
+                return
+            if cancel_requested:
+                print(f"작업 {context.job_name}: 취소 요청으로 중단")
+                context.cancel_requested = True
+                task.cancel()
+                return
@@ -0,0 +1,160 @@
+# app/services/search_index_service.py
+
+import threading
+import time
+from datetime import datetime
+from typing import List, Optional, Sequence
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.search_index import NgramIndex
+from app.database import SessionLocal
+from app.models.movie import MovieModel
+from app.models.person import PersonModel
+from app.models.user import UserModel
+
+
+class SearchIndexService:
+    """이름 검색 색인 관리 서비스
+
+    워커 프로세스마다 메모리 색인(NgramIndex)을 유지한다.
+    첫 검색 시 백그라운드에서 전체 빌드를 시작하고, 준비 전에는 None을 반환해
+    호출 측이 기존 DB 검색을 사용하도록 한다. 이후에는 updated_at 기준으로
+    변경분만 주기적으로 반영하고, 변경 비율이 커지면 다시 빌드한다.
+    """
+
+    REFRESH_INTERVAL = 30  # 변경분 반영 주기 (초)
+    REBUILD_FRAGMENTATION = 0.2  # 재빌드 기준 변경 비율
+    BUILD_BATCH_SIZE = 10000
+
+    def __init__(self, name: str, id_column, fields: Sequence, popularity=None, updated_at=None):
+        self.name = name
+        self.id_column = id_column
+        self.fields = tuple(fields)
+        self.popularity = popularity
+        self.updated_at = updated_at
+
+        self._index: Optional[NgramIndex] = None
+        self._watermark: Optional[datetime] = None
+        self._last_refresh = 0.0
+        self._building = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_ready(self) -> bool:
+        return self._index is not None
+
+    def search(self, query: str, offset: int, limit: int, db: Session) -> Optional[List[int]]:
+        """검색어와 일치하는 ID 목록 (색인 준비 전이면 None)"""
+        if self._index is None:
+            self.start_build()
+            return None
+
+        self._refresh_with_db(db)
+        return self._index.search(query, offset, limit)
+
+    def start_build(self):
+        """백그라운드 전체 빌드 시작 (이미 진행 중이면 무시)"""
+        with self._lock:
+            if self._building:
+                return
+            self._building = True
+
+        threading.Thread(target=self._build, name=f"{self.name}-index", daemon=True).start()
+
+    def _columns(self) -> list:
+        columns = [self.id_column, *self.fields]
+        if self.popularity is not None:
+            columns.append(self.popularity)
+        if self.updated_at is not None:
+            columns.append(self.updated_at)
+        return columns
+
+    def _row_to_entry(self, row) -> tuple:
+        fields = row[1 : 1 + len(self.fields)]
+        popularity = row[1 + len(self.fields)] if self.popularity is not None else 0
+        return row[0], fields, popularity
+
+    def _row_updated_at(self, row) -> Optional[datetime]:
+        return row[-1] if self.updated_at is not None else None
+
+    def _build(self):
+        """전체 색인 빌드 후 교체"""
+        db = SessionLocal()
+        try:
+            started = time.perf_counter()
+            watermark = None
+            entries = []
+
+            result = db.execute(
+                select(*self._columns()).execution_options(yield_per=self.BUILD_BATCH_SIZE)
+            )
+            for row in result:
+                entries.append(self._row_to_entry(row))
+                updated_at = self._row_updated_at(row)
+                if updated_at and (watermark is None or updated_at > watermark):
+                    watermark = updated_at
+
+            index = NgramIndex.build(entries)
+
+            with self._lock:
+                self._index = index
+                self._watermark = watermark
+                self._last_refresh = time.monotonic()
+
+            print(
+                f"{self.name} 검색 색인 빌드 완료: {len(index)}건 "
+                f"({time.perf_counter() - started:.1f}초)"
+            )
+
+        except Exception as e:
+            print(f"{self.name} 검색 색인 빌드 실패: {str(e)}")
+        finally:
+            self._building = False
+            db.close()
+
+    def _refresh_with_db(self, db: Session):
+        """마지막 반영 이후 변경된 행을 색인에 반영"""
+        if self.updated_at is None or time.monotonic() - self._last_refresh < self.REFRESH_INTERVAL:
+            return
+        self._last_refresh = time.monotonic()
+
+        try:
+            stmt = select(*self._columns()).order_by(self.updated_at)
+            if self._watermark is not None:
+                # 같은 시각에 저장된 행을 놓치지 않도록 경계값 포함 (upsert는 멱등)
+                stmt = stmt.where(self.updated_at >= self._watermark)
+
+            index = self._index
+            for row in db.execute(stmt):
+                entity_id, fields, popularity = self._row_to_entry(row)
+                index.upsert(entity_id, fields, popularity)
+                self._watermark = self._row_updated_at(row) or self._watermark
+
+            if index.fragmentation > self.REBUILD_FRAGMENTATION:
+                self.start_build()
+
+        except Exception as e:
+            print(f"{self.name} 검색 색인 갱신 실패: {str(e)}")
+
+
+# 전역 인스턴스
+movie_search_index = SearchIndexService(
+    "movies",
+    MovieModel.movie_id,
+    (MovieModel.title, MovieModel.original_title),
+    popularity=MovieModel.average_rating,
+    updated_at=MovieModel.updated_at,
+)
+person_search_index = SearchIndexService(
+    "persons",
+    PersonModel.person_id,
+    (PersonModel.name, PersonModel.original_name),
+    popularity=PersonModel.popularity,
+    updated_at=PersonModel.updated_at,
+)
+user_search_index = SearchIndexService(
+    "users",
+    UserModel.user_id,
+    (UserModel.name,),
+    updated_at=UserModel.updated_at,
+)
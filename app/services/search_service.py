@@ -0,0 +1,174 @@
+# app/services/search_service.py
+
+import asyncio
+from typing import List, Optional
+from sqlalchemy import select, or_, desc
+from sqlalchemy.orm import Session
+from app.core.config import get_settings
+from app.models.movie import MovieModel
+from app.models.person import PersonModel
+from app.schemas.search import MovieSearchResult, PersonSearchResult, SearchResult
+from app.services.search_index_service import (
+    SearchIndexService,
+    movie_search_index,
+    person_search_index,
+)
+from app.services.tmdb_service import TMDBService
+from app.services.user_service import UserService
+from app.database import SessionLocal
+
+
+class SearchService:
+    """통합 검색 서비스
+
+    DB에 저장된 영화/인물/사용자를 먼저 검색하고, 로컬 결과가 부족한 유형만
+    TMDB에서 동시에 보완한 뒤 TMDB ID 기준으로 중복을 제거해 합친다.
+    """
+
+    RESULT_LIMIT = 20  # 유형별 최대 결과 수
+    MIN_LOCAL_RESULTS = 5  # 이보다 적으면 TMDB 보완 검색
+
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
+        self.settings = get_settings()
+        self.tmdb_service = TMDBService()
+        self.user_service = UserService(db)
+
+    def _get_db(self) -> Session:
+        """데이터베이스 세션 생성 (요청 단위 세션이 주입되면 재사용)"""
+        if self.db is not None:
+            return self.db
+        return SessionLocal()
+
+    async def search(self, query: str, language: str = "ko-KR") -> List[SearchResult]:
+        """영화/인물/사용자 통합 검색"""
+        db = self._get_db()
+        try:
+            movies = self._search_local_movies_with_db(query, db)
+            persons = self._search_local_persons_with_db(query, db)
+        except Exception as e:
+            raise Exception(f"로컬 검색 실패: {str(e)}")
+        finally:
+            db.close()
+
+        users = await self.user_service.search_users_by_name(name=query)
+
+        # 로컬 결과가 부족한 유형만 TMDB에서 동시에 검색
+        tmdb_movies, tmdb_persons = await asyncio.gather(
+            self._search_tmdb_movies(query, language, len(movies)),
+            self._search_tmdb_persons(query, language, len(persons)),
+        )
+
+        results: List[SearchResult] = []
+        results += self._merge(movies, tmdb_movies)
+        results += self._merge(persons, tmdb_persons)
+        results += users
+        return results
+
+    def _merge(self, local: list, remote: list) -> list:
+        """로컬 결과 우선으로 TMDB ID 기준 중복 제거"""
+        seen = {item.id for item in local}
+        merged = list(local)
+        for item in remote:
+            if item.id not in seen:
+                seen.add(item.id)
+                merged.append(item)
+        return merged[: self.RESULT_LIMIT]
+
+    def _search_ids_with_db(
+        self, index: SearchIndexService, model, id_column, fields, popularity, query, db: Session
+    ) -> list:
+        """검색 색인으로 모델 조회 (색인 준비 전에는 ILIKE 검색)"""
+        ids = index.search(query, 0, self.RESULT_LIMIT, db)
+
+        if ids is None:
+            stmt = (
+                select(model)
+                .where(or_(*(field.ilike(f"%{query}%") for field in fields)))
+                .order_by(desc(popularity))
+                .limit(self.RESULT_LIMIT)
+            )
+            return db.execute(stmt).scalars().all()
+        if not ids:
+            return []
+
+        rows_by_id = {
+            getattr(row, id_column.key): row
+            for row in db.execute(select(model).where(id_column.in_(ids))).scalars()
+        }
+        return [rows_by_id[entity_id] for entity_id in ids if entity_id in rows_by_id]
+
+    def _search_local_movies_with_db(self, query: str, db: Session) -> List[MovieSearchResult]:
+        """DB 영화 검색"""
+        movies = self._search_ids_with_db(
+            movie_search_index,
+            MovieModel,
+            MovieModel.movie_id,
+            (MovieModel.title, MovieModel.original_title),
+            MovieModel.average_rating,
+            query,
+            db,
+        )
+        return [
+            MovieSearchResult(
+                id=movie.movie_id,
+                title=movie.title,
+                overview=movie.overview,
+                release_date=movie.release_date,
+                poster_path=self._image_path(movie.poster_url),
+                vote_average=float(movie.average_rating or 0),
+            )
+            for movie in movies
+            if not movie.is_adult
+        ]
+
+    def _search_local_persons_with_db(self, query: str, db: Session) -> List[PersonSearchResult]:
+        """DB 인물 검색"""
+        persons = self._search_ids_with_db(
+            person_search_index,
+            PersonModel,
+            PersonModel.person_id,
+            (PersonModel.name, PersonModel.original_name),
+            PersonModel.popularity,
+            query,
+            db,
+        )
+        return [
+            PersonSearchResult(
+                id=person.person_id,
+                name=person.name,
+                profile_path=self._image_path(person.profile_image_url),
+            )
+            for person in persons
+        ]
+
+    async def _search_tmdb_movies(
+        self, query: str, language: str, local_count: int
+    ) -> List[MovieSearchResult]:
+        """로컬 영화 결과가 부족할 때 TMDB 영화 검색"""
+        if local_count >= self.MIN_LOCAL_RESULTS:
+            return []
+
+        data = await self.tmdb_service.search_movie_by_title(query, language)
+        if not data:
+            return []
+        return [self.tmdb_service.to_movie_search_result(item) for item in data.get("results", [])]
+
+    async def _search_tmdb_persons(
+        self, query: str, language: str, local_count: int
+    ) -> List[PersonSearchResult]:
+        """로컬 인물 결과가 부족할 때 TMDB 인물 검색"""
+        if local_count >= self.MIN_LOCAL_RESULTS:
+            return []
+
+        data = await self.tmdb_service.search_person(query, language)
+        if not data:
+            return []
+        return [self.tmdb_service.to_person_search_result(item) for item in data.get("results", [])]
+
+    def _image_path(self, url: Optional[str]) -> Optional[str]:
+        """저장된 TMDB 이미지 URL을 검색 결과용 경로로 변환 (예: .../w500/abc.jpg -> /abc.jpg)"""
+        if not url or not url.startswith(self.settings.tmdb_image_base_url):
+            return url
+        _, _, path = url[len(self.settings.tmdb_image_base_url) :].partition("/")
+        return f"/{path}" if path else None
@@ -0,0 +1,154 @@
+# app/services/suggest_service.py
+
+import threading
+import time
+from typing import List, Optional
+from sqlalchemy import select
+from app.core.suggest_index import Suggestion, SuggestIndex
+from app.database import SessionLocal
+from app.models.movie import MovieModel
+from app.models.person import PersonModel
+
+
+class SuggestService:
+    """검색어 자동완성 서비스
+
+    영화 제목/원제와 인물 이름의 접두어 색인(SuggestIndex)을 워커 프로세스마다 유지한다.
+    MovieService/PersonService가 TMDB에서 새 행을 저장하면 즉시 색인에 추가하고,
+    다른 워커에서 저장된 행은 주기적인 전체 빌드로 반영한다.
+    """
+
+    REBUILD_INTERVAL = 600  # 전체 재빌드 주기 (초)
+    BUILD_BATCH_SIZE = 10000
+
+    def __init__(self):
+        self._index: Optional[SuggestIndex] = None
+        self._pending: List[tuple] = []
+        self._last_build = 0.0
+        self._building = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_ready(self) -> bool:
+        return self._index is not None
+
+    def suggest(self, query: str, limit: int = 10) -> List[Suggestion]:
+        """검색어로 시작하는 영화/인물 추천 (색인 준비 전이면 빈 목록)"""
+        if self._index is None or time.monotonic() - self._last_build > self.REBUILD_INTERVAL:
+            self.start_build()
+        if self._index is None:
+            return []
+        return self._index.suggest(query, limit)
+
+    def start_build(self):
+        """백그라운드 전체 빌드 시작 (이미 진행 중이면 무시)"""
+        with self._lock:
+            if self._building:
+                return
+            self._building = True
+            self._last_build = time.monotonic()
+
+        threading.Thread(target=self._build, name="suggest-index", daemon=True).start()
+
+    def add_movie(self, movie: MovieModel):
+        """새로 저장된 영화를 색인에 반영"""
+        if movie.is_adult:
+            return
+        self._add(
+            (
+                "movie",
+                movie.movie_id,
+                (movie.title, movie.original_title),
+                movie.poster_url,
+                float(movie.average_rating or 0) * 10,
+            )
+        )
+
+    def add_person(self, person: PersonModel):
+        """새로 저장되거나 갱신된 인물을 색인에 반영"""
+        if person.is_adult:
+            return
+        self._add(
+            (
+                "person",
+                person.person_id,
+                (person.name, person.original_name),
+                person.profile_image_url,
+                person.popularity or 0,
+            )
+        )
+
+    def _add(self, item: tuple):
+        try:
+            with self._lock:
+                if self._building:
+                    # 빌드 중 저장된 행은 새 색인 교체 후 반영
+                    self._pending.append(item)
+                if self._index is not None:
+                    self._index.add(*item)
+        except Exception as e:
+            print(f"자동완성 색인 추가 실패: {str(e)}")
+
+    def _items(self, db):
+        """색인 대상 (유형, ID, 검색 필드, 이미지 URL, 점수) 목록"""
+        movies = db.execute(
+            select(
+                MovieModel.movie_id,
+                MovieModel.title,
+                MovieModel.original_title,
+                MovieModel.poster_url,
+                MovieModel.average_rating,
+            )
+            .where(MovieModel.is_adult.is_(False))
+            .execution_options(yield_per=self.BUILD_BATCH_SIZE)
+        )
+        for movie_id, title, original_title, poster_url, average_rating in movies:
+            score = float(average_rating or 0) * 10
+            yield "movie", movie_id, (title, original_title), poster_url, score
+
+        persons = db.execute(
+            select(
+                PersonModel.person_id,
+                PersonModel.name,
+                PersonModel.original_name,
+                PersonModel.profile_image_url,
+                PersonModel.popularity,
+            )
+            .where(PersonModel.is_adult.is_(False))
+            .execution_options(yield_per=self.BUILD_BATCH_SIZE)
+        )
+        for person_id, name, original_name, profile_image_url, popularity in persons:
+            yield "person", person_id, (name, original_name), profile_image_url, popularity or 0
+
+    def _build(self):
+        """전체 색인 빌드 후 교체"""
+        db = SessionLocal()
+        try:
+            started = time.perf_counter()
+            index = SuggestIndex.build(
+                (media_type, entity_id, [field for field in fields if field], image_url, score)
+                for media_type, entity_id, fields, image_url, score in self._items(db)
+            )
+
+            with self._lock:
+                for item in self._pending:
+                    index.add(*item)
+                self._pending = []
+                self._index = index
+
+            print(
+                f"자동완성 색인 빌드 완료: {len(index)}건 "
+                f"({time.perf_counter() - started:.1f}초)"
+            )
+
+        except Exception as e:
+            print(f"자동완성 색인 빌드 실패: {str(e)}")
+        finally:
+            with self._lock:
+                self._building = False
+                self._pending = []
+            db.close()
+
+
+# 전역 인스턴스
+suggest_service = SuggestService()
@@ -0,0 +1,215 @@
+# app/services/summary_state_service.py
+
+import hashlib
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Tuple
+from sqlalchemy import select, func, and_
+from sqlalchemy.orm import Session
+from app.database import SessionLocal, dialect_insert
+from app.models.comment import CommentModel
+from app.models.movie import MovieModel
+from app.models.summary_state import SummaryStateModel
+from app.models.user import UserModel
+
+
+class SummaryDefinition(NamedTuple):
+    entity_type: str
+    model: type
+    id_column: object  # 엔티티 ID 컬럼
+    name_column: object  # 요약 프롬프트에 넣는 이름/제목 컬럼
+    review_date_column: object  # 마지막 요약 일시 컬럼
+    comment_column: object  # 댓글 테이블에서 엔티티 ID를 가리키는 컬럼
+
+
+PROFILE_SUMMARY = SummaryDefinition(
+    "profile",
+    UserModel,
+    UserModel.user_id,
+    UserModel.name,
+    UserModel.profile_review_date,
+    CommentModel.user_id,
+)
+MOVIE_SUMMARY = SummaryDefinition(
+    "movie",
+    MovieModel,
+    MovieModel.movie_id,
+    MovieModel.title,
+    MovieModel.concise_review_date,
+    CommentModel.movie_id,
+)
+
+
+class SummaryTarget(NamedTuple):
+    entity_id: int
+    name: str
+    comment_count: int
+    comment_watermark: Optional[datetime]
+    input_hash: Optional[str]  # 지난 요약 입력 해시 (기록 전이면 None)
+
+
+def summary_input_hash(comments: List[str]) -> str:
+    """요약에 넣는 댓글 텍스트 목록의 해시"""
+    digest = hashlib.blake2b(digest_size=16)
+    for comment in comments:
+        digest.update(comment.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class SummaryStateService:
+    """야간 AI 요약 변경 감지 서비스
+
+    요약 시점의 공개 댓글 수와 마지막 작성/수정 시각(watermark)을 summary_states에 기록하고,
+    둘 중 하나라도 달라진 엔티티만 다시 요약 대상으로 고른다 (추가/수정/삭제/공개 전환 감지).
+    상태 기록이 없는 엔티티는 마지막 요약 일시 이후 작성/수정된 댓글이 있을 때만 대상이 된다.
+    """
+
+    MIN_COMMENTS = 5  # 요약에 필요한 최소 공개 댓글 수
+    UPSERT_BATCH_SIZE = 1000
+
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
+
+    def _get_db(self) -> Session:
+        """데이터베이스 세션 생성"""
+        if self.db is not None:
+            return self.db
+        return SessionLocal()
+
+    def find_changed(self, definition: SummaryDefinition) -> Tuple[List[SummaryTarget], int]:
+        """다시 요약할 엔티티 목록과 댓글 변경이 없어 건너뛴 엔티티 수"""
+        db = self._get_db()
+        try:
+            return self._find_changed_with_db(definition, db)
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"요약 대상 조회 실패: {str(e)}")
+        finally:
+            db.close()
+
+    def record(self, definition: SummaryDefinition, target: SummaryTarget, input_hash: str):
+        """요약(또는 입력이 같아 생략)한 엔티티의 댓글 상태 기록"""
+        db = self._get_db()
+        try:
+            self._upsert_states_with_db(
+                definition,
+                [
+                    {
+                        "entity_id": target.entity_id,
+                        "comment_count": target.comment_count,
+                        "comment_watermark": target.comment_watermark,
+                        "input_hash": input_hash,
+                    }
+                ],
+                db,
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"요약 상태 기록 실패: {str(e)}")
+        finally:
+            db.close()
+
+    def _find_changed_with_db(
+        self, definition: SummaryDefinition, db: Session
+    ) -> Tuple[List[SummaryTarget], int]:
+        comment_count = func.count(CommentModel.comment_id)
+        watermark = func.max(func.coalesce(CommentModel.updated_at, CommentModel.created_at))
+        stmt = (
+            select(
+                definition.id_column.label("entity_id"),
+                definition.name_column.label("name"),
+                definition.review_date_column.label("review_date"),
+                comment_count.label("comment_count"),
+                watermark.label("comment_watermark"),
+                SummaryStateModel.comment_count.label("state_count"),
+                SummaryStateModel.comment_watermark.label("state_watermark"),
+                SummaryStateModel.input_hash.label("state_hash"),
+            )
+            .select_from(definition.model)
+            .join(CommentModel, definition.comment_column == definition.id_column)
+            .outerjoin(
+                SummaryStateModel,
+                and_(
+                    SummaryStateModel.entity_type == definition.entity_type,
+                    SummaryStateModel.entity_id == definition.id_column,
+                ),
+            )
+            .where(CommentModel.is_public == True)
+            .group_by(
+                definition.id_column,
+                definition.name_column,
+                definition.review_date_column,
+                SummaryStateModel.comment_count,
+                SummaryStateModel.comment_watermark,
+                SummaryStateModel.input_hash,
+            )
+            .having(comment_count >= self.MIN_COMMENTS)
+            .order_by(comment_count.desc())
+        )
+
+        changed = []
+        baseline = []
+        skipped = 0
+        for row in db.execute(stmt):
+            if row.state_count is not None:
+                is_changed = (
+                    row.state_count != row.comment_count
+                    or row.state_watermark != row.comment_watermark
+                )
+            elif row.review_date is not None:
+                # 상태 기록 전에 요약된 엔티티: 요약 일시 이후 작성/수정된 댓글이 있을 때만
+                is_changed = (
+                    row.comment_watermark is None or row.comment_watermark > row.review_date
+                )
+                if not is_changed:
+                    baseline.append(
+                        {
+                            "entity_id": row.entity_id,
+                            "comment_count": row.comment_count,
+                            "comment_watermark": row.comment_watermark,
+                            "input_hash": None,
+                        }
+                    )
+            else:
+                is_changed = True
+
+            if is_changed:
+                changed.append(
+                    SummaryTarget(
+                        row.entity_id,
+                        row.name,
+                        row.comment_count,
+                        row.comment_watermark,
+                        row.state_hash,
+                    )
+                )
+            else:
+                skipped += 1
+
+        if baseline:
+            self._upsert_states_with_db(definition, baseline, db)
+            db.commit()
+
+        return changed, skipped
+
+    def _upsert_states_with_db(self, definition: SummaryDefinition, rows: List[dict], db: Session):
+        """댓글 상태 일괄 upsert"""
+        states = SummaryStateModel.__table__
+        for start in range(0, len(rows), self.UPSERT_BATCH_SIZE):
+            stmt = dialect_insert(db, states).values(
+                [
+                    {"entity_type": definition.entity_type, **row}
+                    for row in rows[start : start + self.UPSERT_BATCH_SIZE]
+                ]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[states.c.entity_type, states.c.entity_id],
+                set_={
+                    "comment_count": stmt.excluded.comment_count,
+                    "comment_watermark": stmt.excluded.comment_watermark,
+                    "input_hash": stmt.excluded.input_hash,
+                    "updated_at": func.current_timestamp(),
+                },
+            )
+            db.execute(stmt)
@@ -49,6 +49,27 @@ class TMDBService:
                 return f"https://www.youtube.com/watch?v={video.get('key')}"
         return None
 
+    def to_movie_search_result(self, result_data: dict) -> MovieSearchResult:
+        """TMDB 검색 결과 항목을 영화 검색 결과로 변환"""
+        return MovieSearchResult(
+            id=result_data.get("id"),
+            media_type="movie",
+            title=result_data.get("title", ""),
+            overview=result_data.get("overview"),
+            release_date=self._parse_date(result_data.get("release_date")),
+            poster_path=result_data.get("poster_path"),
+            vote_average=result_data.get("vote_average", 0.0),
+        )
+
+    def to_person_search_result(self, result_data: dict) -> PersonSearchResult:
+        """TMDB 검색 결과 항목을 인물 검색 결과로 변환"""
+        return PersonSearchResult(
+            id=result_data.get("id"),
+            media_type="person",
+            name=result_data.get("name", ""),
+            profile_path=result_data.get("profile_path"),
+        )
+
     async def get_popular_movies_top10(self, language: str = None) -> List[Movie]:
         if language is None:
             language = self.default_language
@@ -121,25 +142,9 @@ class TMDBService:
                     media_type = result_data.get("media_type")
 
                     if media_type == "movie":
-                        movie_result = MovieSearchResult(
-                            id=result_data.get("id"),
-                            media_type="movie",
-                            title=result_data.get("title", ""),
-                            overview=result_data.get("overview"),
-                            release_date=self._parse_date(result_data.get("release_date")),
-                            poster_path=result_data.get("poster_path"),
-                            vote_average=result_data.get("vote_average", 0.0),
-                        )
-                        results.append(movie_result)
-
+                        results.append(self.to_movie_search_result(result_data))
                     elif media_type == "person":
-                        person_result = PersonSearchResult(
-                            id=result_data.get("id"),
-                            media_type="person",
-                            name=result_data.get("name", ""),
-                            profile_path=result_data.get("profile_path"),
-                        )
-                        results.append(person_result)
+                        results.append(self.to_person_search_result(result_data))
 
                 return results
 
@@ -2,20 +2,23 @@
 
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, and_, or_
 from app.models.user_follow import UserFollowModel
 from app.models.user import UserModel
 from app.schemas.user_follow import UserFollow, FollowStats, FollowUser, FollowListResponse
 from app.database import SessionLocal
+from app.services.counter_service import CounterService
 
 
 class UserFollowService:
 
-    def __init__(self):
-        pass
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
 
     def _get_db(self) -> Session:
-        """데이터베이스 세션 생성"""
+        """데이터베이스 세션 생성 (요청 단위 세션이 주입되면 재사용)"""
+        if self.db is not None:
+            return self.db
         return SessionLocal()
 
     async def follow_user(self, follower_id: int, following_id: int) -> UserFollow:
@@ -242,24 +245,16 @@ class UserFollowService:
             return False
 
     def _get_followers_count_with_db(self, user_id: int, db: Session) -> int:
-        """팔로워 수 조회"""
+        """팔로워 수 조회 (entity_counters)"""
         try:
-            stmt = select(func.count(UserFollowModel.follower_id)).where(
-                UserFollowModel.following_id == user_id
-            )
-            result = db.execute(stmt)
-            return result.scalar() or 0
+            return CounterService(db).get_count_with_db("user", user_id, "followers_count", db)
         except Exception:
             return 0
 
     def _get_following_count_with_db(self, user_id: int, db: Session) -> int:
-        """팔로잉 수 조회"""
+        """팔로잉 수 조회 (entity_counters)"""
         try:
-            stmt = select(func.count(UserFollowModel.following_id)).where(
-                UserFollowModel.follower_id == user_id
-            )
-            result = db.execute(stmt)
-            return result.scalar() or 0
+            return CounterService(db).get_count_with_db("user", user_id, "following_count", db)
         except Exception:
             return 0
 
@@ -4,12 +4,9 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import select, func, case, and_
 from app.models.user import UserModel
-from app.models.user_follow import UserFollowModel
 from app.models.person_follow import PersonFollowModel
 from app.models.comment import CommentModel
 from app.models.comment_like import CommentLikeModel
-from app.models.movie_like import MovieLikeModel
-from app.models.watchlist import WatchlistModel
 from app.models.movie import MovieModel
 from app.models.person import PersonModel
 from app.schemas.user import (
@@ -22,6 +19,8 @@ from app.schemas.user import (
 from app.schemas.comment import CommentWithMovie
 from app.schemas.search import UserSearchResult
 from app.database import SessionLocal
+from app.services.counter_service import CounterService
+from app.services.search_index_service import user_search_index
 from app.core.auth import get_password_hash, verify_password
 from fastapi import UploadFile
 import uuid
@@ -30,11 +29,13 @@ from pathlib import Path
 
 class UserService:
 
-    def __init__(self):
-        pass
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
 
     def _get_db(self) -> Session:
-        """데이터베이스 세션 생성"""
+        """데이터베이스 세션 생성 (요청 단위 세션이 주입되면 재사용)"""
+        if self.db is not None:
+            return self.db
         return SessionLocal()
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
@@ -390,28 +391,39 @@ class UserService:
             db.close()
 
     async def get_following_persons_count(self, user_id: int) -> int:
-        """팔로우 중인 인물 총 개수"""
+        """팔로우 중인 인물 총 개수 (entity_counters)"""
         db = self._get_db()
         try:
-            stmt = select(func.count(PersonFollowModel.person_id)).where(
-                PersonFollowModel.user_id == user_id
+            return CounterService(db).get_count_with_db(
+                "user", user_id, "following_persons_count", db
             )
-            return db.execute(stmt).scalar() or 0
         except Exception:
             return 0
         finally:
             db.close()
 
-    async def search_users_by_name(self, name: str) -> List[UserSearchResult]:
+    async def search_users_by_name(self, name: str, limit: int = 50) -> List[UserSearchResult]:
+        """사용자 이름 검색 (검색 색인 우선, 색인 준비 전에는 ILIKE 검색)"""
         db = self._get_db()
         try:
-            stmt = (
-                select(UserModel)
-                .where(UserModel.name.ilike(f"%{name}%"))
-                .order_by(case((UserModel.name.ilike(f"{name}%"), 0), else_=1), UserModel.name)
-            )
-            result = db.execute(stmt)
-            return [UserSearchResult.from_orm(user_model) for user_model in result.scalars().all()]
+            user_ids = user_search_index.search(name, 0, limit, db)
+
+            if user_ids is None:
+                stmt = (
+                    select(UserModel)
+                    .where(UserModel.name.ilike(f"%{name}%"))
+                    .order_by(case((UserModel.name.ilike(f"{name}%"), 0), else_=1), UserModel.name)
+                    .limit(limit)
+                )
+                user_models = db.execute(stmt).scalars().all()
+            elif user_ids:
+                stmt = select(UserModel).where(UserModel.user_id.in_(user_ids))
+                users_by_id = {user.user_id: user for user in db.execute(stmt).scalars()}
+                user_models = [users_by_id[uid] for uid in user_ids if uid in users_by_id]
+            else:
+                user_models = []
+
+            return [UserSearchResult.from_orm(user_model) for user_model in user_models]
         except Exception as e:
             raise Exception(f"사용자 조회 실패: {str(e)}")
         finally:
@@ -529,66 +541,9 @@ class UserService:
         return result is not None
 
     async def _get_counts_with_db(self, user_id: int, db: Session) -> dict:
-        """모든 통계 정보를 한 번에 조회"""
+        """모든 통계 정보를 한 번에 조회 (entity_counters)"""
         try:
-            # 서브쿼리들 정의
-            followers_subq = (
-                select(func.count(UserFollowModel.follower_id))
-                .where(UserFollowModel.following_id == user_id)
-                .scalar_subquery()
-            )
-
-            following_subq = (
-                select(func.count(UserFollowModel.following_id))
-                .where(UserFollowModel.follower_id == user_id)
-                .scalar_subquery()
-            )
-
-            following_persons_subq = (
-                select(func.count(PersonFollowModel.person_id))
-                .where(PersonFollowModel.user_id == user_id)
-                .scalar_subquery()
-            )
-
-            comments_subq = (
-                select(func.count(CommentModel.comment_id))
-                .where(CommentModel.user_id == user_id)
-                .scalar_subquery()
-            )
-
-            liked_movies_subq = (
-                select(func.count(MovieLikeModel.movie_id))
-                .where(MovieLikeModel.user_id == user_id)
-                .scalar_subquery()
-            )
-
-            watchlist_subq = (
-                select(func.count(WatchlistModel.movie_id))
-                .where(WatchlistModel.user_id == user_id)
-                .scalar_subquery()
-            )
-
-            # 단일 쿼리로 모든 통계 조회
-            stmt = select(
-                followers_subq.label("followers_count"),
-                following_subq.label("following_count"),
-                following_persons_subq.label("following_persons_count"),
-                comments_subq.label("comments_count"),
-                liked_movies_subq.label("liked_movies_count"),
-                watchlist_subq.label("watchlist_count"),
-            )
-
-            result = db.execute(stmt)
-            stats = result.first()
-
-            return {
-                "followers_count": stats.followers_count or 0,
-                "following_count": stats.following_count or 0,
-                "following_persons_count": stats.following_persons_count or 0,
-                "comments_count": stats.comments_count or 0,
-                "liked_movies_count": stats.liked_movies_count or 0,
-                "watchlist_count": stats.watchlist_count or 0,
-            }
+            return CounterService(db).get_counts_with_db("user", [user_id], db)[user_id]
 
         except Exception:
             return {
@@ -0,0 +1,129 @@
+# scripts/bench_movie_embeddings.py
+
+"""
+영화 임베딩 색인 벤치마크
+
+합성 단위 벡터로 VectorIndex를 빌드(파일 기록 + memmap 열기)하고, /movies/{id}/similar
+(전체 top-K)와 추천 점수(후보 영화 유사도) 조회의 p50/p99 지연 시간을 측정합니다.
+--embed-sample을 주면 실제 문장 임베딩 모델의 처리량을 재서 전체 빌드 시간을 추정합니다.
+
+사용법:
+    python -m scripts.bench_movie_embeddings
+    python -m scripts.bench_movie_embeddings --movies 100000 --dim 768 --embed-sample 256
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+import numpy as np
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="영화 임베딩 색인 벤치마크")
+    parser.add_argument("--movies", type=int, default=100_000, help="합성 영화 수")
+    parser.add_argument("--dim", type=int, default=768, help="임베딩 차원")
+    parser.add_argument("--rounds", type=int, default=200, help="조회 반복 횟수")
+    parser.add_argument("--candidates", type=int, default=500, help="추천 점수 후보 수")
+    parser.add_argument("--embed-sample", type=int, default=0, help="모델 처리량 측정 문장 수")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def _percentiles(samples: List[float]) -> str:
+    quantiles = statistics.quantiles(samples, n=100)
+    return f"p50 {quantiles[49] * 1000:7.2f}ms  p99 {quantiles[98] * 1000:7.2f}ms"
+
+
+def _build(directory: Path, args, rng: np.random.Generator) -> float:
+    """1000건씩 기록 후 교체 (모델 계산 제외)"""
+    from app.core.vector_index import VectorIndexWriter
+
+    started = time.perf_counter()
+    writer = VectorIndexWriter(directory)
+    movie_ids = np.sort(rng.choice(args.movies * 10, size=args.movies, replace=False)) + 1
+    for start in range(0, args.movies, 1000):
+        ids = movie_ids[start : start + 1000]
+        vectors = rng.standard_normal((len(ids), args.dim), dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        writer.append(ids.tolist(), rng.integers(0, 2**63, len(ids)).tolist(), vectors)
+    writer.commit(model="synthetic")
+    return time.perf_counter() - started
+
+
+def _measure_model(args):
+    """실제 임베딩 모델 처리량 측정 (문서 길이는 줄거리 수준으로 가정)"""
+    from app.ai import embed_sentences
+    from app.services.movie_embedding_service import MovieEmbeddingService
+
+    documents = [
+        f"영화 {i}\n장르: 드라마, 스릴러\n출연: 배우 {i}, 배우 {i + 1}\n"
+        + "가족의 비밀이 드러나면서 평범했던 일상이 흔들리기 시작한다. " * 6
+        for i in range(args.embed_sample)
+    ]
+    batch_size = MovieEmbeddingService.EMBED_BATCH_SIZE
+    started = time.perf_counter()
+    for start in range(0, len(documents), batch_size):
+        embed_sentences(
+            documents[start : start + batch_size], max_length=MovieEmbeddingService.MAX_TOKENS
+        )
+    elapsed = time.perf_counter() - started
+    per_second = len(documents) / elapsed
+    print(
+        f"\n[모델] {per_second:.1f}건/초 -> 전체 {args.movies:,}건 추정 {args.movies / per_second / 60:.1f}분"
+    )
+    print("       (재빌드 시에는 내용이 바뀐 영화만 다시 계산)")
+
+
+def main():
+    args = _parse_args()
+    from app.core.vector_index import VectorIndex
+
+    rng = np.random.default_rng(args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        build_seconds = _build(directory, args, rng)
+
+        started = time.perf_counter()
+        index = VectorIndex.open(directory)
+        open_seconds = time.perf_counter() - started
+
+        size_mb = index.vectors.nbytes / 1024 / 1024
+        print(
+            f"색인 기록: {len(index):,}건 x {args.dim}차원, {build_seconds:.2f}초 ({size_mb:.0f}MB)"
+        )
+        print(f"색인 열기 (memmap): {open_seconds * 1000:.1f}ms")
+
+        # 첫 조회는 페이지 캐시 적재 포함
+        query_ids = rng.choice(index.ids, size=args.rounds)
+        started = time.perf_counter()
+        index.top_k(index.vector(int(query_ids[0])), 10)
+        print(f"첫 조회 (페이지 적재 포함): {(time.perf_counter() - started) * 1000:.1f}ms\n")
+
+        timings = []
+        for movie_id in query_ids:
+            query_started = time.perf_counter()
+            index.top_k(index.vector(int(movie_id)), 10, exclude_ids=[int(movie_id)])
+            timings.append(time.perf_counter() - query_started)
+        print(f"[비슷한 영화 top-10]      {_percentiles(timings)}")
+
+        timings = []
+        for _ in range(args.rounds):
+            watched = rng.choice(index.ids, size=20).tolist()
+            candidates = rng.choice(index.ids, size=args.candidates).tolist()
+            query_started = time.perf_counter()
+            taste = index.mean_vector(watched)
+            index.scores(taste, candidates)
+            timings.append(time.perf_counter() - query_started)
+        print(f"[추천 점수 {args.candidates}건]       {_percentiles(timings)}")
+
+        del index
+
+    if args.embed_sample:
+        _measure_model(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+# scripts/bench_search.py
+
+"""
+통합 검색 지연 시간 비교 벤치마크
+
+기존 /search 처리 방식(TMDB multi_search 후 사용자 검색을 순차 실행)과
+로컬 우선 SearchService의 p50/p99 지연 시간을 비교합니다.
+
+SQLite 픽스처에 합성 영화/인물/사용자를 저장한 뒤, 저장된 제목/이름(로컬 적중)과
+저장되지 않은 검색어(로컬 부족 → TMDB 보완)를 섞어 측정합니다.
+--simulate-tmdb-ms를 지정하면 TMDB 호출을 지정한 지연 시간의 가짜 응답으로 대체하고,
+지정하지 않으면 설정된 TMDB API를 실제로 호출합니다.
+
+사용법:
+    python -m scripts.bench_search --simulate-tmdb-ms 150
+    python -m scripts.bench_search --movies 20000 --rounds 300
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Awaitable, Callable, List
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="통합 검색 지연 시간 비교")
+    parser.add_argument("--movies", type=int, default=5000, help="픽스처 영화 수")
+    parser.add_argument("--persons", type=int, default=20000, help="픽스처 인물 수")
+    parser.add_argument("--users", type=int, default=2000, help="픽스처 사용자 수")
+    parser.add_argument("--rounds", type=int, default=200, help="방식별 검색 횟수")
+    parser.add_argument("--miss-ratio", type=float, default=0.2, help="로컬 미적중 검색어 비율")
+    parser.add_argument(
+        "--simulate-tmdb-ms", type=float, default=None, help="TMDB 응답 지연 시뮬레이션 (ms)"
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+SYLLABLES = "가나다라마바사아자차카타파하강민서준우지현수예은하도윤호진영성재연정유원상태희"
+
+
+def _word(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(length))
+
+
+def _seed_fixture(args, rng: random.Random) -> List[str]:
+    """픽스처 데이터 저장 후 로컬 적중 검색어 목록 반환"""
+    from sqlalchemy.orm import Session
+    from app.database import engine, Base, ensure_indexes
+    from app.models import MovieModel, PersonModel, UserModel
+
+    Base.metadata.create_all(bind=engine)
+    ensure_indexes(engine)
+
+    titles = [f"{_word(rng, 2)} {_word(rng, 3)}" for _ in range(args.movies)]
+    names = [_word(rng, 3) for _ in range(args.persons)]
+    with Session(engine) as db:
+        db.add_all(
+            MovieModel(
+                movie_id=i,
+                title=title,
+                poster_url=f"https://image.tmdb.org/t/p/w500/{i}.jpg",
+                average_rating=round(rng.uniform(0, 10), 2),
+            )
+            for i, title in enumerate(titles, 1)
+        )
+        db.add_all(
+            PersonModel(person_id=i, name=name, popularity=rng.randint(0, 100))
+            for i, name in enumerate(names, 1)
+        )
+        db.add_all(
+            UserModel(user_id=i, email=f"user{i}@example.com", name=_word(rng, 3))
+            for i in range(1, args.users + 1)
+        )
+        db.commit()
+
+    return [title.split()[0] for title in titles] + [name[:2] for name in names]
+
+
+def _simulate_tmdb(delay_ms: float):
+    """TMDB 호출을 고정 지연의 가짜 응답으로 대체"""
+    from app.services.tmdb_service import TMDBService
+
+    movie = {"id": 10**7, "title": "TMDB 영화", "vote_average": 7.0, "media_type": "movie"}
+    person = {"id": 10**7, "name": "TMDB 인물", "media_type": "person"}
+
+    async def fake_response(*args, **kwargs):
+        await asyncio.sleep(delay_ms / 1000)
+        return {"results": [movie, person]}
+
+    async def fake_multi_search(self, query, language=None):
+        data = await fake_response()
+        return [
+            self.to_movie_search_result(data["results"][0]),
+            self.to_person_search_result(data["results"][1]),
+        ]
+
+    TMDBService.search_movie_by_title = lambda self, *a, **kw: fake_response()
+    TMDBService.search_person = lambda self, *a, **kw: fake_response()
+    TMDBService.multi_search = fake_multi_search
+
+
+async def _measure(search: Callable[[str], Awaitable], queries: List[str]) -> List[float]:
+    timings = []
+    for query in queries:
+        started = time.perf_counter()
+        await search(query)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def _percentiles(samples: List[float]) -> str:
+    quantiles = statistics.quantiles(samples, n=100)
+    return f"p50 {quantiles[49] * 1000:8.2f}ms  p99 {quantiles[98] * 1000:8.2f}ms"
+
+
+async def _run(args, queries: List[str]):
+    from app.services.search_index_service import (
+        movie_search_index,
+        person_search_index,
+        user_search_index,
+    )
+    from app.services.search_service import SearchService
+    from app.services.tmdb_service import TMDBService
+    from app.services.user_service import UserService
+
+    # 색인 빌드 완료 대기 (첫 검색은 DB 검색으로 대체되므로 워밍업)
+    indexes = (movie_search_index, person_search_index, user_search_index)
+    for index in indexes:
+        index.start_build()
+    while not all(index.is_ready for index in indexes):
+        await asyncio.sleep(0.1)
+
+    tmdb_service = TMDBService()
+    user_service = UserService()
+    search_service = SearchService()
+
+    async def legacy_search(query: str):
+        results = await tmdb_service.multi_search(query=query, language="ko-KR")
+        results += await user_service.search_users_by_name(name=query)
+        return results
+
+    async def local_first_search(query: str):
+        return await search_service.search(query=query, language="ko-KR")
+
+    print(f"검색어 {len(queries)}개 (로컬 미적중 비율 {args.miss_ratio:.0%})")
+    print(f"  기존 (TMDB 우선)  {_percentiles(await _measure(legacy_search, queries))}")
+    print(f"  로컬 우선         {_percentiles(await _measure(local_first_search, queries))}")
+
+
+def main():
+    args = _parse_args()
+    rng = random.Random(args.seed)
+
+    # 픽스처 전용 SQLite DB (app.database import 전에 지정)
+    fixture_path = os.path.join(tempfile.mkdtemp(), "bench_search.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{fixture_path}"
+    os.environ.pop("REPLICA_DATABASE_URL", None)
+
+    from app.database import engine
+
+    engine.echo = False
+
+    if args.simulate_tmdb_ms is not None:
+        _simulate_tmdb(args.simulate_tmdb_ms)
+    elif not os.getenv("TMDB_API_KEY"):
+        print("TMDB_API_KEY가 없으면 --simulate-tmdb-ms를 지정해야 합니다")
+        sys.exit(2)
+
+    hits = _seed_fixture(args, rng)
+    queries = []
+    for _ in range(args.rounds):
+        if rng.random() < args.miss_ratio:
+            queries.append(_word(rng, 4))
+        else:
+            queries.append(rng.choice(hits))
+
+    asyncio.run(_run(args, queries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# scripts/bench_search_index.py
+
+"""
+인물 검색 색인 지연 시간 벤치마크
+
+합성 인물 데이터(기본 100만 건)로 NgramIndex를 빌드하고 검색어 유형별
+p50/p95/p99 지연 시간을 측정합니다. 비교용으로 ILIKE '%q%'와 같은 방식의
+선형 부분 문자열 검색도 일부 검색어에 대해 측정합니다.
+
+사용법:
+    python -m scripts.bench_search_index
+    python -m scripts.bench_search_index --size 200000 --rounds 200
+"""
+
+import argparse
+import random
+import resource
+import statistics
+import time
+from typing import Callable, Dict, List
+
+# 합성 이름 생성용 음절
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍전고문양손배백허남심노하곽성차주우구민유나진지엄채원천방공현함변염여추도소석선설마길연위표명기반왕금옥육인맹제모탁국어은편용예봉경"
+SYLLABLES = "민서준우지현수예은하도윤호진영성재연정유원상태희경승동혁환규석철미선혜주나리아보람소빛솔결찬율건"
+FIRST_NAMES = [
+    "james", "john", "robert", "michael", "william", "david", "mary", "patricia",
+    "jennifer", "linda", "elizabeth", "susan", "tom", "emma", "olivia", "noah",
+]  # fmt: skip
+LAST_NAMES = [
+    "smith", "johnson", "williams", "brown", "jones", "garcia", "miller", "davis",
+    "hanks", "cruise", "pitt", "depp", "stone", "watson", "evans", "hemsworth",
+]  # fmt: skip
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="인물 검색 색인 벤치마크")
+    parser.add_argument("--size", type=int, default=1_000_000, help="합성 인물 수")
+    parser.add_argument("--rounds", type=int, default=500, help="검색어 유형별 반복 횟수")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def _generate_rows(size: int, rng: random.Random) -> list:
+    """(ID, [이름, 원어 이름], 인기도) 목록 생성 (약 70% 한글 이름)"""
+    rows = []
+    for person_id in range(1, size + 1):
+        english = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        if rng.random() < 0.7:
+            given = "".join(rng.choice(SYLLABLES) for _ in range(2))
+            name = rng.choice(SURNAMES) + given
+        else:
+            name = english
+        popularity = int(rng.paretovariate(1.5) * 10)
+        rows.append((person_id, [name, english], popularity))
+    return rows
+
+
+def _query_sets(rows: list, rng: random.Random, rounds: int) -> Dict[str, List[str]]:
+    """검색어 유형별 샘플 (실제 데이터에서 추출)"""
+    from app.core.hangul import choseong, decompose, CHOSEONG, JUNGSEONG
+
+    korean = [row[1][0] for row in rng.sample(rows, rounds * 4) if not row[1][0].isascii()]
+    english = [row[1][1] for row in rng.sample(rows, rounds)]
+
+    def typing(name: str) -> str:
+        # 입력 중인 상태 (마지막 글자의 초성+중성까지만 입력)
+        jamo = decompose(name[-1])
+        return name[:-1] + chr(
+            0xAC00 + (CHOSEONG.index(jamo[0]) * 21 + JUNGSEONG.index(jamo[1])) * 28
+        )
+
+    return {
+        "완전 일치 (한글)": korean[:rounds],
+        "접두어 (성+1음절)": [name[:2] for name in korean[:rounds]],
+        "입력 중 (받침 미입력)": [typing(name) for name in korean[:rounds]],
+        "부분 일치 (이름만)": [name[1:] for name in korean[:rounds]],
+        "초성": [choseong(name) for name in korean[:rounds]],
+        "영문 성": [name.split()[1] for name in english],
+        "영문 부분": [name.split()[1][1:4] for name in english],
+    }
+
+
+def _percentiles(samples: List[float]) -> str:
+    samples = sorted(samples)
+    quantiles = statistics.quantiles(samples, n=100)
+    return (
+        f"p50 {quantiles[49] * 1000:7.3f}ms  p95 {quantiles[94] * 1000:7.3f}ms  "
+        f"p99 {quantiles[98] * 1000:7.3f}ms  max {samples[-1] * 1000:7.3f}ms"
+    )
+
+
+def _measure(search: Callable[[str], list], queries: List[str]) -> List[float]:
+    timings = []
+    for query in queries:
+        started = time.perf_counter()
+        search(query)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def _max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    args = _parse_args()
+    from app.core.search_index import NgramIndex
+
+    rng = random.Random(args.seed)
+
+    print(f"합성 데이터 생성: {args.size:,}건")
+    rows = _generate_rows(args.size, rng)
+    queries = _query_sets(rows, rng, args.rounds)
+    rss_before = _max_rss_mb()
+
+    started = time.perf_counter()
+    index = NgramIndex.build(rows)
+    print(
+        f"색인 빌드: {time.perf_counter() - started:.1f}초, "
+        f"최대 RSS 증가 약 {_max_rss_mb() - rss_before:.0f}MB\n"
+    )
+
+    print("[NgramIndex] 상위 20건")
+    for label, samples in queries.items():
+        print(f"  {label:<16} {_percentiles(_measure(lambda q: index.search(q, 0, 20), samples))}")
+
+    # 비교: ILIKE '%q%' + ORDER BY popularity와 같은 선형 스캔 (검색어 일부만)
+    names = [(row[1][0].lower(), row[1][1].lower(), row[2]) for row in rows]
+
+    def linear_scan(query: str) -> list:
+        query = query.lower()
+        matches = [row for row in names if query in row[0] or query in row[1]]
+        matches.sort(key=lambda row: -row[2])
+        return matches[:20]
+
+    print("\n[선형 스캔 (ILIKE 대응)] 상위 20건")
+    for label in ("완전 일치 (한글)", "영문 부분"):
+        samples = queries[label][: max(5, args.rounds // 50)]
+        print(f"  {label:<16} {_percentiles(_measure(linear_scan, samples))}")
+
+
+if __name__ == "__main__":
+    main()
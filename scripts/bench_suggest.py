@@ -0,0 +1,105 @@
+# scripts/bench_suggest.py
+
+"""
+자동완성 색인 지연 시간 벤치마크
+
+합성 영화 제목과 인물 이름으로 SuggestIndex를 빌드하고, 키 입력마다 호출되는
+/search/suggest 상황을 가정해 검색어 길이/유형별 p50/p99 지연 시간을 측정합니다.
+
+사용법:
+    python -m scripts.bench_suggest
+    python -m scripts.bench_suggest --movies 300000 --persons 1000000
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Dict, List
+
+SYLLABLES = "가나다라마바사아자차카타파하강민서준우지현수예은하도윤호진영성재연정유원상태희"
+WORDS = [
+    "the", "dark", "knight", "star", "wars", "love", "story", "night", "city", "lost",
+    "king", "return", "last", "man", "war", "world", "home", "alone", "big", "little",
+]  # fmt: skip
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="자동완성 색인 벤치마크")
+    parser.add_argument("--movies", type=int, default=100_000, help="합성 영화 수")
+    parser.add_argument("--persons", type=int, default=500_000, help="합성 인물 수")
+    parser.add_argument("--rounds", type=int, default=2000, help="검색어 유형별 반복 횟수")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def _hangul(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(length))
+
+
+def _generate_items(args, rng: random.Random) -> list:
+    """(유형, ID, 검색 필드, 이미지 URL, 점수) 목록 생성"""
+    items = []
+    for movie_id in range(1, args.movies + 1):
+        english = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4)))
+        title = f"{_hangul(rng, 2)} {_hangul(rng, rng.randint(1, 3))}"
+        items.append(("movie", movie_id, [title, english], None, rng.uniform(0, 100)))
+    for person_id in range(1, args.persons + 1):
+        name = _hangul(rng, 3)
+        items.append(("person", person_id, [name], None, int(rng.paretovariate(1.5) * 10)))
+    return items
+
+
+def _query_sets(items: list, rng: random.Random, rounds: int) -> Dict[str, List[str]]:
+    """검색어 유형별 샘플 (입력 중인 상태 포함)"""
+    from app.core.hangul import choseong, decompose, CHOSEONG
+
+    sample = [rng.choice(items)[2][0] for _ in range(rounds)]
+    english = [rng.choice(items[:1000])[2][1] for _ in range(rounds)]
+
+    return {
+        "초성 1자": [rng.choice(CHOSEONG) for _ in range(rounds)],
+        "완성 1음절": [name[0] for name in sample],
+        "입력 중 (자음만)": [name[0] + decompose(name[1])[0] for name in sample],
+        "완성 2음절": [name[:2] for name in sample],
+        "초성 전체": [choseong(name) for name in sample],
+        "영문 1자": [name[0] for name in english],
+        "영문 단어": [name.split()[-1][:3] for name in english],
+    }
+
+
+def _percentiles(samples: List[float]) -> str:
+    quantiles = statistics.quantiles(samples, n=100)
+    return f"p50 {quantiles[49] * 1000:7.3f}ms  p99 {quantiles[98] * 1000:7.3f}ms"
+
+
+def main():
+    args = _parse_args()
+    from app.core.suggest_index import SuggestIndex
+
+    rng = random.Random(args.seed)
+    items = _generate_items(args, rng)
+    queries = _query_sets(items, rng, args.rounds)
+
+    started = time.perf_counter()
+    index = SuggestIndex.build(items)
+    print(f"색인 빌드: {len(index):,}건, {time.perf_counter() - started:.1f}초\n")
+
+    # 빌드 이후 수집된 항목 추가 (증분 반영)
+    started = time.perf_counter()
+    for offset in range(1000):
+        index.add("movie", 10**7 + offset, [f"{_hangul(rng, 2)} 신작"], None, 50.0)
+    print(f"증분 추가 1,000건: {(time.perf_counter() - started) * 1000:.1f}ms\n")
+
+    print("[SuggestIndex] 상위 10건 (첫 호출 포함)")
+    for label, samples in queries.items():
+        timings = []
+        for query in samples:
+            query_started = time.perf_counter()
+            index.suggest(query, 10)
+            timings.append(time.perf_counter() - query_started)
+        print(f"  {label:<14} {_percentiles(timings)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+# scripts/index_advisor.py
+
+"""
+핫 쿼리 인덱스 점검 도구
+
+서비스 계층의 주요 조회 쿼리를 EXPLAIN으로 재실행하고 풀 스캔이 발생하는 쿼리를 보고합니다.
+
+사용법:
+    python -m scripts.index_advisor                      # DATABASE_URL 대상
+    python -m scripts.index_advisor --url sqlite://      # 로컬 SQLite 픽스처 (스키마 자동 생성)
+    python -m scripts.index_advisor --url postgresql://localhost/mm_test --create-schema
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="핫 쿼리 EXPLAIN 기반 인덱스 점검")
+    parser.add_argument("--url", default=None, help="점검할 DB URL (기본값: DATABASE_URL)")
+    parser.add_argument(
+        "--create-schema",
+        action="store_true",
+        help="모델 기준으로 테이블/인덱스 생성 후 점검 (SQLite는 항상 생성)",
+    )
+    parser.add_argument("--strict", action="store_true", help="풀 스캔이 있으면 종료 코드 1 반환")
+    return parser.parse_args()
+
+
+def _hot_queries() -> List[Tuple[str, Callable]]:
+    """서비스 계층의 주요 조회 쿼리 (서비스 코드와 동일한 조건)"""
+    from sqlalchemy import select, func, and_, desc, or_
+    from app.models import (
+        CommentModel,
+        CommentLikeModel,
+        UserModel,
+        UserFollowModel,
+        PersonModel,
+        PersonFollowModel,
+        MovieCastModel,
+        MovieGenreModel,
+        MovieLikeModel,
+        MovieModel,
+    )
+
+    now = datetime.utcnow()
+
+    return [
+        (
+            "CommentService.get_movie_comments",
+            lambda: select(CommentModel)
+            .where(and_(CommentModel.movie_id == 1, CommentModel.is_public == True))
+            .order_by(desc(CommentModel.created_at))
+            .limit(20),
+        ),
+        (
+            "UserService.get_user_comments_with_movies",
+            lambda: select(CommentModel)
+            .where(CommentModel.user_id == 1)
+            .order_by(CommentModel.created_at.desc())
+            .limit(20),
+        ),
+        (
+            "FeedService.get_user_feed",
+            lambda: select(CommentModel)
+            .where(CommentModel.user_id.in_([1, 2, 3]))
+            .order_by(desc(CommentModel.created_at))
+            .limit(21),
+        ),
+        (
+            "FeedService.get_trending_feed",
+            lambda: select(func.count(CommentModel.comment_id)).where(
+                CommentModel.created_at >= now - timedelta(hours=24)
+            ),
+        ),
+        (
+            "CommentService._get_comment_likes_count_with_db",
+            lambda: select(func.count(CommentLikeModel.comment_id)).where(
+                CommentLikeModel.comment_id == 1
+            ),
+        ),
+        (
+            "UserFollowService.get_followers",
+            lambda: select(UserModel.user_id, UserModel.name)
+            .join(UserFollowModel, UserModel.user_id == UserFollowModel.follower_id)
+            .where(UserFollowModel.following_id == 1)
+            .limit(20),
+        ),
+        (
+            "UserFollowService._get_followers_count_with_db",
+            lambda: select(func.count(UserFollowModel.follower_id)).where(
+                UserFollowModel.following_id == 1
+            ),
+        ),
+        (
+            "PersonService._get_person_followers_count_with_db",
+            lambda: select(func.count(PersonFollowModel.user_id)).where(
+                PersonFollowModel.person_id == 1
+            ),
+        ),
+        (
+            "PersonCreditsService.rebuild_document_with_db",
+            lambda: select(MovieCastModel.movie_id, MovieModel.title)
+            .select_from(MovieCastModel)
+            .outerjoin(MovieModel, MovieCastModel.movie_id == MovieModel.movie_id)
+            .where(MovieCastModel.person_id == 1),
+        ),
+        (
+            "PersonService._search_persons_in_db",
+            lambda: select(PersonModel)
+            .where(
+                or_(
+                    PersonModel.name.ilike("%query%"),
+                    PersonModel.original_name.ilike("%query%"),
+                )
+            )
+            .limit(20),
+        ),
+        (
+            "UserService.search_users_by_name",
+            lambda: select(UserModel).where(UserModel.name.ilike("%query%")),
+        ),
+        (
+            "GenreService.get_movies_by_genre",
+            lambda: select(MovieModel)
+            .join(MovieGenreModel, MovieModel.movie_id == MovieGenreModel.movie_id)
+            .where(MovieGenreModel.genre_id == 1)
+            .limit(20),
+        ),
+        (
+            "MovieService._get_movie_likes_count_with_db",
+            lambda: select(func.count(MovieLikeModel.user_id)).where(MovieLikeModel.movie_id == 1),
+        ),
+    ]
+
+
+def _compile(conn, stmt) -> Tuple[str, object]:
+    """바인딩 파라미터를 유지한 채 드라이버용 SQL로 컴파일"""
+    compiled = stmt.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+    params = compiled.params
+    if compiled.positional:
+        return compiled.string, tuple(params[name] for name in compiled.positiontup)
+    return compiled.string, params
+
+
+def _full_scans_postgresql(conn, sql: str, params) -> List[str]:
+    """PostgreSQL 실행 계획에서 Seq Scan 노드 수집"""
+    raw = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}", params).scalar()
+    plan = raw if isinstance(raw, list) else json.loads(raw)
+
+    scans = []
+    stack = [plan[0]["Plan"]]
+    while stack:
+        node = stack.pop()
+        if node.get("Node Type") == "Seq Scan":
+            scans.append(f"Seq Scan on {node.get('Relation Name')}")
+        stack.extend(node.get("Plans", []))
+    return scans
+
+
+def _full_scans_sqlite(conn, sql: str, params) -> List[str]:
+    """SQLite 실행 계획에서 SCAN 단계 수집"""
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return [row[3] for row in rows if row[3].startswith("SCAN ")]
+
+
+def run(url: str, create_schema: bool) -> int:
+    """핫 쿼리 점검 실행, 풀 스캔이 발생한 쿼리 수 반환"""
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.pool import StaticPool
+    from app.database import Base, ensure_indexes
+    import app.models  # noqa: F401  모델 메타데이터 등록
+
+    is_sqlite = url.startswith("sqlite")
+    engine_kwargs = {"poolclass": StaticPool} if is_sqlite else {}
+    target_engine = create_engine(url, **engine_kwargs)
+
+    if is_sqlite or create_schema:
+        Base.metadata.create_all(bind=target_engine)
+        ensure_indexes(target_engine)
+
+    dialect = target_engine.dialect.name
+    if dialect == "postgresql":
+        collect = _full_scans_postgresql
+    elif dialect == "sqlite":
+        collect = _full_scans_sqlite
+    else:
+        print(f"지원하지 않는 DB입니다: {dialect}")
+        return 0
+
+    print(f"인덱스 점검 대상: {target_engine.url.render_as_string(hide_password=True)}")
+
+    queries = _hot_queries()
+    flagged = 0
+    with target_engine.connect() as conn:
+        if dialect == "postgresql":
+            # 빈 픽스처에서도 사용 가능한 인덱스가 있으면 인덱스를 타도록 강제
+            conn.execute(text("SET enable_seqscan = off"))
+
+        for name, build in queries:
+            sql, params = _compile(conn, build())
+            scans = collect(conn, sql, params)
+            if scans:
+                flagged += 1
+                print(f"[FULL SCAN] {name}")
+                for scan in scans:
+                    print(f"    - {scan}")
+            else:
+                print(f"[OK]        {name}")
+
+    print(f"점검 완료: 전체 {len(queries)}개 중 풀 스캔 {flagged}개")
+    return flagged
+
+
+def main():
+    args = _parse_args()
+    url = args.url or os.getenv("DATABASE_URL")
+    if not url:
+        print("--url 또는 DATABASE_URL 환경 변수가 필요합니다")
+        sys.exit(2)
+
+    # app.database가 import 시점에 엔진을 생성하므로 대상 URL을 기본값으로 지정
+    os.environ.setdefault("DATABASE_URL", url)
+
+    flagged = run(url, args.create_schema)
+    if args.strict and flagged:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+# tests/test_database_routing.py
+
+import os
+import tempfile
+
+# app.database는 임포트 시 DATABASE_URL로 엔진을 만든다 (테스트에서는 아래 픽스처가 교체)
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.gettempdir(), 'mm_test_primary.db')}"
+)
+
+import pytest
+from fastapi import FastAPI, Header
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, String, create_engine, insert, select, update
+from sqlalchemy.orm import declarative_base
+from app import database
+from app.database import (
+    PRIMARY_STICKY_COOKIE,
+    RequestSession,
+    RoutingSession,
+    route_db_requests,
+    route_request,
+    set_request_user,
+)
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "routing_items"
+
+    item_id = Column(Integer, primary_key=True)
+    name = Column(String(20), nullable=False)
+
+
+@pytest.fixture
+def engines(tmp_path, monkeypatch):
+    """주 DB / 복제본 역할의 SQLite 파일 두 개 (각각 자기 이름이 적힌 행 1개)"""
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    for bind, name in ((primary, "primary"), (replica, "replica")):
+        Base.metadata.create_all(bind)
+        with bind.begin() as conn:
+            conn.execute(insert(Item).values(item_id=1, name=name))
+
+    monkeypatch.setattr(database, "engine", primary)
+    monkeypatch.setattr(database, "replica_engine", replica)
+    database._sticky_users.clear()
+    yield primary, replica
+
+    database._sticky_users.clear()
+    primary.dispose()
+    replica.dispose()
+
+
+def _read_name(session) -> str:
+    """조회가 간 DB의 이름 (행 1의 name)"""
+    return session.execute(select(Item.name).where(Item.item_id == 1)).scalar_one()
+
+
+def _names(bind):
+    with bind.connect() as conn:
+        return sorted(conn.execute(select(Item.name)).scalars())
+
+
+def _write(session, item_id: int):
+    session.add(Item(item_id=item_id, name=f"item{item_id}"))
+    session.commit()
+
+
+def test_reads_go_to_replica(engines):
+    primary, replica = engines
+    session = RoutingSession(bind=primary)
+    try:
+        with route_request():
+            assert _read_name(session) == "replica"
+        # 요청 밖(스케줄러 등)의 조회도 복제본
+        assert _read_name(session) == "replica"
+    finally:
+        session.close()
+
+
+def test_flush_goes_to_primary_and_session_sticks(engines):
+    primary, replica = engines
+    session = RoutingSession(bind=primary)
+    try:
+        with route_request():
+            assert _read_name(session) == "replica"
+            session.add(Item(item_id=2, name="item2"))
+            session.flush()
+            # 한 번 쓴 세션은 이후 조회도 주 DB
+            assert _read_name(session) == "primary"
+            session.commit()
+            assert _read_name(session) == "primary"
+    finally:
+        session.close()
+
+    assert _names(primary) == ["item2", "primary"]
+    assert _names(replica) == ["replica"]
+
+
+def test_dml_goes_to_primary(engines):
+    primary, replica = engines
+    session = RoutingSession(bind=primary)
+    try:
+        with route_request():
+            session.execute(update(Item).where(Item.item_id == 1).values(name="updated"))
+            assert session.info["primary"]
+            session.commit()
+    finally:
+        session.close()
+
+    assert _names(primary) == ["updated"]
+    assert _names(replica) == ["replica"]
+
+
+def test_user_reads_from_primary_after_commit(engines):
+    primary, _ = engines
+    session = RoutingSession(bind=primary)
+    try:
+        with route_request() as state:
+            set_request_user(7)
+            _write(session, 2)
+            assert state["wrote"]
+    finally:
+        session.close()
+
+    # 같은 사용자의 다음 요청은 주 DB, 다른 사용자는 복제본
+    for user_id, expected in ((7, "primary"), (8, "replica")):
+        session = RoutingSession(bind=primary)
+        try:
+            with route_request():
+                set_request_user(user_id)
+                assert _read_name(session) == expected
+        finally:
+            session.close()
+
+
+def test_read_only_request_does_not_stick(engines):
+    primary, _ = engines
+    session = RoutingSession(bind=primary)
+    try:
+        with route_request() as state:
+            set_request_user(7)
+            _read_name(session)
+            session.commit()
+            assert not state["wrote"]
+    finally:
+        session.close()
+
+    assert 7 not in database._sticky_users
+
+
+def test_service_rollback_keeps_request_writes(engines):
+    primary, _ = engines
+    session = RequestSession(bind=primary)
+    try:
+        with route_request():
+            session.add(Item(item_id=2, name="item2"))
+            session.flush()
+            # 다른 서비스의 except 블록 rollback()은 요청 세션의 변경을 되돌리지 않는다
+            session.rollback()
+            session.commit()
+    finally:
+        session.release()
+
+    assert _names(primary) == ["item2", "primary"]
+
+
+def test_request_session_recovers_from_failed_flush(engines):
+    primary, _ = engines
+    session = RequestSession(bind=primary)
+    try:
+        with route_request():
+            session.add(Item(item_id=1, name="duplicate"))
+            with pytest.raises(Exception):
+                session.flush()
+            # 쓸 수 없게 된 트랜잭션은 실제로 롤백해 이후 쿼리가 가능해야 한다
+            session.rollback()
+            _write(session, 2)
+    finally:
+        session.release()
+
+    assert _names(primary) == ["item2", "primary"]
+
+
+@pytest.fixture
+def client(engines):
+    """라우팅 미들웨어를 건 최소 앱 (X-User-Id 헤더로 로그인 사용자 흉내)"""
+    primary, _ = engines
+    app = FastAPI()
+    app.middleware("http")(route_db_requests)
+
+    def _session(user_id):
+        if user_id is not None:
+            set_request_user(user_id)
+        return RoutingSession(bind=primary)
+
+    @app.get("/items/1")
+    def read_item(x_user_id: int = Header(default=None)):
+        session = _session(x_user_id)
+        try:
+            return {"name": _read_name(session)}
+        finally:
+            session.close()
+
+    @app.post("/items/{item_id}")
+    def create_item(item_id: int, x_user_id: int = Header(default=None)):
+        session = _session(x_user_id)
+        try:
+            _write(session, item_id)
+            return {"item_id": item_id}
+        finally:
+            session.close()
+
+    return TestClient(app)
+
+
+def test_cookie_routes_next_request_to_primary(client):
+    response = client.get("/items/1")
+    assert response.json() == {"name": "replica"}
+    assert PRIMARY_STICKY_COOKIE not in response.cookies
+
+    response = client.post("/items/2")
+    assert PRIMARY_STICKY_COOKIE in response.cookies
+
+    # 쿠키가 있는 다음 요청은 (다른 워커로 가더라도) 주 DB에서 읽는다
+    assert client.get("/items/1").json() == {"name": "primary"}
+
+    client.cookies.clear()
+    assert client.get("/items/1").json() == {"name": "replica"}
+
+
+def test_sticky_user_routes_next_request_to_primary(client):
+    client.post("/items/2", headers={"X-User-Id": "7"})
+    client.cookies.clear()
+
+    # 쿠키 없이도 같은 워커에서는 최근 쓰기를 한 사용자를 주 DB로 고정
+    assert client.get("/items/1", headers={"X-User-Id": "7"}).json() == {"name": "primary"}
+    assert client.get("/items/1", headers={"X-User-Id": "8"}).json() == {"name": "replica"}